@@ -0,0 +1,112 @@
+"""
+Backend Serial x Processos do DataAnalyzer
+
+Carrega o CSV sintético (gerador_dados.py), replica os registros até o
+tamanho pedido e mede cada agregação do DataAnalyzer com o backend
+serial e com o backend de processos, já com os dados cruzados e o pool
+aquecido. Cada análise é medida em um analisador novo, para que o cache
+de resultados não interfira.
+
+Uso:
+    python benchmarks/backend_paralelo.py --linhas 3000000 --processos 1 2 4
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from data_analyzer import DataAnalyzer
+from data_loader import DataLoader
+from gerador_dados import gerar_dados
+
+# (rótulo, método, argumentos)
+ANALISES = [
+    ('por_partido', 'analisar_por_partido', {}),
+    ('por_estado', 'analisar_por_estado', {}),
+    ('tipos_despesa', 'analisar_tipos_despesa', {}),
+    ('top_deputados', 'analisar_top_deputados', {}),
+]
+
+
+def preparar_dados(linhas: int, semente: int) -> tuple:
+    """
+    Gera (ou reaproveita) 200 mil registros sintéticos e os replica até `linhas`
+
+    Returns:
+        Tupla (despesas limpas, cadastro)
+    """
+    base = min(linhas, 200_000)
+    pasta = Path(__file__).resolve().parent / 'dados'
+    csv_despesas, csv_cadastro = gerar_dados(pasta, base, semente)
+    with contextlib.redirect_stdout(io.StringIO()):
+        loader = DataLoader(csv_despesas)
+        loader.carregar_csv()
+        df = loader.limpar_dados()
+    copias = -(-linhas // len(df))
+    df = pd.concat([df] * copias, ignore_index=True).iloc[:linhas]
+    return df, pd.read_csv(csv_cadastro)
+
+
+def medir(df: pd.DataFrame, cadastro: pd.DataFrame, metodo: str, argumentos: dict,
+          processos, repeticoes: int) -> float:
+    """Mediana do tempo de uma análise (s), com dados já cruzados"""
+    tempos = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer = DataAnalyzer(df, cadastro,
+                                backend='processos' if processos else 'serial',
+                                num_processos=processos)
+        analyzer.cruzar_dados()
+        if processos:
+            # Aquecer o pool: a criação dos processos não faz parte da análise
+            analyzer.filtrar(uf=['SP']).analisar_tipos_despesa()
+        for _ in range(repeticoes):
+            analyzer._cache.clear()
+            inicio = time.perf_counter()
+            getattr(analyzer, metodo)(**argumentos)
+            tempos.append(time.perf_counter() - inicio)
+        analyzer.encerrar()
+    return statistics.median(tempos)
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description='Backend serial x processos do DataAnalyzer')
+    parser.add_argument('--linhas', type=int, nargs='+', default=[3_000_000],
+                        help='Tamanhos avaliados (padrão: 3000000)')
+    parser.add_argument('--processos', type=int, nargs='+', default=[os.cpu_count() or 1],
+                        help='Números de processos avaliados (padrão: número de CPUs)')
+    parser.add_argument('--repeticoes', type=int, default=3,
+                        help='Repetições por medição (padrão: 3)')
+    parser.add_argument('--semente', type=int, default=42,
+                        help='Semente dos dados sintéticos (padrão: 42)')
+    args = parser.parse_args()
+
+    print(f"\n⏱️  Backend serial x processos ({os.cpu_count()} CPUs)\n")
+    linhas_tabela = []
+    for linhas in args.linhas:
+        df, cadastro = preparar_dados(linhas, args.semente)
+        for rotulo, metodo, argumentos in ANALISES:
+            linha = {'linhas': linhas, 'analise': rotulo,
+                     'serial_s': medir(df, cadastro, metodo, argumentos, None, args.repeticoes)}
+            for processos in args.processos:
+                linha[f'{processos}_proc_s'] = medir(df, cadastro, metodo, argumentos,
+                                                     processos, args.repeticoes)
+            linhas_tabela.append(linha)
+            print(f"   {linhas:,} registros, {rotulo}: ok")
+
+    print()
+    print(pd.DataFrame(linhas_tabela).round(3).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Qualidade da Correspondência Aproximada de Nomes
+
+Gera deputados e cadastros sintéticos com o gerador da suíte, em que a
+resposta certa é conhecida: o k-ésimo deputado em exercício é a k-ésima
+linha do cadastro (às vezes com outra grafia) e os ex-deputados não têm
+cadastro. Cruza um registro por deputado com o DataAnalyzer e conta os
+acertos, as atribuições erradas (falsos positivos) e as variações de
+grafia não resolvidas (falsos negativos) para cada limiar.
+
+Uso:
+    python benchmarks/correspondencia_nomes.py [--sementes 20] [--limiares 0.8 0.85 0.9]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from data_analyzer import DataAnalyzer
+from gerador_dados import gerar_cadastro, gerar_deputados
+
+
+def avaliar(semente: int, limiar: float, taxa_variacao: float) -> dict:
+    """
+    Cruza os deputados de uma semente e compara com a resposta conhecida
+
+    Args:
+        semente: Semente do gerador aleatório
+        limiar: Similaridade mínima da busca aproximada
+        taxa_variacao: Fração do cadastro com grafia diferente
+
+    Returns:
+        Dicionário com as contagens de variações, acertos, falsos positivos
+        e falsos negativos
+    """
+    rng = np.random.default_rng(semente)
+    deputados = gerar_deputados(rng)
+    cadastro = gerar_cadastro(rng, deputados, taxa_variacao)
+
+    nomes_despesa = deputados['nome'].map(DataAnalyzer._padronizar_nome)
+    nomes_cadastro = cadastro['nome'].map(DataAnalyzer._padronizar_nome)
+    # Resposta certa: nome do cadastro de cada deputado em exercício
+    esperado = dict(zip(nomes_despesa[deputados['em_exercicio']], nomes_cadastro))
+    variacoes = {nome for nome, cad in esperado.items() if nome != cad}
+
+    df_despesas = pd.DataFrame({
+        'nome_deputado': nomes_despesa,
+        'tipo_despesa': 'TESTE',
+        'valor': 1.0,
+    })
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer = DataAnalyzer(df_despesas, cadastro, limiar_similaridade=limiar)
+        analyzer.cruzar_dados()
+
+    aproximados = analyzer.relatorio_cruzamento.correspondencias_aproximadas
+    certos = [esperado.get(nome) == cad for nome, cad in
+              zip(aproximados['nome_deputado'], aproximados['nome_cadastro'])]
+    return {
+        'variacoes': len(variacoes),
+        'acertos': sum(certos),
+        'falsos_positivos': len(certos) - sum(certos),
+        'falsos_negativos': len(variacoes) - sum(certos),
+    }
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description='Qualidade da correspondência aproximada de nomes')
+    parser.add_argument('--sementes', type=int, default=20,
+                        help='Número de cadastros sintéticos avaliados (padrão: 20)')
+    parser.add_argument('--limiares', type=float, nargs='+', default=[0.8, 0.85, 0.9],
+                        help='Limiares de similaridade avaliados (padrão: 0.8 0.85 0.9)')
+    parser.add_argument('--taxa-variacao', type=float, default=0.02,
+                        help='Fração do cadastro com grafia diferente (padrão: 0.02)')
+    args = parser.parse_args()
+
+    print(f"\n🔍 Correspondência aproximada em {args.sementes} cadastros sintéticos\n")
+    linhas = []
+    for limiar in args.limiares:
+        totais = pd.DataFrame([avaliar(s, limiar, args.taxa_variacao)
+                               for s in range(args.sementes)]).sum()
+        linhas.append({'limiar': limiar, **totais.to_dict()})
+
+    resultado = pd.DataFrame(linhas)
+    print(resultado.to_string(index=False))
+
+    # Atribuir despesas ao deputado errado é o erro que não pode acontecer
+    if resultado['falsos_positivos'].any():
+        print("\n❌ Há nomes atribuídos ao deputado errado")
+        sys.exit(1)
+    print("\n✅ Nenhum nome atribuído ao deputado errado")
+
+
+if __name__ == '__main__':
+    main()
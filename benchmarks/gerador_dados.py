@@ -0,0 +1,344 @@
+"""
+Gerador de Dados Sintéticos da Cota Parlamentar
+
+Gera um CSV de despesas com o mesmo esquema dos arquivos Ano-AAAA.csv da
+Câmara (separador ';', decimal ',', acentos em Latin-1) e um CSV com o
+cadastro de deputados no formato da API, de forma determinística a partir
+de uma semente. Cardinalidades seguem as dos dados reais: ~513 deputados em
+exercício mais ex-deputados sem cadastro, ~20 tipos de despesa e dezenas de
+milhares de fornecedores. O arquivo é escrito em blocos, então tamanhos de
+100 mil a 20 milhões de linhas usam memória limitada.
+
+Uso:
+    python benchmarks/gerador_dados.py --linhas 1000000 --saida benchmarks/dados
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+# Colunas do arquivo da Câmara, na ordem original
+COLUNAS = [
+    'txNomeParlamentar', 'cpf', 'ideCadastro', 'nuCarteiraParlamentar', 'nuLegislatura',
+    'sgUF', 'sgPartido', 'codLegislatura', 'numSubCota', 'txtDescricao',
+    'numEspecificacaoSubCota', 'txtDescricaoEspecificacao', 'txtFornecedor', 'txtCNPJCPF',
+    'txtNumero', 'indTipoDocumento', 'datEmissao', 'vlrDocumento', 'vlrGlosa', 'vlrLiquido',
+    'numMes', 'numAno', 'numParcela', 'txtPassageiro', 'txtTrecho', 'numLote',
+    'numRessarcimento', 'datPagamentoRestituicao', 'vlrRestituicao', 'nuDeputadoId',
+    'ideDocumento', 'urlDocumento',
+]
+
+# (numSubCota, txtDescricao, peso na quantidade de registros, valor médio em R$)
+TIPOS_DESPESA = [
+    (1, 'MANUTENÇÃO DE ESCRITÓRIO DE APOIO À ATIVIDADE PARLAMENTAR', 8, 1_200),
+    (3, 'COMBUSTÍVEIS E LUBRIFICANTES.', 30, 250),
+    (4, 'CONSULTORIAS, PESQUISAS E TRABALHOS TÉCNICOS.', 2, 9_000),
+    (5, 'DIVULGAÇÃO DA ATIVIDADE PARLAMENTAR.', 6, 7_500),
+    (8, 'SERVIÇO DE SEGURANÇA PRESTADO POR EMPRESA ESPECIALIZADA.', 1, 3_000),
+    (9, 'PASSAGEM AÉREA - REEMBOLSO', 2, 1_500),
+    (10, 'TELEFONIA', 9, 180),
+    (11, 'SERVIÇOS POSTAIS', 2, 300),
+    (12, 'ASSINATURA DE PUBLICAÇÕES', 1, 250),
+    (13, 'FORNECIMENTO DE ALIMENTAÇÃO DO PARLAMENTAR', 12, 90),
+    (14, 'HOSPEDAGEM ,EXCETO DO PARLAMENTAR NO DISTRITO FEDERAL.', 3, 600),
+    (119, 'LOCAÇÃO OU FRETAMENTO DE AERONAVES', 0.3, 18_000),
+    (120, 'LOCAÇÃO OU FRETAMENTO DE VEÍCULOS AUTOMOTORES', 4, 5_000),
+    (121, 'LOCAÇÃO OU FRETAMENTO DE EMBARCAÇÕES', 0.1, 4_000),
+    (122, 'SERVIÇO DE TÁXI, PEDÁGIO E ESTACIONAMENTO', 6, 60),
+    (123, 'PASSAGENS TERRESTRES, MARÍTIMAS OU FLUVIAIS', 0.5, 150),
+    (137, 'PARTICIPAÇÃO EM CURSO, PALESTRA OU EVENTO SIMILAR', 0.2, 800),
+    (998, 'PASSAGEM AÉREA - RPA', 3, 1_400),
+    (999, 'PASSAGEM AÉREA - SIGEPA', 10, 1_300),
+]
+
+PRENOMES = [
+    'José', 'João', 'Antônio', 'Francisco', 'Luiz', 'Sebastião', 'Márcio', 'Rogério',
+    'Fábio', 'Sérgio', 'Célio', 'Otávio', 'Átila', 'Inácio', 'Maria', 'Ana', 'Conceição',
+    'Fátima', 'Lúcia', 'Mônica', 'Patrícia', 'Vânia', 'Cláudia', 'Débora', 'Érika',
+    'Tânia', 'Gláucia', 'Zé', 'Chico', 'Tião', 'Benedita', 'Raimundo', 'Geraldo', 'Jéssica',
+]
+
+SOBRENOMES = [
+    'Silva', 'Santos', 'Oliveira', 'Souza', 'Conceição', 'Araújo', 'Gonçalves', 'Mendonça',
+    'Magalhães', 'Frazão', 'Brandão', 'Simões', 'Guimarães', 'Assunção', 'Falcão', 'Leão',
+    'Barbosa', 'Damásio', 'Cortês', 'Lúcio', 'Câmara', 'Gusmão', 'Romão', 'Sampaio',
+    'Ribeiro', 'Peçanha', 'Tavares', 'Bezerra', 'Teixeira', 'Moraes', 'Aragão', 'Estêvão',
+]
+
+PARTIDOS = ['PL', 'PT', 'UNIÃO', 'PP', 'MDB', 'PSD', 'REPUBLICANOS', 'PDT', 'PSB', 'PSDB',
+            'PODE', 'PSOL', 'AVANTE', 'PCdoB', 'SOLIDARIEDADE', 'CIDADANIA', 'PV', 'NOVO',
+            'PRD', 'REDE']
+
+# Deputados por UF (composição real da Câmara)
+CADEIRAS_UF = {
+    'SP': 70, 'MG': 53, 'RJ': 46, 'BA': 39, 'RS': 31, 'PR': 30, 'PE': 25, 'CE': 22,
+    'MA': 18, 'GO': 17, 'PA': 17, 'SC': 16, 'PB': 12, 'ES': 10, 'PI': 10, 'AL': 9,
+    'AC': 8, 'AM': 8, 'AP': 8, 'DF': 8, 'MS': 8, 'MT': 8, 'RN': 8, 'RO': 8, 'RR': 8,
+    'SE': 8, 'TO': 8,
+}
+
+ATIVIDADES = ['AUTO POSTO', 'COMERCIAL', 'SERVIÇOS', 'GRÁFICA E EDITORA', 'RESTAURANTE',
+              'LOCADORA DE VEÍCULOS', 'TELECOMUNICAÇÕES', 'HOTEL', 'CONSULTORIA',
+              'COMUNICAÇÃO', 'TÁXI AÉREO', 'PAPELARIA']
+
+
+def gerar_deputados(rng: np.random.Generator, num_ex_deputados: int = 80) -> pd.DataFrame:
+    """
+    Gera os parlamentares: em exercício (com cadastro) e ex-deputados (sem)
+
+    Args:
+        rng: Gerador aleatório
+        num_ex_deputados: Parlamentares que aparecem nas despesas sem cadastro na API
+
+    Returns:
+        DataFrame com nome, siglaPartido, siglaUf, nuDeputadoId, cpf, em_exercicio
+    """
+    ufs = np.repeat(list(CADEIRAS_UF), list(CADEIRAS_UF.values()))
+    total = len(ufs) + num_ex_deputados
+
+    nomes = set()
+    while len(nomes) < total:
+        partes = [rng.choice(PRENOMES)] + list(rng.choice(SOBRENOMES, rng.integers(1, 3),
+                                                          replace=False))
+        nomes.add(' '.join(partes))
+    nomes = sorted(nomes)
+    rng.shuffle(nomes)
+
+    pesos_partido = np.linspace(2.0, 0.2, len(PARTIDOS))
+    return pd.DataFrame({
+        'nome': nomes,
+        'siglaPartido': rng.choice(PARTIDOS, total, p=pesos_partido / pesos_partido.sum()),
+        'siglaUf': np.concatenate([ufs, rng.choice(list(CADEIRAS_UF), num_ex_deputados)]),
+        'nuDeputadoId': rng.choice(np.arange(66_000, 230_000), total, replace=False),
+        'cpf': rng.integers(10**9, 10**11, total).astype(str),
+        'em_exercicio': np.arange(total) < len(ufs),
+    })
+
+
+def gerar_cadastro(rng: np.random.Generator, deputados: pd.DataFrame,
+                   taxa_variacao: float = 0.02) -> pd.DataFrame:
+    """
+    Gera o cadastro da API: deputados em exercício, alguns com outra grafia
+
+    A variação troca as duas últimas letras do nome, como um erro de
+    digitação; a k-ésima linha do cadastro é o k-ésimo deputado em exercício.
+
+    Args:
+        rng: Gerador aleatório
+        deputados: Parlamentares (ver gerar_deputados)
+        taxa_variacao: Fração do cadastro com grafia diferente das despesas
+
+    Returns:
+        DataFrame com nome, siglaPartido e siglaUf
+    """
+    cadastro = deputados[deputados['em_exercicio']][['nome', 'siglaPartido', 'siglaUf']].copy()
+    variar = rng.random(len(cadastro)) < taxa_variacao
+    cadastro.loc[variar, 'nome'] = cadastro.loc[variar, 'nome'].str.replace(
+        r'(\w)(\w)$', r'\2\1', regex=True
+    )
+    return cadastro
+
+
+def gerar_fornecedores(rng: np.random.Generator, num_fornecedores: int) -> pd.DataFrame:
+    """
+    Gera fornecedores com CNPJ (14 dígitos) ou CPF (11 dígitos)
+
+    Args:
+        rng: Gerador aleatório
+        num_fornecedores: Número de fornecedores distintos
+
+    Returns:
+        DataFrame com txtFornecedor e txtCNPJCPF
+    """
+    pessoa_fisica = rng.random(num_fornecedores) < 0.1
+    cnpj = pd.Series(rng.integers(10**12, 10**14, num_fornecedores)).astype(str).str.zfill(14)
+    cpf = pd.Series(rng.integers(10**9, 10**11, num_fornecedores)).astype(str).str.zfill(11)
+    atividades = rng.choice(ATIVIDADES, num_fornecedores)
+    sobrenomes = rng.choice(SOBRENOMES, num_fornecedores)
+    nomes = pd.Series(atividades).str.cat(pd.Series(sobrenomes), sep=' ')
+    nomes = nomes.str.cat(pd.Series(np.arange(num_fornecedores)).astype(str), sep=' LTDA ')
+    return pd.DataFrame({
+        'txtFornecedor': np.where(pessoa_fisica, pd.Series(sobrenomes).str.upper(), nomes),
+        'txtCNPJCPF': np.where(pessoa_fisica, cpf, cnpj),
+    })
+
+
+def formatar_valores(valores: np.ndarray) -> np.ndarray:
+    """
+    Formata valores monetários com vírgula decimal ("1234,56")
+
+    Mais rápido que deixar o to_csv formatar floats com decimal=','.
+
+    Args:
+        valores: Valores em reais, com até duas casas
+
+    Returns:
+        Array de strings
+    """
+    centavos = np.round(np.abs(valores) * 100).astype(np.int64)
+    texto = np.char.add(np.char.add((centavos // 100).astype(str), ','),
+                        np.char.zfill((centavos % 100).astype(str), 2))
+    return np.where(valores < 0, np.char.add('-', texto), texto)
+
+
+def gerar_bloco(rng: np.random.Generator, n: int, deputados: pd.DataFrame,
+                fornecedores: pd.DataFrame, pesos_deputado: np.ndarray, ano: int,
+                inicio_documento: int) -> pd.DataFrame:
+    """
+    Gera um bloco de registros de despesas
+
+    Args:
+        rng: Gerador aleatório
+        n: Número de registros do bloco
+        deputados: Parlamentares (ver gerar_deputados)
+        fornecedores: Fornecedores (ver gerar_fornecedores)
+        pesos_deputado: Probabilidade de cada parlamentar gerar um registro
+        ano: Ano das despesas
+        inicio_documento: Primeiro ideDocumento do bloco
+
+    Returns:
+        DataFrame com as colunas de COLUNAS
+    """
+    pesos_tipo = np.array([t[2] for t in TIPOS_DESPESA], dtype=float)
+    tipo = rng.choice(len(TIPOS_DESPESA), n, p=pesos_tipo / pesos_tipo.sum())
+    sub_cotas = np.array([t[0] for t in TIPOS_DESPESA])
+    descricoes = np.array([t[1] for t in TIPOS_DESPESA], dtype=object)
+    medias = np.array([t[3] for t in TIPOS_DESPESA], dtype=float)
+
+    dep = rng.choice(len(deputados), n, p=pesos_deputado)
+    nomes_csv = deputados['nome'].str.upper().to_numpy(dtype=object)
+
+    # Poucos fornecedores concentram a maior parte das notas
+    posicao = np.minimum(rng.zipf(1.3, n) - 1, len(fornecedores) - 1)
+    nomes_fornecedor = fornecedores['txtFornecedor'].to_numpy(dtype=object)
+    documentos_fornecedor = fornecedores['txtCNPJCPF'].to_numpy(dtype=object)
+
+    valor = np.round(rng.gamma(1.5, medias[tipo] / 1.5), 2)
+    glosa = np.where(rng.random(n) < 0.03, np.round(valor * rng.random(n) * 0.3, 2), 0.0)
+    liquido = np.round(valor - glosa, 2)
+    # Bilhetes compensados: valores negativos, descartados na limpeza
+    liquido = np.where(rng.random(n) < 0.01, -liquido, liquido)
+
+    dia_do_ano = rng.integers(0, 365, n)
+    dias = pd.date_range(f'{ano}-01-01', periods=365, freq='D')
+    datas_texto = np.asarray(dias.strftime('%Y-%m-%dT00:00:00'), dtype=object)
+    meses = dias.month.to_numpy()
+
+    bloco = pd.DataFrame({
+        'txNomeParlamentar': nomes_csv[dep],
+        'cpf': deputados['cpf'].to_numpy(dtype=object)[dep],
+        'ideCadastro': deputados['nuDeputadoId'].to_numpy()[dep],
+        'nuCarteiraParlamentar': deputados['nuDeputadoId'].to_numpy()[dep] % 1000,
+        'nuLegislatura': 2023,
+        'sgUF': deputados['siglaUf'].to_numpy(dtype=object)[dep],
+        'sgPartido': deputados['siglaPartido'].to_numpy(dtype=object)[dep],
+        'codLegislatura': 57,
+        'numSubCota': sub_cotas[tipo],
+        'txtDescricao': descricoes[tipo],
+        'numEspecificacaoSubCota': 0,
+        'txtDescricaoEspecificacao': '',
+        'txtFornecedor': nomes_fornecedor[posicao],
+        'txtCNPJCPF': documentos_fornecedor[posicao],
+        'txtNumero': rng.integers(1, 999_999, n).astype(str),
+        'indTipoDocumento': rng.choice([0, 1, 4], n, p=[0.7, 0.2, 0.1]),
+        'datEmissao': datas_texto[dia_do_ano],
+        'vlrDocumento': formatar_valores(valor),
+        'vlrGlosa': formatar_valores(glosa),
+        'vlrLiquido': formatar_valores(liquido),
+        'numMes': meses[dia_do_ano],
+        'numAno': ano,
+        'numParcela': 0,
+        'txtPassageiro': '',
+        'txtTrecho': '',
+        'numLote': rng.integers(1_800_000, 2_000_000, n),
+        'numRessarcimento': '',
+        'datPagamentoRestituicao': '',
+        'vlrRestituicao': '',
+        'nuDeputadoId': deputados['nuDeputadoId'].to_numpy()[dep],
+        'ideDocumento': np.arange(inicio_documento, inicio_documento + n),
+        'urlDocumento': '',
+    })
+
+    # ~0,5% dos registros repetem outro registro do bloco (removidos na limpeza)
+    indices = np.arange(n)
+    repetidos = rng.random(n) < 0.005
+    indices[repetidos] = rng.integers(0, n, repetidos.sum())
+    return bloco.iloc[indices][COLUNAS]
+
+
+def gerar_dados(pasta: str, linhas: int, semente: int = 42, ano: int = 2023,
+                encoding: str = 'latin1', tamanho_bloco: int = 500_000) -> tuple:
+    """
+    Gera o CSV de despesas e o cadastro de deputados
+
+    Os arquivos são reaproveitados se já existirem com os mesmos parâmetros.
+
+    Args:
+        pasta: Diretório de saída
+        linhas: Número de registros de despesas
+        semente: Semente do gerador aleatório
+        ano: Ano das despesas
+        encoding: Codificação do CSV de despesas
+        tamanho_bloco: Registros gerados e gravados por vez
+
+    Returns:
+        Tupla (caminho do CSV de despesas, caminho do CSV de cadastro)
+    """
+    pasta = Path(pasta)
+    pasta.mkdir(parents=True, exist_ok=True)
+    arquivo_despesas = pasta / f'Ano-{ano}-sintetico-{linhas}-s{semente}.csv'
+    arquivo_cadastro = pasta / f'deputados-s{semente}.csv'
+
+    rng = np.random.default_rng(semente)
+    deputados = gerar_deputados(rng)
+    fornecedores = gerar_fornecedores(rng, num_fornecedores=max(1_000, min(60_000, linhas // 50)))
+
+    cadastro = gerar_cadastro(rng, deputados)
+    if not arquivo_cadastro.exists():
+        cadastro.to_csv(arquivo_cadastro, index=False, encoding='utf-8')
+
+    if arquivo_despesas.exists():
+        print(f"♻️  Dados sintéticos já gerados: {arquivo_despesas}")
+        return arquivo_despesas, arquivo_cadastro
+
+    print(f"🧪 Gerando {linhas:,} registros sintéticos em {arquivo_despesas}...")
+    inicio = time.perf_counter()
+    pesos = rng.gamma(2.0, 1.0, len(deputados))
+    pesos /= pesos.sum()
+
+    temporario = arquivo_despesas.with_name(arquivo_despesas.name + '.tmp')
+    with open(temporario, 'w', encoding=encoding, newline='') as f:
+        for inicio_bloco in range(0, linhas, tamanho_bloco):
+            n = min(tamanho_bloco, linhas - inicio_bloco)
+            bloco = gerar_bloco(rng, n, deputados, fornecedores, pesos, ano,
+                                inicio_documento=7_000_000 + inicio_bloco)
+            bloco.to_csv(f, sep=';', index=False, header=inicio_bloco == 0)
+    temporario.replace(arquivo_despesas)
+
+    tamanho = arquivo_despesas.stat().st_size / 1024 / 1024
+    print(f"✅ {linhas:,} registros ({tamanho:,.1f} MB) em {time.perf_counter() - inicio:.1f} s")
+    return arquivo_despesas, arquivo_cadastro
+
+
+def main():
+    """Função principal do gerador"""
+    parser = argparse.ArgumentParser(description='Gera dados sintéticos da cota parlamentar')
+    parser.add_argument('--linhas', type=int, default=100_000,
+                        help='Número de registros de despesas (padrão: 100000)')
+    parser.add_argument('--saida', default=str(Path(__file__).parent / 'dados'),
+                        help='Diretório de saída (padrão: benchmarks/dados)')
+    parser.add_argument('--semente', type=int, default=42,
+                        help='Semente do gerador aleatório (padrão: 42)')
+    parser.add_argument('--encoding', default='latin1',
+                        help='Codificação do CSV de despesas (padrão: latin1)')
+    args = parser.parse_args()
+
+    gerar_dados(args.saida, args.linhas, semente=args.semente, encoding=args.encoding)
+
+
+if __name__ == '__main__':
+    main()
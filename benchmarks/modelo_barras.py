@@ -0,0 +1,67 @@
+"""
+Benchmark de Gráficos Repetidos com Modelo
+
+Gera o gráfico de top deputados uma vez por UF de duas formas: criando
+uma figura nova a cada gráfico (`plot_top_deputados`) e reaproveitando
+a mesma figura com `ModeloGraficoBarras`, atualizando apenas os dados.
+
+Uso:
+    python benchmarks/modelo_barras.py [--perfil rascunho] [--grupos 27] [--top-n 15]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from rotulos_barras import gerar_agregados
+from visualizer import Visualizer
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark de gráficos repetidos com modelo')
+    parser.add_argument('--perfil', default='rascunho', choices=list(Visualizer.PERFIS),
+                        help='Perfil de renderização (padrão: rascunho)')
+    parser.add_argument('--grupos', type=int, default=27,
+                        help='Número de gráficos gerados (padrão: 27, um por UF)')
+    parser.add_argument('--top-n', type=int, default=15,
+                        help='Barras por gráfico (padrão: 15)')
+    args = parser.parse_args()
+
+    grupos = [gerar_agregados(args.top_n, seed=i)['top_deputados'] for i in range(args.grupos)]
+
+    with tempfile.TemporaryDirectory() as pasta:
+        visualizer = Visualizer(output_dir=pasta, perfil=args.perfil, usar_cache=False)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            inicio = time.perf_counter()
+            for df in grupos:
+                visualizer.plot_top_deputados(df, top_n=args.top_n)
+            tempo_figuras = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            modelo = visualizer.modelo_barras(args.top_n, 'Total Gasto (Mil R$)', altura_base=10)
+            for i, df in enumerate(grupos):
+                rotulos = df['nome_deputado'] + '\n(' + df['partido'] + '-' + df['uf'] + ')'
+                modelo.renderizar(rotulos, df['total_gasto'],
+                                  f'Top {args.top_n} Deputados - Grupo {i}', f'grupo_{i:02d}.png')
+            modelo.fechar()
+            tempo_modelo = time.perf_counter() - inicio
+
+    print(f"\n⏱️  {args.grupos} gráficos com {args.top_n} barras (perfil {args.perfil})")
+    print(f"   Figura nova por gráfico: {tempo_figuras:6.2f} s "
+          f"({tempo_figuras / args.grupos * 1000:.0f} ms/gráfico)")
+    print(f"   Modelo reaproveitado:    {tempo_modelo:6.2f} s "
+          f"({tempo_modelo / args.grupos * 1000:.0f} ms/gráfico)")
+    print(f"   Ganho: {tempo_figuras / tempo_modelo:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark de Gráficos com Muitas Barras
+
+Renderiza os gráficos de barras do Visualizer com top_n crescente (até
+centenas de barras) e verifica que o tempo de renderização continua
+limitado. Termina com código 1 se algum gráfico exceder o limite.
+
+Uso:
+    python benchmarks/rotulos_barras.py [--perfil impressao] [--limite 15]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from visualizer import Visualizer
+
+
+def gerar_agregados(n: int, seed: int = 0) -> dict:
+    """
+    Gera tabelas agregadas sintéticas com n categorias
+
+    Args:
+        n: Número de linhas de cada tabela
+        seed: Semente do gerador aleatório
+
+    Returns:
+        Dicionário no formato do relatório do DataAnalyzer
+    """
+    rng = np.random.default_rng(seed)
+    total = np.sort(rng.gamma(2.0, 150_000.0, n))[::-1]
+    deputados = pd.DataFrame({
+        'nome_deputado': [f"DEPUTADO SINTETICO {i:04d}" for i in range(n)],
+        'partido': rng.choice(['PT', 'PL', 'PP', 'PSD', 'MDB'], n),
+        'uf': rng.choice(['SP', 'RJ', 'MG', 'BA', 'RS'], n),
+        'total_gasto': total.round(2),
+        'num_registros': rng.integers(10, 500, n),
+    })
+    tipos = pd.DataFrame({
+        'tipo_despesa': [f"TIPO DE DESPESA SINTETICO {i:04d}" for i in range(n)],
+        'total_gasto': (total * 40).round(2),
+        'gasto_medio': (total / 100).round(2),
+        'num_registros': rng.integers(100, 5000, n),
+    })
+    tipos['percentual'] = (tipos['total_gasto'] / tipos['total_gasto'].sum() * 100).round(2)
+    return {'top_deputados': deputados, 'por_tipo_despesa': tipos}
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark de gráficos com muitas barras')
+    parser.add_argument('--perfil', default='impressao', choices=list(Visualizer.PERFIS),
+                        help='Perfil de renderização (padrão: impressao)')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[15, 100, 300, 600],
+                        help='Valores de top_n a medir (padrão: 15 100 300 600)')
+    parser.add_argument('--limite', type=float, default=15.0,
+                        help='Tempo máximo aceito por gráfico, em segundos (padrão: 15)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        visualizer = Visualizer(output_dir=pasta, perfil=args.perfil, usar_cache=False)
+
+        print(f"\n⏱️  Renderização com muitas barras (perfil {args.perfil})")
+        print(f"   {'top_n':>6} {'deputados (s)':>15} {'despesas (s)':>15}")
+
+        excedeu = False
+        for n in args.tamanhos:
+            relatorio = gerar_agregados(n)
+            tempos = []
+            for metodo, chave in [('plot_top_deputados', 'top_deputados'),
+                                  ('plot_tipos_despesa', 'por_tipo_despesa')]:
+                inicio = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    getattr(visualizer, metodo)(relatorio[chave], top_n=n)
+                tempos.append(time.perf_counter() - inicio)
+            excedeu = excedeu or max(tempos) > args.limite
+            print(f"   {n:>6} {tempos[0]:>15.2f} {tempos[1]:>15.2f}")
+
+    if excedeu:
+        print(f"\n❌ Algum gráfico excedeu o limite de {args.limite:.1f} s")
+        sys.exit(1)
+    print(f"\n✅ Todos os gráficos abaixo de {args.limite:.1f} s")
+
+
+if __name__ == '__main__':
+    main()
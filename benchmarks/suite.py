@@ -0,0 +1,191 @@
+"""
+Suíte de Benchmarks do Pipeline
+
+Gera (ou reaproveita) dados sintéticos com o esquema da Câmara e mede as
+etapas principais: DataLoader, DataAnalyzer, Visualizer e a geração da
+apresentação. Tempo, CPU e pico de memória vêm do profiler do projeto. O
+resultado é gravado em benchmarks/resultados/<commit>-<linhas>.json e
+comparado com a medição mais recente de outro commit com o mesmo tamanho.
+
+Uso:
+    python benchmarks/suite.py --linhas 1000000 [--repeticoes 3] [--processos 4]
+    python benchmarks/suite.py --linhas 100000 --comparar abc1234
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import profiler
+from data_analyzer import DataAnalyzer
+from data_loader import DataLoader
+from gerador_dados import gerar_dados
+
+PASTA_RESULTADOS = Path(__file__).resolve().parent / 'resultados'
+
+ETAPAS = ['carregar_csv', 'analisar', 'graficos', 'apresentacao']
+
+
+def commit_atual() -> tuple:
+    """Retorna (hash curto do commit, se há alterações não commitadas)"""
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=RAIZ, capture_output=True,
+                              text=True).stdout.strip()
+    return git('rev-parse', '--short', 'HEAD') or 'desconhecido', bool(git('status', '--porcelain', 'src'))
+
+
+def executar_rodada(csv_despesas: Path, csv_cadastro: Path, args) -> dict:
+    """
+    Executa uma rodada completa das etapas medidas
+
+    Args:
+        csv_despesas: CSV sintético de despesas
+        csv_cadastro: CSV sintético do cadastro de deputados
+        args: Argumentos da linha de comando
+
+    Returns:
+        Dicionário {etapa: registro do profiler}
+    """
+    medidor = profiler.ativar()
+    saida = None if args.verboso else io.StringIO()
+    try:
+        with tempfile.TemporaryDirectory() as pasta, \
+                contextlib.redirect_stdout(saida or sys.stdout):
+            with profiler.medir('etapa', 'carregar_csv'):
+                loader = DataLoader(csv_despesas)
+                loader.carregar_csv()
+                df_despesas = loader.limpar_dados()
+
+            df_deputados = pd.read_csv(csv_cadastro)
+            with profiler.medir('etapa', 'analisar'):
+                analyzer = DataAnalyzer(
+                    df_despesas, df_deputados,
+                    backend='processos' if args.processos else 'serial',
+                    num_processos=args.processos
+                )
+                relatorio = analyzer.gerar_relatorio_completo()
+                analyzer.encerrar()
+
+            if 'graficos' in args.etapas:
+                from visualizer import Visualizer
+
+                with profiler.medir('etapa', 'graficos'):
+                    visualizer = Visualizer(output_dir=pasta, perfil=args.perfil, usar_cache=False)
+                    visualizer.gerar_todos_graficos(relatorio)
+
+            if 'apresentacao' in args.etapas:
+                from gerar_apresentacao_completa import ApresentacaoAnalise
+
+                with profiler.medir('etapa', 'apresentacao'):
+                    ApresentacaoAnalise(pasta, relatorio=relatorio).gerar()
+    finally:
+        profiler.desativar()
+
+    return {r['nome']: r for r in medidor.registros if r['categoria'] == 'etapa'}
+
+
+def resultado_anterior(commit: str, linhas: int, comparar: str = None):
+    """Medição de outro commit com o mesmo número de linhas (a mais recente, se não indicado)"""
+    if comparar:
+        arquivo = PASTA_RESULTADOS / f'{comparar}-{linhas}.json'
+        return json.loads(arquivo.read_text(encoding='utf-8')) if arquivo.exists() else None
+
+    candidatos = [
+        json.loads(a.read_text(encoding='utf-8'))
+        for a in PASTA_RESULTADOS.glob(f'*-{linhas}.json')
+        if not a.name.startswith(f'{commit}-')
+    ]
+    return max(candidatos, key=lambda r: r['data'], default=None)
+
+
+def main():
+    """Função principal da suíte"""
+    parser = argparse.ArgumentParser(description='Suíte de benchmarks do pipeline')
+    parser.add_argument('--linhas', type=int, default=100_000,
+                        help='Registros do CSV sintético (padrão: 100000)')
+    parser.add_argument('--semente', type=int, default=42,
+                        help='Semente dos dados sintéticos (padrão: 42)')
+    parser.add_argument('--repeticoes', '-n', type=int, default=1,
+                        help='Rodadas medidas; reporta a mediana (padrão: 1)')
+    parser.add_argument('--processos', '-p', type=int, default=None,
+                        help='Usa o backend paralelo do DataAnalyzer com N processos')
+    parser.add_argument('--perfil', default='rascunho',
+                        choices=['rascunho', 'impressao', 'vetorial'],
+                        help='Perfil de renderização dos gráficos (padrão: rascunho)')
+    parser.add_argument('--etapas', nargs='+', default=ETAPAS, choices=ETAPAS,
+                        help='Etapas medidas (carregamento e análise sempre rodam)')
+    parser.add_argument('--dados', default=str(Path(__file__).resolve().parent / 'dados'),
+                        help='Pasta dos dados sintéticos (padrão: benchmarks/dados)')
+    parser.add_argument('--comparar', metavar='COMMIT',
+                        help='Commit de referência (padrão: medição mais recente de outro commit)')
+    parser.add_argument('--verboso', action='store_true',
+                        help='Exibe a saída das etapas')
+    args = parser.parse_args()
+
+    csv_despesas, csv_cadastro = gerar_dados(args.dados, args.linhas, semente=args.semente)
+
+    rodadas = []
+    for i in range(args.repeticoes):
+        print(f"\n⏱️  Rodada {i + 1}/{args.repeticoes}...")
+        rodadas.append(executar_rodada(csv_despesas, csv_cadastro, args))
+
+    commit, alterado = commit_atual()
+    etapas = {}
+    for nome in ETAPAS:
+        medicoes = [r[nome] for r in rodadas if nome in r]
+        if medicoes:
+            etapas[nome] = {
+                'duracao_s': round(statistics.median(m['duracao_s'] for m in medicoes), 4),
+                'cpu_s': round(statistics.median(m['cpu_s'] for m in medicoes), 4),
+                'pico_rss_mb': max((m['pico_rss_mb'] or 0) for m in medicoes) or None,
+            }
+
+    resultado = {
+        'commit': commit,
+        'alteracoes_locais': alterado,
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'linhas': args.linhas,
+        'semente': args.semente,
+        'repeticoes': args.repeticoes,
+        'processos': args.processos,
+        'perfil': args.perfil,
+        'etapas': etapas,
+    }
+
+    anterior = resultado_anterior(commit, args.linhas, args.comparar)
+
+    print(f"\n📊 Benchmark: {args.linhas:,} linhas | commit {commit}"
+          f"{' (com alterações locais)' if alterado else ''}")
+    if anterior:
+        print(f"   Comparado com: {anterior['commit']} ({anterior['data']})")
+    print(f"\n   {'Etapa':<14} {'Tempo (s)':>10} {'CPU (s)':>9} {'Pico RSS (MB)':>14} {'Variação':>10}")
+    for nome, medicao in etapas.items():
+        variacao = ''
+        if anterior and nome in anterior['etapas']:
+            base = anterior['etapas'][nome]['duracao_s']
+            variacao = f"{(medicao['duracao_s'] / base - 1) * 100:+.1f}%" if base else ''
+        pico = medicao['pico_rss_mb']
+        print(f"   {nome:<14} {medicao['duracao_s']:>10.2f} {medicao['cpu_s']:>9.2f} "
+              f"{'-' if pico is None else f'{pico:.1f}':>14} {variacao:>10}")
+
+    PASTA_RESULTADOS.mkdir(exist_ok=True)
+    arquivo = PASTA_RESULTADOS / f'{commit}-{args.linhas}.json'
+    arquivo.write_text(json.dumps(resultado, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"\n✅ Resultado salvo: {arquivo}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark de Tempo de Importação
+
+Mede o custo de inicialização do `main.py` com `python -X importtime`,
+importando o módulo em um interpretador novo várias vezes e reportando a
+mediana do tempo total e os pacotes de terceiros mais caros.
+
+Uso:
+    python benchmarks/tempo_importacao.py [--repeticoes N] [--modulo main]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+# Linhas do importtime: "import time: self [us] | cumulative | imported package"
+PADRAO_LINHA = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| *(\S+)')
+
+
+def medir_importacao(modulo: str) -> tuple:
+    """
+    Importa o módulo em um interpretador novo e coleta os tempos
+
+    Args:
+        modulo: Nome do módulo em src/ a importar
+
+    Returns:
+        Tupla (tempo total do módulo em ms, {pacote: tempo cumulativo em ms})
+    """
+    resultado = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+
+    total = 0.0
+    pacotes = {}
+    for linha in resultado.stderr.splitlines():
+        correspondencia = PADRAO_LINHA.match(linha)
+        if not correspondencia:
+            continue
+        nome = correspondencia.group(3)
+        cumulativo = int(correspondencia.group(2)) / 1000
+        if nome == modulo:
+            total = cumulativo
+        elif '.' not in nome and nome not in pacotes:
+            # Cada pacote é importado uma única vez: custo da primeira carga
+            pacotes[nome] = cumulativo
+    return total, pacotes
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark de tempo de importação')
+    parser.add_argument('--repeticoes', '-n', type=int, default=5,
+                        help='Número de interpretadores a medir (padrão: 5)')
+    parser.add_argument('--modulo', default='main',
+                        help='Módulo de src/ a importar (padrão: main)')
+    parser.add_argument('--top', type=int, default=12,
+                        help='Número de pacotes a listar (padrão: 12)')
+    args = parser.parse_args()
+
+    totais = []
+    por_pacote = defaultdict(list)
+    for _ in range(args.repeticoes):
+        total, tempos = medir_importacao(args.modulo)
+        totais.append(total)
+        for pacote, tempo in tempos.items():
+            por_pacote[pacote].append(tempo)
+
+    print(f"\n⏱️  Importação de '{args.modulo}' ({args.repeticoes} repetições)")
+    print(f"   Mediana do tempo total: {statistics.median(totais):,.1f} ms")
+    print(f"   Mínimo: {min(totais):,.1f} ms | Máximo: {max(totais):,.1f} ms")
+
+    print("\n📦 Pacotes mais caros (mediana do tempo cumulativo, ms):")
+    medianas = {pacote: statistics.median(t) for pacote, t in por_pacote.items()}
+    for pacote, tempo in sorted(medianas.items(), key=lambda x: -x[1])[:args.top]:
+        print(f"   {pacote:<30} {tempo:>10,.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,33 +5,178 @@ Este módulo realiza o cruzamento entre os dados de despesas (CSV)
 e os dados cadastrais dos deputados (API), gerando análises agregadas.
 """
 
+import copy
+import functools
+import inspect
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import Optional
 from unidecode import unidecode
 
+from data_loader import DataLoader
+from name_matcher import NameMatcher
+from parallel_analyzer import ExecutorParalelo
+from profiler import instrumentar
 
+
+@dataclass
+class RelatorioCruzamento:
+    """Resultado do cruzamento entre despesas e cadastro dos deputados"""
+    
+    total_registros: int
+    identificados: int
+    nomes_nao_identificados: pd.DataFrame = field(repr=False)
+    mascara_identificados: np.ndarray = field(repr=False)
+    correspondencias_aproximadas: pd.DataFrame = field(repr=False)
+    
+    @property
+    def nao_identificados(self) -> int:
+        """Número de registros sem correspondência no cadastro"""
+        return self.total_registros - self.identificados
+    
+    @property
+    def taxa_identificacao(self) -> float:
+        """Percentual de registros identificados"""
+        if self.total_registros == 0:
+            return 0.0
+        return (self.identificados / self.total_registros) * 100
+    
+    def exibir(self, max_nomes: int = 10) -> None:
+        """
+        Exibe o relatório do cruzamento no console
+        
+        Args:
+            max_nomes: Número máximo de nomes não identificados a listar
+        """
+        print(f"✅ Cruzamento concluído!")
+        print(f"   Total de registros: {self.total_registros:,}")
+        print(f"   Identificados: {self.identificados:,} ({self.taxa_identificacao:.1f}%)")
+        print(f"   Não identificados: {self.nao_identificados:,} ({100-self.taxa_identificacao:.1f}%)")
+        
+        aproximados = self.correspondencias_aproximadas
+        if len(aproximados) > 0:
+            print(f"\n🔍 Nomes resolvidos por similaridade: {len(aproximados)}")
+            for _, row in aproximados.head(max_nomes).iterrows():
+                print(f"      - {row['nome_deputado']} → {row['nome_cadastro']} "
+                      f"({row['similaridade']:.2f})")
+            if len(aproximados) > max_nomes:
+                print(f"      ... e mais {len(aproximados) - max_nomes}")
+        
+        if self.nao_identificados > 0:
+            print(f"\n⚠️  Deputados não identificados:")
+            nomes = self.nomes_nao_identificados
+            for _, row in nomes.head(max_nomes).iterrows():
+                print(f"      - {row['nome_deputado']} "
+                      f"({row['num_registros']:,} registros, R$ {row['valor_total']:,.2f})")
+            if len(nomes) > max_nomes:
+                print(f"      ... e mais {len(nomes) - max_nomes}")
+
+
+def _memorizar(metodo):
+    """
+    Decorador que memoriza o resultado de um método de análise
+    
+    A chave é (método, argumentos com os valores padrão aplicados, versão
+    dos dados cruzados); listas de filtros são normalizadas para que a
+    ordem dos valores não importe. O cache é um LRU limitado a
+    `DataAnalyzer.TAMANHO_CACHE` entradas, esvaziado quando o cruzamento
+    é refeito. DataFrames são devolvidos como cópias, para que alterações
+    de quem chama não contaminem o cache.
+    """
+    assinatura = inspect.signature(metodo)
+    
+    def normalizar(valor):
+        if isinstance(valor, (list, tuple, set)):
+            return tuple(sorted(valor))
+        return valor
+    
+    @functools.wraps(metodo)
+    def memorizado(self, *args, **kwargs):
+        if self.df_cruzado is None:
+            self.cruzar_dados()
+        
+        argumentos = assinatura.bind(self, *args, **kwargs)
+        argumentos.apply_defaults()
+        chave = (
+            metodo.__name__,
+            tuple((nome, normalizar(valor))
+                  for nome, valor in list(argumentos.arguments.items())[1:]),
+            self._versao_dados,
+        )
+        
+        if chave in self._cache:
+            self._cache.move_to_end(chave)
+            self.estatisticas_cache['acertos'] += 1
+            resultado = self._cache[chave]
+        else:
+            self.estatisticas_cache['falhas'] += 1
+            resultado = metodo(self, *args, **kwargs)
+            self._cache[chave] = resultado
+            while len(self._cache) > self.TAMANHO_CACHE:
+                self._cache.popitem(last=False)
+        
+        return resultado.copy() if isinstance(resultado, pd.DataFrame) else resultado
+    
+    return memorizado
+
+
+@instrumentar
 class DataAnalyzer:
     """Analisa e cruza dados de despesas com dados cadastrais"""
     
-    def __init__(self, df_despesas: pd.DataFrame, df_deputados: pd.DataFrame):
+    BACKENDS = ('serial', 'processos')
+    
+    # Resultados de análises mantidos em memória (LRU)
+    TAMANHO_CACHE = 32
+    
+    def __init__(self, df_despesas: pd.DataFrame, df_deputados: pd.DataFrame,
+                 backend: str = 'serial', num_processos: Optional[int] = None,
+                 limiar_similaridade: Optional[float] = None):
         """
         Inicializa o analisador
         
         Args:
             df_despesas: DataFrame com despesas (do CSV)
             df_deputados: DataFrame com dados cadastrais (da API)
+            backend: 'serial' (implementação de referência) ou 'processos'
+                (agregações por intervalos de registros em um pool de processos)
+            num_processos: Número de processos do backend paralelo
+                (padrão: número de CPUs)
+            limiar_similaridade: Similaridade mínima (0 a 1) para resolver
+                nomes sem correspondência exata (sugerido: 0.85); None ou 0
+                desativa (padrão)
+                
+        Raises:
+            ValueError: Se o backend não for reconhecido
         """
-        self.df_despesas = df_despesas.copy()
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend inválido: {backend!r} (use {' ou '.join(self.BACKENDS)})")
+        
+        # Cópia rasa: as despesas nunca são alteradas no lugar
+        self.df_despesas = df_despesas.copy(deep=False)
         self.df_deputados = df_deputados.copy()
         self.df_cruzado = None
+        self.relatorio_cruzamento = None
+        self.backend = backend
+        self.limiar_similaridade = limiar_similaridade
+        self._executor = ExecutorParalelo(num_processos) if backend == 'processos' else None
+        # Analisadores filtrados usam o pool do original, mas não o encerram
+        self._dono_executor = True
+        self._versao_dados = 0
+        self._cache = OrderedDict()
+        self.estatisticas_cache = {'acertos': 0, 'falhas': 0}
         
     def cruzar_dados(self) -> pd.DataFrame:
         """
         Cruza dados de despesas com dados cadastrais dos deputados
         
-        Utiliza o nome do parlamentar como chave de ligação.
-        Deputados não identificados são marcados como "NÃO IDENTIFICADO".
+        Utiliza o nome do parlamentar como chave de ligação. Nomes sem
+        correspondência exata passam por uma busca aproximada (trigramas)
+        contra o cadastro; os que continuam sem correspondência são
+        marcados como "NÃO IDENTIFICADO".
         
         Returns:
             DataFrame com dados cruzados
@@ -43,53 +188,129 @@ class DataAnalyzer:
             self._padronizar_nome
         )
         
-        # Criar coluna auxiliar para o join
-        despesas = self.df_despesas.copy()
-        despesas['nome_padrao'] = despesas['nome_deputado']
+        # Uma linha do cadastro por nome (nomes repetidos duplicariam despesas)
+        cadastro = self.df_deputados.drop_duplicates('nome_padrao')
         
-        # Left join: mantém todas as despesas
-        df_merged = despesas.merge(
-            self.df_deputados[['nome_padrao', 'siglaPartido', 'siglaUf']],
-            on='nome_padrao',
-            how='left'
+        # Mapear apenas os nomes distintos das despesas para linhas do cadastro
+        cod_nome, nomes_unicos = pd.factorize(self.df_despesas['nome_deputado'])
+        linha_por_nome = pd.Index(cadastro['nome_padrao']).get_indexer(nomes_unicos)
+        registros_por_nome = np.bincount(cod_nome[cod_nome >= 0], minlength=len(nomes_unicos))
+        
+        # Busca aproximada apenas para os nomes distintos sem correspondência exata
+        aproximados = self._resolver_aproximados(
+            cadastro, np.asarray(nomes_unicos), linha_por_nome, registros_por_nome
         )
         
-        # Renomear colunas
-        df_merged = df_merged.rename(columns={
-            'siglaPartido': 'partido',
-            'siglaUf': 'uf'
-        })
+        linha_por_registro = np.where(cod_nome >= 0, linha_por_nome.take(cod_nome), -1)
+        
+        # Expandir partido/UF como códigos categóricos (-1 = não identificado)
+        df_merged = self.df_despesas.copy(deep=False)
+        # Nome e tipo de despesa também categóricos: as análises agrupam
+        # pelos códigos, sem comparar textos a cada registro
+        df_merged['nome_deputado'] = pd.Categorical.from_codes(cod_nome, nomes_unicos)
+        if 'tipo_despesa' in df_merged.columns:
+            cod_tipo, tipos = pd.factorize(df_merged['tipo_despesa'], sort=True)
+            df_merged['tipo_despesa'] = pd.Categorical.from_codes(cod_tipo, tipos)
+        df_merged['partido'] = self._propagar_categorias(
+            cadastro['siglaPartido'], linha_por_registro
+        )
+        df_merged['uf'] = self._propagar_categorias(
+            cadastro['siglaUf'], linha_por_registro
+        )
         
-        # Marcar deputados não identificados
-        df_merged['partido'] = df_merged['partido'].fillna('NÃO IDENTIFICADO')
-        df_merged['uf'] = df_merged['uf'].fillna('NÃO IDENTIFICADO')
+        self.df_cruzado = df_merged
         
-        # Remover coluna auxiliar
-        df_merged = df_merged.drop('nome_padrao', axis=1)
+        # Novos dados cruzados: resultados memorizados deixam de valer
+        self._versao_dados += 1
+        self._cache.clear()
         
-        self.df_cruzado = df_merged
+        # Máscara única de registros identificados, reutilizada pelas análises:
+        # nome no cadastro com partido e UF preenchidos (sem eles, o registro
+        # entraria nas análises com "NÃO IDENTIFICADO" como partido ou UF)
+        cadastro_completo = np.append(
+            (cadastro['siglaPartido'].notna() & cadastro['siglaUf'].notna()).to_numpy(),
+            False
+        )
+        identificado_por_nome = cadastro_completo.take(linha_por_nome)
+        mascara = (cod_nome >= 0) & identificado_por_nome.take(cod_nome)
+        
+        # Registros e valor por nome distinto, apenas dos não identificados
+        nao_ident = ~mascara & (cod_nome >= 0)
+        valor_por_nome = np.bincount(
+            cod_nome[nao_ident],
+            weights=self.df_despesas['valor'].to_numpy()[nao_ident],
+            minlength=len(nomes_unicos)
+        )
+        sem_cadastro = np.flatnonzero(~identificado_por_nome & (registros_por_nome > 0))
+        nomes_nao_ident = pd.DataFrame({
+            'nome_deputado': np.asarray(nomes_unicos)[sem_cadastro],
+            'num_registros': registros_por_nome[sem_cadastro],
+            'valor_total': valor_por_nome[sem_cadastro].round(2)
+        }).sort_values('valor_total', ascending=False, ignore_index=True)
+        
+        self.relatorio_cruzamento = RelatorioCruzamento(
+            total_registros=len(df_merged),
+            identificados=int(mascara.sum()),
+            nomes_nao_identificados=nomes_nao_ident,
+            mascara_identificados=mascara,
+            correspondencias_aproximadas=aproximados
+        )
+        self.relatorio_cruzamento.exibir()
         
-        # Relatório do cruzamento
-        total_despesas = len(df_merged)
-        identificados = len(df_merged[df_merged['partido'] != 'NÃO IDENTIFICADO'])
-        nao_identificados = total_despesas - identificados
-        taxa_identificacao = (identificados / total_despesas) * 100
+        return self.df_cruzado
+    
+    def _resolver_aproximados(self, cadastro: pd.DataFrame, nomes_unicos: np.ndarray,
+                              linha_por_nome: np.ndarray,
+                              registros_por_nome: np.ndarray) -> pd.DataFrame:
+        """
+        Resolve por similaridade os nomes sem correspondência exata
         
-        print(f"✅ Cruzamento concluído!")
-        print(f"   Total de registros: {total_despesas:,}")
-        print(f"   Identificados: {identificados:,} ({taxa_identificacao:.1f}%)")
-        print(f"   Não identificados: {nao_identificados:,} ({100-taxa_identificacao:.1f}%)")
+        Atualiza `linha_por_nome` no lugar para os nomes resolvidos.
         
-        if nao_identificados > 0:
-            print(f"\n⚠️  Deputados não identificados:")
-            nomes_nao_ident = df_merged[df_merged['partido'] == 'NÃO IDENTIFICADO']['nome_deputado'].unique()
-            for nome in nomes_nao_ident[:10]:  # Mostrar apenas 10
-                print(f"      - {nome}")
-            if len(nomes_nao_ident) > 10:
-                print(f"      ... e mais {len(nomes_nao_ident) - 10}")
+        Args:
+            cadastro: Cadastro deduplicado (com coluna nome_padrao)
+            nomes_unicos: Nomes distintos das despesas
+            linha_por_nome: Linha do cadastro de cada nome (-1 = sem correspondência)
+            registros_por_nome: Número de registros de cada nome
+            
+        Returns:
+            DataFrame de auditoria com as correspondências escolhidas
+        """
+        colunas = ['nome_deputado', 'nome_cadastro', 'partido', 'uf',
+                   'similaridade', 'num_registros']
+        sem_correspondencia = np.flatnonzero(linha_por_nome < 0)
+        
+        if not self.limiar_similaridade or len(sem_correspondencia) == 0:
+            return pd.DataFrame(columns=colunas)
+        
+        # Candidatos: apenas linhas do cadastro que nenhum nome encontrou
+        # exatamente (um deputado já identificado não tem outra grafia)
+        livres = np.setdiff1d(np.arange(len(cadastro)), linha_por_nome[linha_por_nome >= 0])
+        if len(livres) == 0:
+            return pd.DataFrame(columns=colunas)
+        
+        matcher = NameMatcher(cadastro['nome_padrao'].to_numpy()[livres])
+        resolvidos = matcher.resolver(
+            nomes_unicos[sem_correspondencia], limiar=self.limiar_similaridade
+        )
+        if len(resolvidos) == 0:
+            return pd.DataFrame(columns=colunas)
         
-        return self.df_cruzado
+        codigos = sem_correspondencia[
+            pd.Index(nomes_unicos[sem_correspondencia]).get_indexer(resolvidos['nome_deputado'])
+        ]
+        posicoes = livres[resolvidos['posicao_cadastro'].to_numpy()]
+        linha_por_nome[codigos] = posicoes
+        
+        resolvidos['partido'] = cadastro['siglaPartido'].to_numpy()[posicoes]
+        resolvidos['uf'] = cadastro['siglaUf'].to_numpy()[posicoes]
+        resolvidos['num_registros'] = registros_por_nome[codigos]
+        
+        return resolvidos[colunas].sort_values(
+            'similaridade', ascending=False, ignore_index=True
+        )
     
+    @_memorizar
     def analisar_por_partido(self) -> pd.DataFrame:
         """
         Agrega gastos por partido político
@@ -103,19 +324,24 @@ class DataAnalyzer:
             self.cruzar_dados()
         
         # Remover não identificados para esta análise
-        df = self.df_cruzado[self.df_cruzado['partido'] != 'NÃO IDENTIFICADO'].copy()
+        df = self._identificados()
         
         # Agregações por partido
-        analise_partido = df.groupby('partido').agg({
-            'valor': ['sum', 'mean', 'median', 'count'],
-            'nome_deputado': 'nunique'
-        }).round(2)
-        
-        # Renomear colunas
-        analise_partido.columns = [
-            'total_gasto', 'gasto_medio', 'gasto_mediano', 
-            'num_registros', 'num_deputados'
-        ]
+        if self._executor is not None:
+            analise_partido = self._executor.agregar(
+                df, ['partido'], media=True, mediana=True, deputados=True
+            )
+        else:
+            analise_partido = df.groupby('partido', observed=True).agg({
+                'valor': ['sum', 'mean', 'median', 'count'],
+                'nome_deputado': 'nunique'
+            }).round(2)
+            
+            # Renomear colunas
+            analise_partido.columns = [
+                'total_gasto', 'gasto_medio', 'gasto_mediano', 
+                'num_registros', 'num_deputados'
+            ]
         
         # Calcular média por deputado
         analise_partido['media_por_deputado'] = (
@@ -127,8 +353,9 @@ class DataAnalyzer:
         
         print(f"✅ {len(analise_partido)} partidos analisados")
         
-        return analise_partido.reset_index()
+        return self._sem_categorias(analise_partido.reset_index())
     
+    @_memorizar
     def analisar_por_estado(self) -> pd.DataFrame:
         """
         Agrega gastos por estado (UF)
@@ -142,19 +369,24 @@ class DataAnalyzer:
             self.cruzar_dados()
         
         # Remover não identificados
-        df = self.df_cruzado[self.df_cruzado['uf'] != 'NÃO IDENTIFICADO'].copy()
+        df = self._identificados()
         
         # Agregações por UF
-        analise_uf = df.groupby('uf').agg({
-            'valor': ['sum', 'mean', 'median', 'count'],
-            'nome_deputado': 'nunique'
-        }).round(2)
-        
-        # Renomear colunas
-        analise_uf.columns = [
-            'total_gasto', 'gasto_medio', 'gasto_mediano',
-            'num_registros', 'num_deputados'
-        ]
+        if self._executor is not None:
+            analise_uf = self._executor.agregar(
+                df, ['uf'], media=True, mediana=True, deputados=True
+            )
+        else:
+            analise_uf = df.groupby('uf', observed=True).agg({
+                'valor': ['sum', 'mean', 'median', 'count'],
+                'nome_deputado': 'nunique'
+            }).round(2)
+            
+            # Renomear colunas
+            analise_uf.columns = [
+                'total_gasto', 'gasto_medio', 'gasto_mediano',
+                'num_registros', 'num_deputados'
+            ]
         
         # Calcular média por deputado
         analise_uf['media_por_deputado'] = (
@@ -166,8 +398,9 @@ class DataAnalyzer:
         
         print(f"✅ {len(analise_uf)} estados analisados")
         
-        return analise_uf.reset_index()
+        return self._sem_categorias(analise_uf.reset_index())
     
+    @_memorizar
     def analisar_tipos_despesa(self) -> pd.DataFrame:
         """
         Agrega gastos por tipo de despesa
@@ -180,15 +413,18 @@ class DataAnalyzer:
         if self.df_cruzado is None:
             self.cruzar_dados()
         
-        df = self.df_cruzado[self.df_cruzado['partido'] != 'NÃO IDENTIFICADO'].copy()
+        df = self._identificados()
         
         # Agregações por tipo de despesa
-        analise_despesa = df.groupby('tipo_despesa').agg({
-            'valor': ['sum', 'mean', 'count']
-        }).round(2)
-        
-        # Renomear colunas
-        analise_despesa.columns = ['total_gasto', 'gasto_medio', 'num_registros']
+        if self._executor is not None:
+            analise_despesa = self._executor.agregar(df, ['tipo_despesa'], media=True)
+        else:
+            analise_despesa = df.groupby('tipo_despesa', observed=True).agg({
+                'valor': ['sum', 'mean', 'count']
+            }).round(2)
+            
+            # Renomear colunas
+            analise_despesa.columns = ['total_gasto', 'gasto_medio', 'num_registros']
         
         # Calcular percentual do total
         total_geral = analise_despesa['total_gasto'].sum()
@@ -201,44 +437,334 @@ class DataAnalyzer:
         
         print(f"✅ {len(analise_despesa)} tipos de despesa analisados")
         
-        return analise_despesa.reset_index()
+        return self._sem_categorias(analise_despesa.reset_index())
     
-    def analisar_top_deputados(self, top_n: int = 20) -> pd.DataFrame:
+    @_memorizar
+    def analisar_top_deputados(self, top_n: Optional[int] = 20,
+                               por: Optional[str] = None) -> pd.DataFrame:
         """
         Identifica deputados com maiores gastos
         
+        Usa seleção parcial (nlargest/rank) em vez de ordenar toda a tabela
+        agregada. Com `por`, retorna o top N dentro de cada partido ou estado
+        numa única passada sobre os agregados.
+        
         Args:
-            top_n: Número de deputados a retornar
+            top_n: Número de deputados a retornar (por grupo, se `por` for
+                usado); None retorna todos, em ordem decrescente de gasto
+            por: Coluna de agrupamento opcional ('partido' ou 'uf')
             
         Returns:
             DataFrame com top deputados
+            
+        Raises:
+            ValueError: Se `por` não for 'partido' nem 'uf'
         """
-        print(f"\n📊 Analisando top {top_n} deputados com maiores gastos...")
+        if por is not None and por not in ('partido', 'uf'):
+            raise ValueError(f"Agrupamento inválido: {por!r} (use 'partido' ou 'uf')")
+        
+        sufixo = f" por {por}" if por else ""
+        rotulo = f"top {top_n}" if top_n else "todos os"
+        print(f"\n📊 Analisando {rotulo} deputados com maiores gastos{sufixo}...")
         
         if self.df_cruzado is None:
             self.cruzar_dados()
         
-        df = self.df_cruzado[self.df_cruzado['partido'] != 'NÃO IDENTIFICADO'].copy()
+        df = self._identificados()
         
-        # Agregações por deputado
-        top_deputados = df.groupby(['nome_deputado', 'partido', 'uf']).agg({
-            'valor': ['sum', 'count']
-        }).round(2)
+        # Agregações por deputado (sem ordenar as chaves)
+        chaves = ['nome_deputado', 'partido', 'uf']
+        if self._executor is not None:
+            top_deputados = self._executor.agregar(df, chaves)
+        else:
+            top_deputados = df.groupby(chaves, sort=False, observed=True).agg({
+                'valor': ['sum', 'count']
+            }).round(2)
+            
+            # Renomear colunas
+            top_deputados.columns = ['total_gasto', 'num_registros']
+        top_deputados = top_deputados.reset_index()
+        
+        if top_n is None:
+            top_deputados = top_deputados.sort_values('total_gasto', ascending=False)
+        elif por is None:
+            # Seleção parcial: apenas os N maiores são ordenados
+            top_deputados = top_deputados.nlargest(top_n, 'total_gasto')
+        else:
+            # Posição de cada deputado dentro do seu grupo, sem ordenar a tabela
+            posicao = top_deputados.groupby(por, sort=False, observed=True)['total_gasto'].rank(
+                method='first', ascending=False
+            )
+            top_deputados = top_deputados[posicao <= top_n].sort_values(
+                [por, 'total_gasto'], ascending=[True, False]
+            )
+        
+        print(f"✅ {rotulo.capitalize()} deputados identificados{sufixo}")
+        
+        return self._sem_categorias(top_deputados.reset_index(drop=True))
+    
+    @_memorizar
+    def cubo_temporal(self) -> pd.DataFrame:
+        """
+        Agrega os registros identificados por competência, partido, UF e tipo de despesa
         
-        # Renomear colunas
-        top_deputados.columns = ['total_gasto', 'num_registros']
+        É a única passada sobre os registros da análise temporal: os
+        totais mensais e trimestrais, gerais ou por dimensão, são somas
+        sobre este cubo (muito menor que os dados cruzados).
         
-        # Ordenar e pegar top N
-        top_deputados = top_deputados.sort_values('total_gasto', ascending=False).head(top_n)
+        Returns:
+            DataFrame com ano_mes, partido, uf, tipo_despesa, total_gasto
+            e num_registros
+            
+        Raises:
+            ValueError: Se os dados não tiverem a coluna ano_mes
+        """
+        if 'ano_mes' not in self.df_cruzado.columns:
+            raise ValueError("Dados sem competência (numAno/numMes ou datEmissao) no CSV")
+        
+        df = self._identificados()
+        df = df[df['ano_mes'].to_numpy() > 0]
+        
+        return df.groupby(
+            ['ano_mes', 'partido', 'uf', 'tipo_despesa'], sort=False, observed=True
+        ).agg(
+            total_gasto=('valor', 'sum'),
+            num_registros=('valor', 'size')
+        ).reset_index()
+    
+    @_memorizar
+    def analisar_evolucao_temporal(self, periodo: str = 'mes',
+                                   por: Optional[str] = None) -> pd.DataFrame:
+        """
+        Evolução dos gastos por mês ou trimestre
         
-        print(f"✅ Top {top_n} deputados identificados")
+        Args:
+            periodo: 'mes' (rótulos AAAA-MM) ou 'trimestre' (AAAA-T1 a AAAA-T4)
+            por: Dimensão opcional ('partido', 'uf' ou 'tipo_despesa')
+            
+        Returns:
+            DataFrame com periodo, a dimensão (se houver), total_gasto,
+            num_registros e gasto_medio, em ordem cronológica
+            
+        Raises:
+            ValueError: Se `periodo` ou `por` forem inválidos, ou se os
+                dados não tiverem competência
+        """
+        if periodo not in ('mes', 'trimestre'):
+            raise ValueError(f"Período inválido: {periodo!r} (use 'mes' ou 'trimestre')")
+        if por is not None and por not in ('partido', 'uf', 'tipo_despesa'):
+            raise ValueError(f"Agrupamento inválido: {por!r} (use 'partido', 'uf' ou 'tipo_despesa')")
+        
+        sufixo = f" por {por}" if por else ""
+        print(f"\n📊 Analisando evolução {'mensal' if periodo == 'mes' else 'trimestral'}{sufixo}...")
+        
+        cubo = self.cubo_temporal()
+        ano, mes = np.divmod(cubo['ano_mes'].to_numpy(), 100)
+        if periodo == 'mes':
+            chave = ano * 100 + mes
+        else:
+            chave = ano * 10 + (mes - 1) // 3 + 1
+        
+        chaves = ['chave'] + ([por] if por else [])
+        evolucao = cubo.assign(chave=chave).groupby(chaves, observed=True)[
+            ['total_gasto', 'num_registros']
+        ].sum().reset_index()
+        
+        ano, resto = np.divmod(evolucao.pop('chave').to_numpy(), 100 if periodo == 'mes' else 10)
+        rotulos = [f"{a}-{r:02d}" if periodo == 'mes' else f"{a}-T{r}" for a, r in zip(ano, resto)]
+        evolucao.insert(0, 'periodo', rotulos)
+        
+        evolucao['total_gasto'] = evolucao['total_gasto'].round(2)
+        evolucao['gasto_medio'] = (evolucao['total_gasto'] / evolucao['num_registros']).round(2)
+        
+        print(f"✅ {evolucao['periodo'].nunique()} períodos analisados")
+        
+        return self._sem_categorias(evolucao)
+    
+    @_memorizar
+    def gastos_deputado_fornecedor(self) -> pd.DataFrame:
+        """
+        Agrega os registros identificados por deputado e fornecedor
+        
+        É a única passada sobre os registros das análises de fornecedores,
+        agrupando pela chave inteira do CNPJ/CPF (fornecedor_id). Registros
+        sem documento (chave 0) ficam de fora.
+        
+        Returns:
+            DataFrame com nome_deputado, partido, uf, fornecedor_id,
+            total_gasto e num_registros
+            
+        Raises:
+            ValueError: Se os dados não tiverem a coluna fornecedor_id
+        """
+        if 'fornecedor_id' not in self.df_cruzado.columns:
+            raise ValueError("Dados sem CNPJ/CPF do fornecedor (txtCNPJCPF) no CSV")
+        
+        df = self._identificados()
+        df = df[df['fornecedor_id'].to_numpy() > 0]
+        
+        return df.groupby(
+            ['nome_deputado', 'partido', 'uf', 'fornecedor_id'], sort=False, observed=True
+        ).agg(
+            total_gasto=('valor', 'sum'),
+            num_registros=('valor', 'size')
+        ).reset_index()
+    
+    @_memorizar
+    def analisar_fornecedores(self, top_n: int = 20,
+                              ordenar_por: str = 'total_gasto') -> pd.DataFrame:
+        """
+        Identifica os principais fornecedores
+        
+        Com ordenar_por='num_deputados', lista os fornecedores compartilhados
+        pelo maior número de deputados.
+        
+        Args:
+            top_n: Número de fornecedores a retornar
+            ordenar_por: 'total_gasto' ou 'num_deputados'
+            
+        Returns:
+            DataFrame com fornecedor_id, documento, fornecedor, total_gasto,
+            num_registros, num_deputados e percentual do total com fornecedores
+            
+        Raises:
+            ValueError: Se `ordenar_por` for inválido
+        """
+        if ordenar_por not in ('total_gasto', 'num_deputados'):
+            raise ValueError(
+                f"Ordenação inválida: {ordenar_por!r} (use 'total_gasto' ou 'num_deputados')"
+            )
+        
+        print(f"\n📊 Analisando top {top_n} fornecedores por {ordenar_por}...")
+        
+        pares = self.gastos_deputado_fornecedor()
+        
+        # Cada par (deputado, fornecedor) é uma linha: o tamanho do grupo conta deputados
+        fornecedores = pares.groupby('fornecedor_id', sort=False).agg(
+            total_gasto=('total_gasto', 'sum'),
+            num_registros=('num_registros', 'sum'),
+            num_deputados=('nome_deputado', 'size')
+        )
+        total_geral = fornecedores['total_gasto'].sum()
+        
+        criterios = [ordenar_por] + [c for c in ('total_gasto', 'num_deputados') if c != ordenar_por]
+        fornecedores = fornecedores.nlargest(top_n, criterios).reset_index()
+        fornecedores['total_gasto'] = fornecedores['total_gasto'].round(2)
+        fornecedores['percentual'] = (fornecedores['total_gasto'] / total_geral * 100).round(2)
+        
+        # Documento formatado e nome apenas dos fornecedores selecionados
+        fornecedores.insert(1, 'documento', [
+            DataLoader.formatar_documento(chave) for chave in fornecedores['fornecedor_id']
+        ])
+        fornecedores.insert(2, 'fornecedor', self._nomes_fornecedores(fornecedores['fornecedor_id']))
+        
+        print(f"✅ {len(fornecedores)} fornecedores identificados")
+        
+        return fornecedores
+    
+    @_memorizar
+    def analisar_concentracao_fornecedores(self) -> pd.DataFrame:
+        """
+        Mede a concentração dos gastos de cada deputado em poucos fornecedores
+        
+        Returns:
+            DataFrame por deputado com total_gasto, num_fornecedores,
+            maior_fornecedor, participacao_maior_fornecedor (%) e indice_hhi
+            (Herfindahl-Hirschman, 0 a 10.000), do mais para o menos concentrado
+        """
+        print("\n📊 Analisando concentração de fornecedores por deputado...")
+        
+        pares = self.gastos_deputado_fornecedor()
+        chaves = ['nome_deputado', 'partido', 'uf']
+        grupos = pares.groupby(chaves, sort=False, observed=True)['total_gasto']
+        
+        participacao = pares['total_gasto'] / grupos.transform('sum')
+        maior = grupos.idxmax()
+        
+        concentracao = pd.DataFrame({
+            'total_gasto': grupos.sum().round(2),
+            'num_fornecedores': grupos.size(),
+            'fornecedor_id': pares.loc[maior.to_numpy(), 'fornecedor_id'].to_numpy(),
+            'participacao_maior_fornecedor': (participacao.loc[maior.to_numpy()].to_numpy() * 100).round(2),
+            'indice_hhi': (
+                (participacao ** 2).groupby([pares[c] for c in chaves], sort=False,
+                                            observed=True).sum() * 10_000
+            ).round(0),
+        }).reset_index()
+        
+        concentracao.insert(5, 'maior_fornecedor', self._nomes_fornecedores(concentracao['fornecedor_id']))
+        concentracao = concentracao.drop(columns='fornecedor_id').sort_values(
+            'indice_hhi', ascending=False, ignore_index=True
+        )
+        
+        print(f"✅ {len(concentracao)} deputados analisados")
+        
+        return self._sem_categorias(concentracao)
+    
+    def _nomes_fornecedores(self, chaves: pd.Series) -> list:
+        """Nome (primeira grafia encontrada) de cada fornecedor, ou o documento formatado"""
+        if 'fornecedor' not in self.df_cruzado.columns:
+            return [DataLoader.formatar_documento(chave) for chave in chaves]
+        
+        registros = self.df_cruzado[self.df_cruzado['fornecedor_id'].isin(chaves)]
+        nomes = registros.drop_duplicates('fornecedor_id').set_index('fornecedor_id')['fornecedor']
+        return [str(nomes.get(chave, '')) for chave in chaves]
+    
+    @_memorizar
+    def filtrar(self, partido: Optional[list] = None, uf: Optional[list] = None,
+                tipo_despesa: Optional[list] = None,
+                nome_deputado: Optional[list] = None) -> 'DataAnalyzer':
+        """
+        Cria um analisador restrito aos registros identificados que atendem aos filtros
+        
+        O cruzamento não é refeito: o novo analisador compartilha o cadastro
+        e o backend deste e recebe apenas o subconjunto filtrado (das
+        despesas e dos dados cruzados), então suas análises respondem às
+        mesmas perguntas sobre menos registros. Encerrar o analisador
+        filtrado não encerra o pool de processos compartilhado.
+        O analisador filtrado é memorizado junto com seu próprio cache, de
+        modo que repetir os mesmos filtros reaproveita as análises já feitas.
         
-        return top_deputados.reset_index()
+        Args:
+            partido: Siglas de partido aceitas (None = todas)
+            uf: UFs aceitas (None = todas)
+            tipo_despesa: Tipos de despesa aceitos (None = todos)
+            nome_deputado: Nomes padronizados aceitos (None = todos)
+        
+        Returns:
+            Novo DataAnalyzer com os registros filtrados
+        """
+        if self.df_cruzado is None:
+            self.cruzar_dados()
+        
+        selecao = self.relatorio_cruzamento.mascara_identificados.copy()
+        filtros = {'partido': partido, 'uf': uf, 'tipo_despesa': tipo_despesa,
+                   'nome_deputado': nome_deputado}
+        for coluna, valores in filtros.items():
+            if valores:
+                selecao &= self.df_cruzado[coluna].isin(valores).to_numpy()
+        
+        filtrado = copy.copy(self)
+        filtrado.df_despesas = self.df_despesas[selecao]
+        filtrado.df_cruzado = self.df_cruzado[selecao]
+        filtrado._dono_executor = False
+        filtrado._cache = OrderedDict()
+        filtrado.estatisticas_cache = {'acertos': 0, 'falhas': 0}
+        filtrado.relatorio_cruzamento = replace(
+            self.relatorio_cruzamento,
+            total_registros=len(filtrado.df_cruzado),
+            identificados=len(filtrado.df_cruzado),
+            mascara_identificados=np.ones(len(filtrado.df_cruzado), dtype=bool)
+        )
+        return filtrado
     
     def gerar_relatorio_completo(self) -> dict:
         """
         Gera relatório completo com todas as análises
         
+        O cruzamento é feito apenas se ainda não tiver sido (um analisador
+        criado por `filtrar` já traz os dados cruzados e filtrados).
+        
         Returns:
             Dicionário com todos os DataFrames de análise
         """
@@ -246,13 +772,24 @@ class DataAnalyzer:
         print("📊 GERANDO RELATÓRIO COMPLETO")
         print("=" * 70)
         
+        if self.df_cruzado is None:
+            self.cruzar_dados()
+        
         relatorio = {
-            'dados_cruzados': self.cruzar_dados(),
+            'dados_cruzados': self.df_cruzado,
+            'cruzamento': self.relatorio_cruzamento,
             'por_partido': self.analisar_por_partido(),
             'por_estado': self.analisar_por_estado(),
             'por_tipo_despesa': self.analisar_tipos_despesa(),
-            'top_deputados': self.analisar_top_deputados()
+            'top_deputados': self.analisar_top_deputados(),
+            # Todos os deputados: base dos filtros do dashboard interativo
+            'gastos_por_deputado': self.analisar_top_deputados(top_n=None)
         }
+        if 'ano_mes' in self.df_cruzado.columns:
+            relatorio['evolucao_mensal'] = self.analisar_evolucao_temporal()
+        if 'fornecedor_id' in self.df_cruzado.columns:
+            relatorio['top_fornecedores'] = self.analisar_fornecedores()
+            relatorio['concentracao_fornecedores'] = self.analisar_concentracao_fornecedores()
         
         print("\n" + "=" * 70)
         print("✅ RELATÓRIO COMPLETO GERADO")
@@ -260,6 +797,46 @@ class DataAnalyzer:
         
         return relatorio
     
+    def _identificados(self) -> pd.DataFrame:
+        """Registros identificados, filtrados pela máscara do cruzamento"""
+        return self.df_cruzado[self.relatorio_cruzamento.mascara_identificados]
+    
+    def encerrar(self) -> None:
+        """Libera os processos do backend paralelo, se houver e for deste analisador"""
+        if self._executor is not None and self._dono_executor:
+            self._executor.encerrar()
+    
+    @staticmethod
+    def _sem_categorias(df: pd.DataFrame) -> pd.DataFrame:
+        """Converte colunas categóricas (partido/UF) de volta para texto"""
+        categoricas = df.select_dtypes('category').columns
+        return df.astype({coluna: str for coluna in categoricas})
+    
+    @staticmethod
+    def _propagar_categorias(coluna: pd.Series, linhas: np.ndarray) -> pd.Categorical:
+        """
+        Replica uma coluna do cadastro para os registros via códigos categóricos
+        
+        Args:
+            coluna: Coluna do cadastro (uma linha por deputado)
+            linhas: Linha do cadastro de cada registro (-1 = não identificado)
+            
+        Returns:
+            Categorical alinhado aos registros, com "NÃO IDENTIFICADO" para
+            registros sem correspondência ou sem valor no cadastro
+        """
+        valores = pd.Categorical(coluna)
+        categorias = valores.categories.append(pd.Index(['NÃO IDENTIFICADO']))
+        nao_identificado = len(categorias) - 1
+        
+        # O último código é o de "NÃO IDENTIFICADO", alcançado por take(-1)
+        codigos = np.append(
+            np.where(valores.codes >= 0, valores.codes, nao_identificado),
+            nao_identificado
+        )
+        
+        return pd.Categorical.from_codes(codigos.take(linhas), categories=categorias)
+    
     @staticmethod
     def _padronizar_nome(nome: str) -> str:
         """Padroniza nome para cruzamento"""
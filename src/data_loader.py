@@ -14,6 +14,16 @@ from unidecode import unidecode
 class DataLoader:
     """Carrega e limpa dados de despesas parlamentares"""
     
+    # Formato de datEmissao nos arquivos da cota parlamentar
+    FORMATO_DATA = '%Y-%m-%dT%H:%M:%S'
+    
+    # Colunas que, junto com nome, tipo e valor, identificam um lançamento
+    # (usadas na remoção de duplicatas quando presentes no CSV)
+    COLUNAS_DUPLICATA = ['ideDocumento', 'datEmissao', 'numAno', 'numMes', 'txtCNPJCPF']
+    
+    # Somado às chaves de CPF para que nunca coincidam com um CNPJ (< 10^14)
+    DESLOCAMENTO_CPF = 10 ** 14
+    
     def __init__(self, csv_path: str):
         """
         Inicializa o carregador de dados
@@ -53,7 +63,7 @@ class DataLoader:
                 encoding='utf-8',
                 decimal=',',
                 thousands='.',
-                dtype={'vlrLiquido': float}
+                dtype={'vlrLiquido': float, 'txtCNPJCPF': str}
             )
         except UnicodeDecodeError:
             # Tentar outro encoding se UTF-8 falhar
@@ -63,7 +73,7 @@ class DataLoader:
                 encoding='latin1',
                 decimal=',',
                 thousands='.',
-                dtype={'vlrLiquido': float}
+                dtype={'vlrLiquido': float, 'txtCNPJCPF': str}
             )
         
         print(f"✅ {len(self.df_original):,} registros carregados")
@@ -79,7 +89,12 @@ class DataLoader:
         1. Seleciona apenas colunas necessárias
         2. Remove registros com valores inválidos
         3. Padroniza nomes dos parlamentares
-        4. Remove duplicatas
+        4. Calcula a competência (ano_mes = AAAAMM) a partir de
+           numAno/numMes ou datEmissao, se disponíveis
+        5. Codifica o CNPJ/CPF do fornecedor como inteiro (fornecedor_id),
+           se disponível
+        6. Remove duplicatas (mesmo nome, tipo, valor e, quando presentes,
+           documento, data e fornecedor)
         
         Returns:
             DataFrame limpo e preparado
@@ -119,9 +134,28 @@ class DataLoader:
         # 3. Padronizar nomes dos parlamentares
         df['txNomeParlamentar'] = df['txNomeParlamentar'].apply(self._padronizar_nome)
         
-        # 4. Remover duplicatas (se houver)
+        # 4. Competência (ano e mês) compacta, quando o CSV traz as datas
+        colunas_data = [c for c in ('numAno', 'numMes', 'datEmissao') if c in self.df_original.columns]
+        ano_mes = self._calcular_ano_mes(self.df_original.loc[df.index, colunas_data])
+        if ano_mes is not None:
+            df['ano_mes'] = ano_mes
+        
+        # 5. Fornecedor: CNPJ/CPF como chave inteira e nome categórico
+        if 'txtCNPJCPF' in self.df_original.columns:
+            df['fornecedor_id'] = self.codificar_documentos(
+                self.df_original.loc[df.index, 'txtCNPJCPF']
+            )
+            if 'txtFornecedor' in self.df_original.columns:
+                df['fornecedor'] = self.df_original.loc[df.index, 'txtFornecedor'].astype('category')
+        
+        # 6. Remover duplicatas (se houver): mesmo documento, valor, data e
+        # fornecedor. Comparar só nome, tipo e valor juntaria pagamentos
+        # recorrentes iguais de meses ou fornecedores diferentes
         antes = len(df)
-        df = df.drop_duplicates()
+        chave = colunas_necessarias + [c for c in self.COLUNAS_DUPLICATA
+                                       if c in self.df_original.columns]
+        duplicadas = self.df_original.duplicated(subset=chave)
+        df = df[~duplicadas.loc[df.index].to_numpy()]
         removidos_duplicatas = antes - len(df)
         
         # Renomear colunas para facilitar análise
@@ -142,6 +176,94 @@ class DataLoader:
         
         return self.df_limpo
     
+    def _calcular_ano_mes(self, df: pd.DataFrame):
+        """
+        Calcula a competência de cada registro como inteiro AAAAMM
+        
+        Usa numAno/numMes (o mês de referência da cota) e, onde faltarem,
+        o mês de datEmissao. As datas são convertidas com formato explícito
+        e apenas uma vez por valor distinto.
+        
+        Args:
+            df: Registros originais (colunas numAno, numMes e/ou datEmissao)
+            
+        Returns:
+            Array int32 com AAAAMM (0 = sem data), ou None se o CSV não
+            tiver nenhuma das colunas de data
+        """
+        if not {'numAno', 'numMes'} <= set(df.columns) and 'datEmissao' not in df.columns:
+            return None
+        
+        ano_mes = np.zeros(len(df), dtype=np.int32)
+        
+        if {'numAno', 'numMes'} <= set(df.columns):
+            ano = pd.to_numeric(df['numAno'], errors='coerce').to_numpy()
+            mes = pd.to_numeric(df['numMes'], errors='coerce').to_numpy()
+            validos = (ano > 0) & (mes >= 1) & (mes <= 12)
+            ano_mes[validos] = (ano[validos] * 100 + mes[validos]).astype(np.int32)
+        
+        faltantes = ano_mes == 0
+        if 'datEmissao' in df.columns and faltantes.any():
+            # Poucas datas distintas: converter cada valor uma única vez
+            codigos, datas = pd.factorize(df['datEmissao'].to_numpy()[faltantes])
+            convertidas = pd.to_datetime(pd.Series(datas, dtype=object),
+                                         format=self.FORMATO_DATA, errors='coerce')
+            valores = (convertidas.dt.year * 100 + convertidas.dt.month).fillna(0)
+            valores = np.append(valores.to_numpy(dtype=np.int32), 0)
+            ano_mes[faltantes] = valores.take(codigos)
+        
+        return ano_mes
+    
+    @classmethod
+    def codificar_documentos(cls, documentos: pd.Series) -> np.ndarray:
+        """
+        Normaliza CNPJ/CPF para chaves int64
+        
+        Pontuação é descartada e a normalização roda uma vez por documento
+        distinto. Valores que não têm 11 nem 14 dígitos são tratados como
+        sem documento. CPFs (11 dígitos) recebem DESLOCAMENTO_CPF, para que um
+        CPF nunca coincida com um CNPJ (14 dígitos) de mesmos dígitos
+        significativos; `formatar_documento` faz o caminho inverso.
+        
+        Args:
+            documentos: Coluna txtCNPJCPF (texto)
+            
+        Returns:
+            Array int64 com a chave de cada registro (0 = sem documento)
+        """
+        codigos, unicos = pd.factorize(documentos)
+        digitos = pd.Series(unicos, dtype=object).astype(str).str.replace(r'\D', '', regex=True)
+        tamanho = digitos.str.len().to_numpy()
+        
+        # Apenas CPF (11) e CNPJ (14) viram chave; outros tamanhos (códigos
+        # curtos, lixo longo que estouraria o int64) ficam como sem documento
+        validos = (tamanho == 11) | (tamanho == 14)
+        chaves = np.zeros(len(digitos), dtype=np.int64)
+        chaves[validos] = digitos[validos].astype(np.int64).to_numpy()
+        chaves[tamanho == 11] += cls.DESLOCAMENTO_CPF
+        
+        # Código -1 (documento ausente) alcança o 0 anexado ao final
+        return np.append(chaves, 0).take(codigos)
+    
+    @classmethod
+    def formatar_documento(cls, chave: int) -> str:
+        """
+        Formata uma chave de fornecedor como CNPJ ou CPF
+        
+        Args:
+            chave: Chave gerada por `codificar_documentos`
+            
+        Returns:
+            CNPJ (00.000.000/0000-00), CPF (000.000.000-00) ou "" sem documento
+        """
+        if chave <= 0:
+            return ""
+        if chave >= cls.DESLOCAMENTO_CPF:
+            d = f"{chave - cls.DESLOCAMENTO_CPF:011d}"
+            return f"{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}"
+        d = f"{chave:014d}"
+        return f"{d[:2]}.{d[2:5]}.{d[5:8]}/{d[8:12]}-{d[12:]}"
+    
     @staticmethod
     def _padronizar_nome(nome: str) -> str:
         """
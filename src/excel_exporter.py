@@ -0,0 +1,131 @@
+"""
+Exportação do Relatório para Excel
+
+Este módulo grava o relatório em uma planilha .xlsx com uma aba por
+análise agregada e, opcionalmente, os registros cruzados completos. O
+openpyxl é usado em modo somente escrita (streaming): as linhas vão para
+o arquivo à medida que são adicionadas, então a memória não cresce com o
+número de registros.
+"""
+
+import pandas as pd
+from pathlib import Path
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+from profiler import instrumentar
+
+
+@instrumentar
+class ExcelExporter:
+    """Exporta as tabelas do relatório para uma planilha Excel"""
+
+    # Linhas por aba no Excel (incluindo o cabeçalho)
+    MAX_LINHAS_ABA = 1_048_576
+
+    # Registros convertidos por vez ao gravar os dados completos
+    TAMANHO_BLOCO = 50_000
+
+    # (chave do relatório, nome da aba)
+    ABAS = [
+        ('por_partido', 'Por Partido'),
+        ('por_estado', 'Por Estado'),
+        ('por_tipo_despesa', 'Tipos de Despesa'),
+        ('top_deputados', 'Top Deputados'),
+        ('evolucao_mensal', 'Evolução Mensal'),
+        ('top_fornecedores', 'Top Fornecedores'),
+        ('concentracao_fornecedores', 'Concentração Fornecedores'),
+    ]
+
+    def __init__(self, relatorio: dict):
+        """
+        Inicializa o exportador
+
+        Args:
+            relatorio: Dicionário com os DataFrames das análises
+        """
+        self.relatorio = relatorio
+        self.estilo_cabecalho = {
+            'font': Font(bold=True, color='FFFFFF'),
+            'fill': PatternFill('solid', start_color='1F4E79'),
+        }
+
+    def exportar(self, arquivo: Path, incluir_registros: bool = False) -> Path:
+        """
+        Grava a planilha
+
+        Args:
+            arquivo: Caminho do arquivo .xlsx
+            incluir_registros: Se deve incluir os dados cruzados completos,
+                divididos em abas "Registros", "Registros 2", ... quando
+                excederem o limite de linhas do Excel
+
+        Returns:
+            Caminho do arquivo gravado
+        """
+        print("\n📗 Exportando planilha Excel...")
+
+        wb = Workbook(write_only=True)
+
+        for chave, titulo in self.ABAS:
+            df = self.relatorio.get(chave)
+            if df is not None:
+                self._gravar_aba(wb, titulo, df, [(0, len(df))])
+
+        cruzamento = self.relatorio.get('cruzamento')
+        if cruzamento is not None and len(cruzamento.correspondencias_aproximadas) > 0:
+            df = cruzamento.correspondencias_aproximadas
+            self._gravar_aba(wb, 'Nomes Aproximados', df, [(0, len(df))])
+
+        if incluir_registros:
+            df = self.relatorio['dados_cruzados']
+            por_aba = self.MAX_LINHAS_ABA - 1
+            for numero, inicio in enumerate(range(0, max(len(df), 1), por_aba), start=1):
+                titulo = 'Registros' if numero == 1 else f'Registros {numero}'
+                fim = min(inicio + por_aba, len(df))
+                blocos = [(i, min(i + self.TAMANHO_BLOCO, fim))
+                          for i in range(inicio, fim, self.TAMANHO_BLOCO)]
+                self._gravar_aba(wb, titulo, df, blocos)
+
+        arquivo = Path(arquivo)
+        wb.save(arquivo)
+        print(f"✅ Planilha salva: {arquivo} ({len(wb.worksheets)} abas)")
+        return arquivo
+
+    def _gravar_aba(self, wb: Workbook, titulo: str, df: pd.DataFrame, blocos: list) -> None:
+        """
+        Cria uma aba e grava o cabeçalho e os intervalos de linhas indicados
+
+        Args:
+            wb: Planilha em modo somente escrita
+            titulo: Nome da aba
+            df: Tabela de origem
+            blocos: Intervalos (início, fim) de linhas de `df` a gravar, em ordem
+        """
+        ws = wb.create_sheet(title=titulo)
+        ws.freeze_panes = 'A2'
+        for posicao, coluna in enumerate(df.columns, start=1):
+            largura = max(12, min(40, len(str(coluna)) + 4))
+            ws.column_dimensions[get_column_letter(posicao)].width = largura
+
+        cabecalho = []
+        for coluna in df.columns:
+            celula = WriteOnlyCell(ws, value=str(coluna))
+            celula.font = self.estilo_cabecalho['font']
+            celula.fill = self.estilo_cabecalho['fill']
+            cabecalho.append(celula)
+        ws.append(cabecalho)
+
+        for inicio, fim in blocos:
+            # Objetos Python nativos; valores ausentes viram células vazias
+            bloco = df.iloc[inicio:fim].astype(object)
+            bloco = bloco.where(bloco.notna(), None)
+            for linha in bloco.itertuples(index=False, name=None):
+                ws.append(linha)
+
+
+if __name__ == '__main__':
+    print("Este módulo deve ser importado, não executado diretamente.")
+    print("Use: from excel_exporter import ExcelExporter")
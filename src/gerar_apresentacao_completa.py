@@ -9,7 +9,10 @@ from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from PIL import Image
 import pandas as pd
+import hashlib
+import io
 import os
 from datetime import datetime
 
@@ -17,16 +20,27 @@ from datetime import datetime
 class ApresentacaoAnalise:
     """Classe para gerar apresentação PowerPoint completa."""
     
-    def __init__(self, pasta_execucao, output_path=None):
+    def __init__(self, pasta_execucao, output_path=None, relatorio=None, dpi_imagens=150):
         """
         Inicializa gerador de apresentação.
         
         Args:
             pasta_execucao: Caminho da pasta com resultados da execução
             output_path: Caminho customizado para salvar (opcional)
+            relatorio: Relatório do DataAnalyzer já em memória (opcional).
+                Sem ele, as tabelas são lidas dos CSVs da pasta de execução.
+            dpi_imagens: Resolução das imagens no tamanho em que aparecem no
+                slide; None embute os arquivos originais (padrão: 150)
         """
         self.pasta_execucao = pasta_execucao
         self.output_path = output_path
+        self.relatorio = relatorio
+        self.dpi_imagens = dpi_imagens
+        self._tabelas = {}
+        self._imagens = {}
+        self.estatisticas_imagens = {
+            'imagens': 0, 'reaproveitadas': 0, 'bytes_originais': 0, 'bytes_embutidos': 0
+        }
         self.prs = Presentation()
         self.prs.slide_width = Inches(10)
         self.prs.slide_height = Inches(7.5)
@@ -96,12 +110,64 @@ class ApresentacaoAnalise:
         return slide
     
     def adicionar_imagem(self, slide, caminho_imagem, left, top, width, height):
-        """Adiciona imagem ao slide."""
+        """Adiciona imagem ao slide, preparada para o tamanho ocupado."""
         if os.path.exists(caminho_imagem):
-            slide.shapes.add_picture(caminho_imagem, left, top, width=width, height=height)
+            imagem = self.preparar_imagem(caminho_imagem, width, height)
+            slide.shapes.add_picture(imagem, left, top, width=width, height=height)
             return True
         return False
     
+    def preparar_imagem(self, caminho_imagem, width, height):
+        """
+        Reduz a imagem à resolução em que será exibida no slide.
+        
+        A imagem é redimensionada para o tamanho ocupado no slide a
+        `dpi_imagens` e recomprimida; só é usada se ficar menor que a
+        original. Imagens com o mesmo conteúdo e tamanho são processadas
+        uma única vez, e o python-pptx armazena blobs idênticos uma única
+        vez no pacote.
+        
+        Args:
+            caminho_imagem: Caminho da imagem original
+            width: Largura ocupada no slide
+            height: Altura ocupada no slide
+            
+        Returns:
+            Fluxo em memória com a imagem a embutir
+        """
+        with open(caminho_imagem, 'rb') as f:
+            original = f.read()
+        
+        self.estatisticas_imagens['imagens'] += 1
+        
+        if self.dpi_imagens is None:
+            tamanho = None
+        else:
+            tamanho = (max(1, round(width.inches * self.dpi_imagens)),
+                       max(1, round(height.inches * self.dpi_imagens)))
+        chave = (hashlib.sha256(original).hexdigest(), tamanho)
+        
+        if chave in self._imagens:
+            self.estatisticas_imagens['reaproveitadas'] += 1
+            return io.BytesIO(self._imagens[chave])
+        
+        dados = original
+        if tamanho is not None:
+            with Image.open(io.BytesIO(original)) as imagem:
+                # Só reduzir: ampliar não acrescenta detalhe
+                if imagem.width > tamanho[0] and imagem.height > tamanho[1]:
+                    imagem = imagem.resize(tamanho, Image.LANCZOS)
+                saida = io.BytesIO()
+                imagem.save(saida, format='PNG', optimize=True)
+            if saida.tell() < len(original):
+                dados = saida.getvalue()
+        
+        # Bytes contados uma vez por imagem distinta, como ficam no pacote
+        self._imagens[chave] = dados
+        self.estatisticas_imagens['bytes_originais'] += len(original)
+        self.estatisticas_imagens['bytes_embutidos'] += len(dados)
+        return io.BytesIO(dados)
+    
     def adicionar_texto(self, slide, texto, left, top, width, height, tamanho=14, negrito=False, cor=None):
         """Adiciona caixa de texto ao slide."""
         txBox = slide.shapes.add_textbox(left, top, width, height)
@@ -117,6 +183,30 @@ class ApresentacaoAnalise:
             p.font.color.rgb = self.cor_texto
         return txBox
     
+    def carregar_tabela(self, chave, nome_csv):
+        """
+        Obtém uma tabela agregada para os slides de insights.
+        
+        Usa o relatório em memória quando disponível; caso contrário lê
+        (uma única vez) o CSV correspondente da pasta de execução.
+        
+        Args:
+            chave: Chave da tabela no relatório (ex.: 'por_partido')
+            nome_csv: Nome do CSV salvo pela execução (ex.: 'gastos_por_partido.csv')
+            
+        Returns:
+            DataFrame com a tabela, ou None se não estiver disponível
+        """
+        if self.relatorio is not None and chave in self.relatorio:
+            return self.relatorio[chave]
+        
+        if chave not in self._tabelas:
+            csv_path = os.path.join(self.pasta_execucao, nome_csv)
+            self._tabelas[chave] = (
+                pd.read_csv(csv_path, encoding='utf-8-sig') if os.path.exists(csv_path) else None
+            )
+        return self._tabelas[chave]
+    
     def slide_1_capa(self):
         """Slide 1: Capa."""
         self.criar_slide_titulo(
@@ -266,22 +356,19 @@ class ApresentacaoAnalise:
         """Slide 10: Insights sobre Partidos."""
         slide = self.criar_slide_conteudo("Insights - Gastos por Partido")
         
-        # Tentar carregar dados
-        csv_path = os.path.join(self.pasta_execucao, "gastos_por_partido.csv")
-        if os.path.exists(csv_path):
-            df = pd.read_csv(csv_path)
-            
+        df = self.carregar_tabela('por_partido', "gastos_por_partido.csv")
+        if df is not None:
             if len(df) > 0:
                 top1 = df.iloc[0]
-                total_geral = df['valor_total'].sum()
-                percentual_top1 = (top1['valor_total'] / total_geral * 100)
+                total_geral = df['total_gasto'].sum()
+                percentual_top1 = (top1['total_gasto'] / total_geral * 100)
                 
                 insights = [
                     f"Partido com maior gasto: {top1['partido']}",
-                    f"Valor total: R$ {top1['valor_total']:,.2f}",
+                    f"Valor total: R$ {top1['total_gasto']:,.2f}",
                     f"Representa {percentual_top1:.1f}% do total geral",
                     f"Total de partidos analisados: {len(df)}",
-                    f"Gasto médio por partido: R$ {df['valor_total'].mean():,.2f}"
+                    f"Gasto médio por partido: R$ {df['total_gasto'].mean():,.2f}"
                 ]
                 
                 y_pos = 2.2
@@ -297,21 +384,19 @@ class ApresentacaoAnalise:
         """Slide 11: Insights sobre Estados."""
         slide = self.criar_slide_conteudo("Insights - Gastos por Estado")
         
-        csv_path = os.path.join(self.pasta_execucao, "gastos_por_estado.csv")
-        if os.path.exists(csv_path):
-            df = pd.read_csv(csv_path)
-            
+        df = self.carregar_tabela('por_estado', "gastos_por_estado.csv")
+        if df is not None:
             if len(df) > 0:
                 top1 = df.iloc[0]
-                total_geral = df['valor_total'].sum()
-                percentual_top1 = (top1['valor_total'] / total_geral * 100)
+                total_geral = df['total_gasto'].sum()
+                percentual_top1 = (top1['total_gasto'] / total_geral * 100)
                 
                 insights = [
-                    f"Estado com maior gasto: {top1['estado']}",
-                    f"Valor total: R$ {top1['valor_total']:,.2f}",
+                    f"Estado com maior gasto: {top1['uf']}",
+                    f"Valor total: R$ {top1['total_gasto']:,.2f}",
                     f"Representa {percentual_top1:.1f}% do total nacional",
                     f"Total de estados: {len(df)}",
-                    f"Gasto médio por estado: R$ {df['valor_total'].mean():,.2f}"
+                    f"Gasto médio por estado: R$ {df['total_gasto'].mean():,.2f}"
                 ]
                 
                 y_pos = 2.2
@@ -327,19 +412,17 @@ class ApresentacaoAnalise:
         """Slide 12: Insights sobre Deputados."""
         slide = self.criar_slide_conteudo("Insights - Top Deputados")
         
-        csv_path = os.path.join(self.pasta_execucao, "top_deputados.csv")
-        if os.path.exists(csv_path):
-            df = pd.read_csv(csv_path)
-            
+        df = self.carregar_tabela('top_deputados', "top_deputados.csv")
+        if df is not None:
             if len(df) > 0:
                 top1 = df.iloc[0]
                 
                 insights = [
-                    f"Deputado com maior gasto: {top1['nome']}",
-                    f"Partido: {top1['partido']} | Estado: {top1['estado']}",
-                    f"Valor total: R$ {top1['valor_total']:,.2f}",
-                    f"Média do Top 20: R$ {df['valor_total'].mean():,.2f}",
-                    f"Amplitude: R$ {df['valor_total'].max() - df['valor_total'].min():,.2f}"
+                    f"Deputado com maior gasto: {top1['nome_deputado']}",
+                    f"Partido: {top1['partido']} | Estado: {top1['uf']}",
+                    f"Valor total: R$ {top1['total_gasto']:,.2f}",
+                    f"Média do Top 20: R$ {df['total_gasto'].mean():,.2f}",
+                    f"Amplitude: R$ {df['total_gasto'].max() - df['total_gasto'].min():,.2f}"
                 ]
                 
                 y_pos = 2.2
@@ -355,9 +438,9 @@ class ApresentacaoAnalise:
         """Slide 13: Tabela Top 5 Partidos."""
         slide = self.criar_slide_conteudo("Top 5 Partidos - Detalhamento")
         
-        csv_path = os.path.join(self.pasta_execucao, "gastos_por_partido.csv")
-        if os.path.exists(csv_path):
-            df = pd.read_csv(csv_path).head(5)
+        df = self.carregar_tabela('por_partido', "gastos_por_partido.csv")
+        if df is not None:
+            df = df.head(5)
             
             # Criar tabela
             rows, cols = len(df) + 1, 2
@@ -384,9 +467,9 @@ class ApresentacaoAnalise:
                 paragraph.alignment = PP_ALIGN.CENTER
             
             # Dados
-            for i, row in df.iterrows():
+            for i, (_, row) in enumerate(df.iterrows()):
                 table.cell(i + 1, 0).text = str(row['partido'])
-                table.cell(i + 1, 1).text = f"R$ {row['valor_total']:,.2f}"
+                table.cell(i + 1, 1).text = f"R$ {row['total_gasto']:,.2f}"
                 
                 # Formatar células
                 for col in range(cols):
@@ -493,7 +576,13 @@ class ApresentacaoAnalise:
         print("=" * 60)
         print(f"✅ Apresentação salva em: {output_file}")
         print(f"📊 Total de slides: 15")
-        print(f"📁 Tamanho: {os.path.getsize(output_file) / 1024 / 1024:.2f} MB\n")
+        estatisticas = self.estatisticas_imagens
+        if estatisticas['imagens']:
+            print(f"🖼️  Imagens: {estatisticas['imagens']} "
+                  f"({estatisticas['reaproveitadas']} reaproveitadas) | "
+                  f"imagens distintas: {estatisticas['bytes_originais'] / 1024 / 1024:.2f} MB "
+                  f"originais → {estatisticas['bytes_embutidos'] / 1024 / 1024:.2f} MB embutidos")
+        print(f"📁 Tamanho do .pptx: {os.path.getsize(output_file) / 1024 / 1024:.2f} MB\n")
         
         return output_file
 
@@ -21,13 +21,16 @@ import sys
 import argparse
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 # Importar módulos do projeto
+# (Visualizer e ApresentacaoAnalise são importados apenas quando usados,
+# pois carregam matplotlib/seaborn e python-pptx)
 from api_client import CamaraAPI
 from data_loader import DataLoader
 from data_analyzer import DataAnalyzer
-from visualizer import Visualizer
-from gerar_apresentacao_completa import ApresentacaoAnalise
+from pipeline import Etapa, Pipeline
+import profiler
 
 
 def print_header():
@@ -40,62 +43,150 @@ def print_header():
     print("=" * 80 + "\n")
 
 
-def salvar_resultados(relatorio: dict, output_dir: str = 'resultados'):
+def criar_pasta_execucao(output_dir: str = 'resultados') -> Path:
     """
-    Salva os resultados das análises em arquivos CSV
+    Cria a pasta com timestamp desta execução
     
     Args:
-        relatorio: Dicionário com DataFrames das análises
         output_dir: Diretório de saída
+        
+    Returns:
+        Caminho da pasta criada
     """
-    print("\n" + "=" * 70)
-    print("💾 SALVANDO RESULTADOS")
-    
-    # Criar pasta com timestamp para esta execução
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     execution_dir = Path(output_dir) / f'execucao_{timestamp}'
     execution_dir.mkdir(parents=True, exist_ok=True)
     print(f"📁 Pasta de execução: {execution_dir}")
+    return execution_dir
+
+
+# Formatos do arquivo com os dados cruzados completos: (extensão, dependência opcional)
+FORMATOS_COMPLETO = {
+    'csv': ('.csv', None),
+    'csv.gz': ('.csv.gz', None),
+    'csv.zst': ('.csv.zst', 'zstandard'),
+    'parquet': ('.parquet', 'pyarrow'),
+    'nenhum': (None, None),
+}
+
+
+def verificar_formato_completo(formato: str) -> None:
+    """
+    Verifica se a dependência opcional do formato está instalada
+    
+    Args:
+        formato: Formato do arquivo completo (ver FORMATOS_COMPLETO)
+        
+    Raises:
+        ImportError: Se a biblioteca necessária não estiver instalada
+    """
+    import importlib.util
+    
+    dependencia = FORMATOS_COMPLETO[formato][1]
+    if dependencia and importlib.util.find_spec(dependencia) is None:
+        raise ImportError(
+            f"O formato '{formato}' requer o pacote '{dependencia}' "
+            f"(pip install {dependencia})"
+        )
+
+
+def _salvar_completo(df, filename: Path, formato: str) -> None:
+    """Salva os dados cruzados completos no formato escolhido"""
+    if formato == 'parquet':
+        df.to_parquet(filename, index=False)
+    elif formato == 'csv.gz':
+        # Nível 1: ~5x menor que o CSV, com pouco custo extra de CPU
+        df.to_csv(filename, index=False, encoding='utf-8',
+                  compression={'method': 'gzip', 'compresslevel': 1})
+    elif formato == 'csv.zst':
+        df.to_csv(filename, index=False, encoding='utf-8', compression='zstd')
+    else:
+        df.to_csv(filename, index=False, encoding='utf-8-sig')
+
+
+def salvar_resultados(relatorio: dict, execution_dir: Path, formato_completo: str = 'csv') -> list:
+    """
+    Salva os resultados das análises
+    
+    As tabelas são gravadas em paralelo (threads): o arquivo completo,
+    de longe o maior, não atrasa as tabelas agregadas, e a compressão
+    gzip/zstd e a escrita em disco liberam o GIL.
+    
+    Args:
+        relatorio: Dicionário com DataFrames das análises
+        execution_dir: Pasta da execução atual
+        formato_completo: Formato dos dados cruzados completos
+            ('csv', 'csv.gz', 'csv.zst' ou 'parquet', ou 'nenhum' para não
+            exportá-los); as tabelas agregadas são sempre CSV
+        
+    Returns:
+        Lista com os caminhos dos arquivos salvos
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    print("\n" + "=" * 70)
+    print("💾 SALVANDO RESULTADOS")
     print("=" * 70)
     
-    # Salvar cada análise
-    arquivos_salvos = []
-    
-    # 1. Dados cruzados completos
-    filename = execution_dir / 'analise_completa.csv'
-    relatorio['dados_cruzados'].to_csv(filename, index=False, encoding='utf-8-sig')
-    arquivos_salvos.append(filename)
-    print(f"✅ {filename}")
-    
-    # 2. Análise por partido
-    filename = execution_dir / 'gastos_por_partido.csv'
-    relatorio['por_partido'].to_csv(filename, index=False, encoding='utf-8-sig')
-    arquivos_salvos.append(filename)
-    print(f"✅ {filename}")
-    
-    # 3. Análise por estado
-    filename = execution_dir / 'gastos_por_estado.csv'
-    relatorio['por_estado'].to_csv(filename, index=False, encoding='utf-8-sig')
-    arquivos_salvos.append(filename)
-    print(f"✅ {filename}")
-    
-    # 4. Análise por tipo de despesa
-    filename = execution_dir / 'gastos_por_tipo_despesa.csv'
-    relatorio['por_tipo_despesa'].to_csv(filename, index=False, encoding='utf-8-sig')
-    arquivos_salvos.append(filename)
-    print(f"✅ {filename}")
-    
-    # 5. Top deputados
-    filename = execution_dir / 'top_deputados.csv'
-    relatorio['top_deputados'].to_csv(filename, index=False, encoding='utf-8-sig')
-    arquivos_salvos.append(filename)
-    print(f"✅ {filename}")
+    def salvar_csv(df, filename):
+        df.to_csv(filename, index=False, encoding='utf-8-sig')
+    
+    tarefas = []
+    
+    # 1. Dados cruzados completos (o maior arquivo; opcional)
+    extensao = FORMATOS_COMPLETO[formato_completo][0]
+    if extensao is not None:
+        tarefas.append((execution_dir / f'analise_completa{extensao}',
+                        lambda f: _salvar_completo(relatorio['dados_cruzados'], f, formato_completo)))
+    
+    tarefas += [
+        # 2. Análise por partido
+        (execution_dir / 'gastos_por_partido.csv',
+         lambda f: salvar_csv(relatorio['por_partido'], f)),
+        # 3. Análise por estado
+        (execution_dir / 'gastos_por_estado.csv',
+         lambda f: salvar_csv(relatorio['por_estado'], f)),
+        # 4. Análise por tipo de despesa
+        (execution_dir / 'gastos_por_tipo_despesa.csv',
+         lambda f: salvar_csv(relatorio['por_tipo_despesa'], f)),
+        # 5. Top deputados
+        (execution_dir / 'top_deputados.csv',
+         lambda f: salvar_csv(relatorio['top_deputados'], f)),
+    ]
+    
+    # 6. Análises opcionais: evolução mensal (competência) e fornecedores (CNPJ/CPF)
+    opcionais = [
+        ('evolucao_mensal', 'gastos_por_mes.csv'),
+        ('top_fornecedores', 'top_fornecedores.csv'),
+        ('concentracao_fornecedores', 'concentracao_fornecedores.csv'),
+    ]
+    for chave, nome in opcionais:
+        if chave in relatorio:
+            tarefas.append((execution_dir / nome,
+                            lambda f, chave=chave: salvar_csv(relatorio[chave], f)))
+    
+    # 7. Auditoria dos nomes resolvidos por similaridade
+    cruzamento = relatorio.get('cruzamento')
+    if cruzamento is not None and len(cruzamento.correspondencias_aproximadas) > 0:
+        tarefas.append((execution_dir / 'auditoria_nomes.csv',
+                        lambda f: salvar_csv(cruzamento.correspondencias_aproximadas, f)))
+    
+    with ThreadPoolExecutor(max_workers=len(tarefas)) as pool:
+        futuros = [pool.submit(salvar, filename) for filename, salvar in tarefas]
+        for futuro in futuros:
+            futuro.result()
+    
+    arquivos_salvos = [filename for filename, _ in tarefas]
+    for filename in arquivos_salvos:
+        print(f"✅ {filename}")
+    if extensao is None:
+        print("⏭️  Dados completos não exportados (--formato-completo nenhum)")
     
     print("\n" + "=" * 70)
     print(f"✅ {len(arquivos_salvos)} ARQUIVOS SALVOS EM: {execution_dir}/")
     print("=" * 70)
     
-    return arquivos_salvos, execution_dir
+    return arquivos_salvos
 
 
 def exibir_resumo_final(relatorio: dict):
@@ -111,7 +202,7 @@ def exibir_resumo_final(relatorio: dict):
     
     # Estatísticas gerais
     df_cruzado = relatorio['dados_cruzados']
-    df_cruzado_limpo = df_cruzado[df_cruzado['partido'] != 'NÃO IDENTIFICADO']
+    df_cruzado_limpo = df_cruzado[relatorio['cruzamento'].mascara_identificados]
     
     total_gasto = df_cruzado_limpo['valor'].sum()
     num_deputados = df_cruzado_limpo['nome_deputado'].nunique()
@@ -156,21 +247,25 @@ def exibir_resumo_final(relatorio: dict):
     print("\n" + "=" * 80)
 
 
-def gerar_apresentacao(execution_dir: Path):
+def gerar_apresentacao(execution_dir: Path, relatorio: Optional[dict] = None):
     """
     Gera apresentação PowerPoint dentro da pasta de execução
     
     Args:
         execution_dir: Pasta da execução atual
+        relatorio: Relatório em memória (evita reler os CSVs salvos)
     """
     try:
+        from gerar_apresentacao_completa import ApresentacaoAnalise
+        
         print("\n📌 Gerando apresentação PowerPoint completa...")
         
         # Definir caminho de saída
         output_file = execution_dir / "Apresentacao_Completa.pptx"
         
         # Gerar apresentação
-        apresentacao = ApresentacaoAnalise(execution_dir, output_path=output_file)
+        apresentacao = ApresentacaoAnalise(execution_dir, output_path=output_file,
+                                           relatorio=relatorio)
         apresentacao.gerar()
         
         print(f"✅ Apresentação salva: {output_file.name}")
@@ -183,6 +278,125 @@ def gerar_apresentacao(execution_dir: Path):
         return False
 
 
+def construir_pipeline(args) -> Pipeline:
+    """
+    Monta o pipeline de etapas da análise
+    
+    Carregamento do CSV, busca na API e criação da pasta de execução rodam
+    em paralelo; depois da análise, o salvamento dos CSVs roda em paralelo
+    com os gráficos, e a apresentação aguarda apenas os gráficos. As
+    etapas de carregamento e análise são memorizadas pela impressão digital
+    das entradas (arquivo CSV, cadastro da API e parâmetros).
+    
+    Args:
+        args: Argumentos da linha de comando
+        
+    Returns:
+        Pipeline pronto para executar
+    """
+    def carregar(csv_path):
+        print("📋 ETAPA 1/8: Carregando dados do CSV")
+        print("-" * 70)
+        loader = DataLoader(csv_path)
+        loader.carregar_csv()
+        df_despesas = loader.limpar_dados()
+        loader.exibir_resumo()
+        return {'df_despesas': df_despesas}
+    
+    def buscar_cadastro():
+        print("\n📋 ETAPA 2/8: Buscando dados cadastrais na API")
+        print("-" * 70)
+        return {'df_deputados': CamaraAPI().buscar_deputados()}
+    
+    def preparar_execucao(output_dir):
+        print("\n📋 ETAPA 3/8: Preparando pasta de execução")
+        print("-" * 70)
+        return {'execution_dir': criar_pasta_execucao(output_dir)}
+    
+    def analisar(df_despesas, df_deputados, limiar_nomes, graficos_por):
+        print("\n📋 ETAPA 4/8: Analisando e cruzando dados")
+        print("-" * 70)
+        analyzer = DataAnalyzer(
+            df_despesas, df_deputados,
+            backend='processos' if args.processos else 'serial',
+            num_processos=args.processos,
+            limiar_similaridade=limiar_nomes
+        )
+        try:
+            relatorio = analyzer.gerar_relatorio_completo()
+            tops_por_grupo = {
+                por: analyzer.analisar_top_deputados(top_n=15, por=por)
+                for por in graficos_por
+            }
+        finally:
+            analyzer.encerrar()
+        return {'relatorio': relatorio, 'tops_por_grupo': tops_por_grupo}
+    
+    def salvar(relatorio, execution_dir):
+        print("\n📋 ETAPA 5/8: Salvando resultados")
+        print("-" * 70)
+        return {'arquivos': salvar_resultados(relatorio, execution_dir,
+                                              formato_completo=args.formato_completo)}
+    
+    def exportar_excel(relatorio, execution_dir):
+        print("\n📋 ETAPA 6/8: Exportando planilha Excel")
+        print("-" * 70)
+        if not args.excel:
+            print("⏭️  Planilha não solicitada (use --excel)")
+            return {'planilha': None}
+        from excel_exporter import ExcelExporter
+        
+        exportador = ExcelExporter(relatorio)
+        arquivo = execution_dir / 'analise_gastos.xlsx'
+        return {'planilha': exportador.exportar(arquivo, incluir_registros=args.excel == 'completo')}
+    
+    def gerar_graficos(relatorio, tops_por_grupo, execution_dir):
+        print("\n📋 ETAPA 7/8: Gerando visualizações")
+        print("-" * 70)
+        if args.skip_charts:
+            print("⏭️  Gráficos ignorados (--skip-charts)")
+            return {'graficos': []}
+        
+        # A etapa roda fora da thread principal: usar backend sem interface gráfica
+        import matplotlib
+        matplotlib.use('Agg')
+        from visualizer import Visualizer
+        
+        visualizer = Visualizer(output_dir=str(execution_dir), perfil=args.perfil,
+                                usar_cache=not args.sem_cache_graficos)
+        graficos = visualizer.gerar_todos_graficos(relatorio)
+        visualizer.gerar_dashboard_html(relatorio)
+        for por, df_top in tops_por_grupo.items():
+            visualizer.gerar_graficos_por_grupo(df_top, por)
+        return {'graficos': graficos}
+    
+    def gerar_pptx(relatorio, execution_dir, graficos):
+        print("\n📋 ETAPA 8/8: Gerando apresentação")
+        print("-" * 70)
+        if args.skip_pptx:
+            print("⏭️  Apresentação ignorada (--skip-pptx)")
+            return {'apresentacao_gerada': False}
+        return {'apresentacao_gerada': gerar_apresentacao(execution_dir, relatorio)}
+    
+    etapas = [
+        Etapa('carregar', carregar, ['csv_path'], ['df_despesas'], memorizar=True, versao=6),
+        Etapa('buscar_cadastro', buscar_cadastro, [], ['df_deputados']),
+        Etapa('preparar_execucao', preparar_execucao, ['output_dir'], ['execution_dir']),
+        Etapa('analisar', analisar,
+              ['df_despesas', 'df_deputados', 'limiar_nomes', 'graficos_por'],
+              ['relatorio', 'tops_por_grupo'], memorizar=True, versao=7),
+        Etapa('salvar', salvar, ['relatorio', 'execution_dir'], ['arquivos']),
+        Etapa('excel', exportar_excel, ['relatorio', 'execution_dir'], ['planilha']),
+        Etapa('graficos', gerar_graficos, ['relatorio', 'tops_por_grupo', 'execution_dir'],
+              ['graficos']),
+        Etapa('apresentacao', gerar_pptx, ['relatorio', 'execution_dir', 'graficos'],
+              ['apresentacao_gerada']),
+    ]
+    
+    cache_dir = None if args.sem_cache_etapas else Path(args.output) / '.cache_etapas'
+    return Pipeline(etapas, cache_dir=cache_dir)
+
+
 def main():
     """Função principal do programa"""
     
@@ -194,6 +408,10 @@ def main():
 Exemplos de uso:
   python main.py dados/Ano-2023.csv
   python main.py "C:/Downloads/Ano-2023.csv"
+  python main.py dados/Ano-2023.csv --processos 4
+  python main.py dados/Ano-2023.csv --skip-charts --skip-pptx
+  python main.py dados/Ano-2023.csv --graficos-por uf --graficos-por partido
+  python main.py dados/Ano-2023.csv --excel agregados
   
 Para baixar os dados:
   https://www.camara.leg.br/cota-parlamentar/
@@ -211,60 +429,142 @@ Para baixar os dados:
         help='Diretório para salvar os resultados (padrão: resultados)'
     )
     
+    parser.add_argument(
+        '--processos', '-p',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Executa as agregações em N processos paralelos (padrão: serial)'
+    )
+    
+    parser.add_argument(
+        '--limiar-nomes',
+        type=float,
+        default=0,
+        metavar='L',
+        help='Similaridade mínima (0 a 1) para resolver nomes sem correspondência '
+             'exata no cadastro, ex.: 0.85 (padrão: 0, desativado)'
+    )
+    
+    parser.add_argument(
+        '--formato-completo',
+        choices=list(FORMATOS_COMPLETO),
+        default='csv',
+        help='Formato dos dados cruzados completos (analise_completa): csv, csv.gz, '
+             'csv.zst (requer zstandard), parquet (requer pyarrow) ou nenhum '
+             '(apenas as tabelas agregadas) (padrão: csv)'
+    )
+    
+    parser.add_argument(
+        '--excel',
+        choices=['agregados', 'completo'],
+        default=None,
+        help='Exporta analise_gastos.xlsx com uma aba por análise; "completo" inclui '
+             'os registros cruzados (divididos a cada 1.048.575 linhas)'
+    )
+    
+    parser.add_argument(
+        '--sem-cache-graficos',
+        action='store_true',
+        help='Renderiza todos os gráficos, ignorando o cache de execuções anteriores'
+    )
+    
+    parser.add_argument(
+        '--sem-cache-etapas',
+        action='store_true',
+        help='Reexecuta o carregamento e a análise, ignorando os resultados '
+             'memorizados de execuções anteriores'
+    )
+    
+    parser.add_argument(
+        '--perfil',
+        choices=['rascunho', 'impressao', 'vetorial'],
+        default='impressao',
+        help='Perfil de renderização dos gráficos: rascunho (100 DPI), '
+             'impressao (300 DPI) ou vetorial (SVG/PDF + PNG 150 DPI) (padrão: impressao)'
+    )
+    
+    parser.add_argument(
+        '--graficos-por',
+        choices=['uf', 'partido'],
+        action='append',
+        default=[],
+        help='Gera também um gráfico de top deputados por estado ou partido, '
+             'com índice em por_<grupo>/indice.csv (pode ser repetido)'
+    )
+    
+    parser.add_argument(
+        '--perfil-execucao',
+        action='store_true',
+        help='Exibe ao final o tempo, a CPU e o pico de memória por etapa e por método '
+             '(sempre gravados em perfil_execucao.json)'
+    )
+    
+    parser.add_argument(
+        '--skip-charts',
+        action='store_true',
+        help='Não gera os gráficos (nem carrega matplotlib/seaborn)'
+    )
+    
+    parser.add_argument(
+        '--skip-pptx',
+        action='store_true',
+        help='Não gera a apresentação PowerPoint (nem carrega python-pptx)'
+    )
+    
     # Parse dos argumentos
     args = parser.parse_args()
     
+    try:
+        verificar_formato_completo(args.formato_completo)
+    except ImportError as e:
+        parser.error(str(e))
+    
     # Exibir cabeçalho
     print_header()
     
     try:
-        # ETAPA 1: Carregar e limpar dados do CSV
-        print("📋 ETAPA 1/5: Carregando dados do CSV")
-        print("-" * 70)
-        loader = DataLoader(args.csv_path)
-        loader.carregar_csv()
-        df_despesas = loader.limpar_dados()
-        loader.exibir_resumo()
-        
-        # ETAPA 2: Buscar dados cadastrais na API
-        print("\n📋 ETAPA 2/5: Buscando dados cadastrais na API")
-        print("-" * 70)
-        api = CamaraAPI()
-        df_deputados = api.buscar_deputados()
-        
-        # ETAPA 3: Analisar e cruzar dados
-        print("\n📋 ETAPA 3/5: Analisando e cruzando dados")
-        print("-" * 70)
-        analyzer = DataAnalyzer(df_despesas, df_deputados)
-        relatorio = analyzer.gerar_relatorio_completo()
-        
-        # ETAPA 4: Salvar resultados
-        print("\n📋 ETAPA 4/5: Salvando resultados")
-        print("-" * 70)
-        arquivos, execution_dir = salvar_resultados(relatorio, output_dir=args.output)
-        
-        # ETAPA 5: Gerar visualizações
-        print("\n📋 ETAPA 5/6: Gerando visualizações")
-        print("-" * 70)
-        visualizer = Visualizer(output_dir=str(execution_dir))
-        visualizer.gerar_todos_graficos(relatorio)
-        
-        # ETAPA 6: Gerar apresentação PowerPoint
-        print("\n📋 ETAPA 6/6: Gerando apresentação")
-        print("-" * 70)
-        gerar_apresentacao(execution_dir)
+        perfil_execucao = profiler.ativar()
+        pipeline = construir_pipeline(args)
+        resultado = pipeline.executar({
+            'csv_path': Path(args.csv_path),
+            'output_dir': args.output,
+            'limiar_nomes': args.limiar_nomes,
+            'graficos_por': [] if args.skip_charts else args.graficos_por,
+        })
+        relatorio = resultado['relatorio']
+        execution_dir = resultado['execution_dir']
+        arquivos = resultado['arquivos']
+        graficos = resultado['graficos']
+        tops_por_grupo = resultado['tops_por_grupo']
+        apresentacao_gerada = resultado['apresentacao_gerada']
+        planilha = resultado['planilha']
         
         # Exibir resumo final
         exibir_resumo_final(relatorio)
         
+        profiler.desativar()
+        perfil_execucao.salvar(execution_dir / 'perfil_execucao.json')
+        if args.perfil_execucao:
+            perfil_execucao.exibir()
+        else:
+            pipeline.exibir_tempos()
+        
         # Mensagem de sucesso
         print("\n" + "=" * 80)
         print("  ✅ ANÁLISE CONCLUÍDA COM SUCESSO!")
         print("=" * 80)
         print(f"\n  📁 Resultados salvos em: {execution_dir.absolute()}/")
         print(f"  📊 {len(arquivos)} arquivos CSV gerados")
-        print(f"  📈 5 gráficos gerados (formato PNG)")
-        print(f"  📑 1 apresentação PowerPoint gerada")
+        if planilha:
+            print(f"  📗 1 planilha Excel ({planilha.name})")
+        print(f"  📈 {len(graficos)} gráficos gerados (perfil {args.perfil})")
+        if graficos:
+            print(f"  🌐 1 dashboard interativo (dashboard.html)")
+        for por in tops_por_grupo:
+            print(f"  🗂️  Gráficos por {por} em por_{por}/ (índice: por_{por}/indice.csv)")
+        if apresentacao_gerada:
+            print(f"  📑 1 apresentação PowerPoint gerada")
         print("\n" + "=" * 80 + "\n")
         
     except FileNotFoundError as e:
@@ -0,0 +1,155 @@
+"""
+Correspondência Aproximada de Nomes
+
+Este módulo mantém um índice invertido de trigramas sobre os nomes do
+cadastro de deputados, usado para resolver nomes das despesas que não
+encontraram correspondência exata no cruzamento. A busca é conservadora:
+só aceita variações de grafia palavra a palavra (mesmas palavras, na
+mesma ordem) e rejeita correspondências ambíguas, pois atribuir as
+despesas a outro deputado é pior do que deixá-las sem identificação.
+"""
+
+import numpy as np
+import pandas as pd
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Iterable, Optional, Tuple
+
+
+class NameMatcher:
+    """Índice de trigramas para busca aproximada de nomes padronizados"""
+
+    def __init__(self, nomes: Iterable[str], tamanho_ngrama: int = 3):
+        """
+        Constrói o índice invertido
+
+        Args:
+            nomes: Nomes padronizados do cadastro (a posição é o identificador)
+            tamanho_ngrama: Tamanho dos n-gramas de caracteres
+        """
+        self.nomes = list(nomes)
+        self.tamanho_ngrama = tamanho_ngrama
+
+        postagens = defaultdict(list)
+        tamanhos = np.zeros(len(self.nomes), dtype=np.int32)
+        for posicao, nome in enumerate(self.nomes):
+            ngramas = self._ngramas(nome)
+            tamanhos[posicao] = len(ngramas)
+            for ngrama in ngramas:
+                postagens[ngrama].append(posicao)
+
+        self._postagens = {
+            ngrama: np.array(posicoes, dtype=np.int32)
+            for ngrama, posicoes in postagens.items()
+        }
+        self._tamanhos = tamanhos
+
+    def _ngramas(self, nome: str) -> set:
+        """Conjunto de n-gramas do nome, com espaços nas bordas"""
+        texto = f" {nome} "
+        n = self.tamanho_ngrama
+        return {texto[i:i + n] for i in range(max(len(texto) - n + 1, 1))}
+
+    def buscar(self, nome: str, limiar: float = 0.85,
+               margem: float = 0.05) -> Optional[Tuple[int, float]]:
+        """
+        Busca o nome do cadastro mais parecido
+
+        A similaridade é o coeficiente de Dice entre os conjuntos de
+        trigramas, calculado apenas para os nomes que compartilham ao
+        menos um trigrama com a consulta. Como os trigramas ignoram a
+        ordem das palavras, o melhor candidato também precisa ter as
+        mesmas palavras na mesma ordem (ver `mesmas_palavras`).
+
+        Args:
+            nome: Nome padronizado a procurar
+            limiar: Similaridade mínima (0 a 1) para aceitar a correspondência
+            margem: Diferença mínima entre o melhor e o segundo melhor
+                candidato; abaixo dela a correspondência é ambígua
+
+        Returns:
+            Tupla (posição no cadastro, similaridade) ou None se nenhum
+            nome atingir o limiar ou se a correspondência for ambígua
+        """
+        ngramas = self._ngramas(nome)
+        listas = [self._postagens[ng] for ng in ngramas if ng in self._postagens]
+        if not listas:
+            return None
+
+        # Trigramas em comum com cada candidato
+        candidatos, comuns = np.unique(np.concatenate(listas), return_counts=True)
+        similaridade = 2 * comuns / (len(ngramas) + self._tamanhos[candidatos])
+
+        ordem = np.argsort(-similaridade, kind='stable')
+        melhor = ordem[0]
+        if similaridade[melhor] < limiar:
+            return None
+        if len(ordem) > 1 and similaridade[melhor] - similaridade[ordem[1]] < margem:
+            return None
+
+        posicao = int(candidatos[melhor])
+        if not self.mesmas_palavras(nome, self.nomes[posicao]):
+            return None
+        return posicao, float(similaridade[melhor])
+
+    @staticmethod
+    def mesmas_palavras(nome: str, outro: str, similaridade_minima: float = 0.75) -> bool:
+        """
+        Verifica se dois nomes têm as mesmas palavras, na mesma ordem
+
+        Cada par de palavras deve ser igual ou diferir apenas na grafia
+        (ex.: letras trocadas). Sobrenomes a mais, a menos ou em outra
+        ordem indicam outra pessoa.
+
+        Args:
+            nome: Nome padronizado
+            outro: Nome padronizado a comparar
+            similaridade_minima: Razão mínima (difflib) entre palavras correspondentes
+
+        Returns:
+            True se as palavras correspondem uma a uma
+        """
+        palavras, outras = nome.split(), outro.split()
+        if len(palavras) != len(outras):
+            return False
+        return all(
+            a == b or (a[0] == b[0] and SequenceMatcher(None, a, b).ratio() >= similaridade_minima)
+            for a, b in zip(palavras, outras)
+        )
+
+    def resolver(self, nomes: Iterable[str], limiar: float = 0.85,
+                 margem: float = 0.05) -> pd.DataFrame:
+        """
+        Resolve uma lista de nomes contra o índice
+
+        Nomes que apontam para o mesmo nome do cadastro são descartados
+        juntos: não há como saber qual deles é a grafia correta.
+
+        Args:
+            nomes: Nomes padronizados sem correspondência exata
+            limiar: Similaridade mínima para aceitar a correspondência
+            margem: Diferença mínima para o segundo melhor candidato
+
+        Returns:
+            DataFrame com colunas nome_deputado, posicao_cadastro,
+            nome_cadastro e similaridade, apenas para os nomes resolvidos
+        """
+        linhas = []
+        for nome in nomes:
+            resultado = self.buscar(nome, limiar, margem)
+            if resultado is not None:
+                posicao, similaridade = resultado
+                linhas.append((nome, posicao, self.nomes[posicao], round(similaridade, 4)))
+
+        resolvidos = pd.DataFrame(
+            linhas,
+            columns=['nome_deputado', 'posicao_cadastro', 'nome_cadastro', 'similaridade']
+        )
+        return resolvidos[~resolvidos['posicao_cadastro'].duplicated(keep=False)].reset_index(drop=True)
+
+
+if __name__ == '__main__':
+    # Teste do módulo
+    matcher = NameMatcher(['JOSE DA SILVA', 'MARIA SOUZA', 'JOAO PEREIRA JUNIOR'])
+    for consulta in ['JOSE DA SIVLA', 'JOSE SILVA', 'JOAO PEREIRA JR', 'FULANO DE TAL']:
+        print(f"{consulta!r}: {matcher.buscar(consulta, limiar=0.6)}")
@@ -0,0 +1,341 @@
+"""
+Agregação Paralela por Partições
+
+Este módulo implementa o backend paralelo do DataAnalyzer: os registros
+são divididos em intervalos contíguos, as agregações parciais rodam em
+processos separados (lendo os códigos dos grupos e os valores de memória
+compartilhada) e os resultados parciais são combinados no processo principal.
+"""
+
+import multiprocessing
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+
+def _anexar_memoria(nome: str) -> shared_memory.SharedMemory:
+    """Anexa um bloco de memória compartilhada sem registrá-lo para remoção"""
+    try:
+        return shared_memory.SharedMemory(name=nome, track=False)
+    except TypeError:
+        # Python < 3.13 não aceita o parâmetro `track`
+        return shared_memory.SharedMemory(name=nome)
+
+
+# Acima deste número de combinações de chaves, os códigos combinados são
+# compactados (factorize) antes das contagens
+MAX_GRUPOS_DENSOS = 2 ** 22
+
+
+def _agregar_intervalo(blocos: dict, n: int, num_grupos: int, num_deputados: int,
+                       inicio: int, fim: int, contar_deputados: bool,
+                       ordenar_valores: bool) -> tuple:
+    """
+    Agrega um intervalo contíguo de registros (executa no processo filho)
+
+    Soma e contagem se combinam somando os intervalos; os deputados
+    distintos voltam como pares (grupo, deputado) presentes, unidos no
+    processo principal. Com `ordenar_valores`, o intervalo é gravado no
+    bloco 'ordenado' em ordem de (grupo, valor), para o cálculo da mediana.
+
+    Args:
+        blocos: Nomes dos blocos de memória compartilhada por coluna
+        n: Número total de registros
+        num_grupos: Número de códigos de grupo possíveis
+        num_deputados: Número de códigos de deputado possíveis
+        inicio: Primeiro registro do intervalo
+        fim: Registro seguinte ao último do intervalo
+        contar_deputados: Se deve retornar os pares (grupo, deputado)
+        ordenar_valores: Se deve gravar os valores ordenados por grupo
+
+    Returns:
+        Tupla (grupos presentes, soma, contagem, pares) com soma e
+        contagem apenas dos grupos presentes; pares é None sem
+        `contar_deputados`
+    """
+    memorias = {coluna: _anexar_memoria(nome) for coluna, nome in blocos.items()}
+    try:
+        valor = np.ndarray((n,), dtype=np.float64, buffer=memorias['valor'].buf)[inicio:fim]
+        grupo = np.ndarray((n,), dtype=np.int64, buffer=memorias['grupo'].buf)[inicio:fim]
+
+        # Registros com chave ausente (código -1) ficam de fora, como no groupby
+        validos = None
+        if len(grupo) and grupo.min() < 0:
+            validos = grupo >= 0
+            valor, grupo = valor[validos], grupo[validos]
+
+        contagem = np.bincount(grupo, minlength=num_grupos)
+        soma = np.bincount(grupo, weights=valor, minlength=num_grupos)
+        presentes = np.flatnonzero(contagem)
+
+        pares = None
+        if contar_deputados:
+            deputado = np.ndarray((n,), dtype=np.int64,
+                                  buffer=memorias['deputado'].buf)[inicio:fim]
+            if validos is not None:
+                deputado = deputado[validos]
+            pares = grupo * num_deputados + deputado
+            if num_grupos * num_deputados <= MAX_GRUPOS_DENSOS:
+                marcados = np.zeros(num_grupos * num_deputados, dtype=bool)
+                marcados[pares] = True
+                pares = np.flatnonzero(marcados)
+            else:
+                pares = np.unique(pares)
+            del deputado
+
+        if ordenar_valores:
+            # Agrupar por código (radix sort em int16) e ordenar cada grupo no lugar
+            chave = grupo.astype(np.int16) if num_grupos < 2 ** 15 else grupo
+            ordenado = np.ndarray((n,), dtype=np.float64,
+                                  buffer=memorias['ordenado'].buf)[inicio:inicio + len(valor)]
+            ordenado[:] = valor[np.argsort(chave, kind='stable')]
+            fins = np.cumsum(contagem[presentes])
+            for a, b in zip((fins - contagem[presentes]).tolist(), fins.tolist()):
+                ordenado[a:b].sort()
+            del ordenado, chave
+
+        resultado = (presentes, soma[presentes], contagem[presentes], pares)
+        # Liberar as views antes de fechar os blocos
+        del valor, grupo, validos
+        return resultado
+    finally:
+        for memoria in memorias.values():
+            memoria.close()
+
+
+def _k_esimo(sequencias: list, k: int) -> float:
+    """
+    K-ésimo menor valor (a partir de 0) da união de sequências ordenadas
+
+    A cada passo, o elemento central da maior faixa restante serve de
+    pivô e as faixas são cortadas por busca binária, sem juntar os valores.
+
+    Args:
+        sequencias: Arrays ordenados
+        k: Posição procurada na união
+
+    Returns:
+        O k-ésimo menor valor
+    """
+    inicio = [0] * len(sequencias)
+    fim = [len(s) for s in sequencias]
+    while True:
+        maior = max(range(len(sequencias)), key=lambda i: fim[i] - inicio[i])
+        pivo = sequencias[maior][(inicio[maior] + fim[maior]) // 2]
+        menores = [min(max(int(np.searchsorted(s, pivo, 'left')), a), b)
+                   for s, a, b in zip(sequencias, inicio, fim)]
+        ate = [min(max(int(np.searchsorted(s, pivo, 'right')), a), b)
+               for s, a, b in zip(sequencias, inicio, fim)]
+        num_menores = sum(m - a for m, a in zip(menores, inicio))
+        num_ate = sum(t - a for t, a in zip(ate, inicio))
+        if k < num_menores:
+            fim = menores
+        elif k < num_ate:
+            return float(pivo)
+        else:
+            k -= num_ate
+            inicio = ate
+
+
+def _codigos_chave(coluna: pd.Series) -> tuple:
+    """
+    Códigos inteiros e valores distintos de uma coluna de agrupamento
+
+    Colunas categóricas (partido, UF, nome e tipo de despesa nos dados
+    cruzados) já trazem os códigos; as demais são fatoradas.
+
+    Returns:
+        Tupla (códigos int64 com -1 para ausentes, valores distintos)
+    """
+    if isinstance(coluna.dtype, pd.CategoricalDtype):
+        return coluna.cat.codes.to_numpy().astype(np.int64), coluna.cat.categories
+    codigos, valores = pd.factorize(coluna, sort=True)
+    return codigos.astype(np.int64), pd.Index(valores)
+
+
+class ExecutorParalelo:
+    """Executa agregações do DataAnalyzer em um pool de processos"""
+
+    def __init__(self, num_processos: Optional[int] = None):
+        """
+        Inicializa o executor
+
+        Args:
+            num_processos: Número de processos (padrão: número de CPUs)
+        """
+        self.num_processos = num_processos or os.cpu_count() or 1
+        self._pool = None
+
+    def _obter_pool(self) -> ProcessPoolExecutor:
+        """Cria o pool de processos na primeira utilização"""
+        if self._pool is None:
+            # spawn: o pipeline roda etapas em threads, e um fork feito com
+            # outras threads ativas pode herdar travas presas e bloquear
+            self._pool = ProcessPoolExecutor(max_workers=self.num_processos,
+                                             mp_context=multiprocessing.get_context('spawn'))
+        return self._pool
+
+    def encerrar(self) -> None:
+        """Encerra o pool de processos"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def agregar(self, df: pd.DataFrame, chaves: List[str], media: bool = False,
+                mediana: bool = False, deputados: bool = False) -> pd.DataFrame:
+        """
+        Agrega `valor` por `chaves` dividindo os registros em intervalos contíguos
+
+        O processo principal apenas combina os códigos categóricos das
+        chaves (aritmética sobre inteiros, sem fatorar textos) e copia as
+        colunas numéricas para a memória compartilhada; cada processo
+        agrega o seu intervalo de registros. Soma e contagem são somadas
+        e os pares (grupo, deputado) são unidos. Para a mediana, cada
+        processo grava o seu intervalo ordenado por (grupo, valor) e o
+        processo principal seleciona os valores centrais de cada grupo por
+        busca binária nessas faixas ordenadas.
+
+        Args:
+            df: DataFrame com colunas `chaves`, `nome_deputado` e `valor`
+            chaves: Colunas de agrupamento
+            media: Incluir coluna `gasto_medio`
+            mediana: Incluir coluna `gasto_mediano`
+            deputados: Incluir coluna `num_deputados`
+
+        Returns:
+            DataFrame indexado por `chaves`, com as mesmas colunas e
+            arredondamento do caminho serial
+        """
+        n = len(df)
+
+        # Código combinado dos grupos: c0 * |k1| * |k2| + c1 * |k2| + c2
+        codigos, valores = zip(*(_codigos_chave(df[chave]) for chave in chaves))
+        grupo = codigos[0]
+        ausente = grupo < 0
+        for cod, vals in zip(codigos[1:], valores[1:]):
+            grupo = grupo * len(vals) + cod
+            ausente |= cod < 0
+        num_grupos = int(np.prod([len(vals) for vals in valores], dtype=np.float64))
+        if ausente.any():
+            grupo[ausente] = -1
+
+        # Muitas combinações possíveis: compactar para os grupos existentes
+        compactados = None
+        if num_grupos > MAX_GRUPOS_DENSOS:
+            grupo, compactados = pd.factorize(grupo)
+            grupo = grupo.astype(np.int64)
+            num_grupos = len(compactados)
+
+        colunas = {
+            'valor': df['valor'].to_numpy(dtype=np.float64),
+            'grupo': grupo,
+        }
+        num_deputados = 0
+        if deputados:
+            cod_deputado, nomes = _codigos_chave(df['nome_deputado'])
+            colunas['deputado'] = cod_deputado
+            num_deputados = len(nomes)
+
+        num_intervalos = max(1, min(self.num_processos, n))
+        limites = np.linspace(0, n, num_intervalos + 1).astype(np.int64)
+
+        # Copiar colunas numéricas para memória compartilhada
+        memorias = {}
+        try:
+            for coluna, array in colunas.items():
+                memoria = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                memorias[coluna] = memoria
+                np.ndarray(array.shape, dtype=array.dtype, buffer=memoria.buf)[:] = array
+            if mediana:
+                memorias['ordenado'] = shared_memory.SharedMemory(create=True, size=max(n * 8, 1))
+
+            blocos = {coluna: memoria.name for coluna, memoria in memorias.items()}
+            pool = self._obter_pool()
+            futuros = [
+                pool.submit(_agregar_intervalo, blocos, n, num_grupos, num_deputados,
+                            int(limites[i]), int(limites[i + 1]), deputados, mediana)
+                for i in range(num_intervalos)
+            ]
+            parciais = [futuro.result() for futuro in futuros]
+
+            # Combinar resultados parciais (apenas grupos presentes)
+            indices = np.concatenate([p[0] for p in parciais])
+            soma = np.bincount(indices, weights=np.concatenate([p[1] for p in parciais]),
+                               minlength=num_grupos)
+            contagem = np.bincount(indices, weights=np.concatenate([p[2] for p in parciais]),
+                                   minlength=num_grupos).astype(np.int64)
+            presentes = np.flatnonzero(contagem)
+
+            if mediana:
+                ordenado = np.ndarray((n,), dtype=np.float64, buffer=memorias['ordenado'].buf)
+                medianas = self._medianas(ordenado, limites, parciais, presentes, contagem)
+                del ordenado
+        finally:
+            for memoria in memorias.values():
+                memoria.close()
+                memoria.unlink()
+
+        # Índice com os valores das chaves dos grupos presentes
+        codigos_presentes = presentes if compactados is None else compactados[presentes]
+        niveis = []
+        for vals in reversed(valores):
+            codigos_presentes, codigo = np.divmod(codigos_presentes, len(vals))
+            niveis.append(vals.take(codigo))
+        niveis.reverse()
+        if len(chaves) == 1:
+            indice = pd.Index(niveis[0], name=chaves[0])
+        else:
+            indice = pd.MultiIndex.from_arrays(niveis, names=chaves)
+
+        resultado = pd.DataFrame({'total_gasto': soma[presentes]}, index=indice)
+        if media:
+            resultado['gasto_medio'] = soma[presentes] / contagem[presentes]
+        if mediana:
+            resultado['gasto_mediano'] = medianas
+        resultado['num_registros'] = contagem[presentes]
+        if deputados:
+            pares = np.unique(np.concatenate([p[3] for p in parciais]))
+            resultado['num_deputados'] = np.bincount(
+                pares // num_deputados, minlength=num_grupos
+            )[presentes].astype(np.int64)
+
+        return resultado.round(2)
+
+    @staticmethod
+    def _medianas(ordenado: np.ndarray, limites: np.ndarray, parciais: list,
+                  presentes: np.ndarray, contagem: np.ndarray) -> np.ndarray:
+        """
+        Mediana de cada grupo a partir dos intervalos ordenados por (grupo, valor)
+
+        Args:
+            ordenado: Valores gravados pelos processos, intervalo a intervalo
+            limites: Início de cada intervalo e o fim do último
+            parciais: Resultados de `_agregar_intervalo`, na ordem dos intervalos
+            presentes: Códigos dos grupos com registros
+            contagem: Número de registros de cada grupo
+
+        Returns:
+            Array com a mediana de cada grupo presente
+        """
+        # Faixa de cada grupo dentro de cada intervalo
+        faixas = []
+        for inicio, (grupos, _, contagens, _) in zip(limites[:-1], parciais):
+            fins = inicio + np.cumsum(contagens)
+            faixas.append(dict(zip(grupos.tolist(), zip((fins - contagens).tolist(), fins.tolist()))))
+
+        medianas = np.empty(len(presentes))
+        for posicao, g in enumerate(presentes.tolist()):
+            sequencias = [ordenado[f[g][0]:f[g][1]] for f in faixas if g in f]
+            total = int(contagem[g])
+            baixo = _k_esimo(sequencias, (total - 1) // 2)
+            alto = baixo if total % 2 else _k_esimo(sequencias, total // 2)
+            medianas[posicao] = (baixo + alto) / 2
+        return medianas
+
+if __name__ == '__main__':
+    print("Este módulo deve ser importado, não executado diretamente.")
+    print("Use: DataAnalyzer(..., backend='processos')")
+    print("Testes: python -m pytest tests/")
@@ -0,0 +1,208 @@
+"""
+Execução de Etapas em Grafo de Dependências
+
+Este módulo implementa um executor simples de pipeline: cada etapa declara
+as entradas que consome e as saídas que produz, etapas independentes rodam
+em paralelo (threads) e as saídas de etapas determinísticas são guardadas
+em disco, indexadas pela impressão digital das entradas, para que novas
+execuções pulem etapas cujas entradas não mudaram.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+import pandas as pd
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+import profiler
+
+
+@dataclass
+class Etapa:
+    """Etapa do pipeline: função que recebe as entradas e retorna as saídas"""
+
+    nome: str
+    funcao: Callable[..., dict]
+    entradas: Sequence[str] = ()
+    saidas: Sequence[str] = ()
+    memorizar: bool = False
+    versao: int = 1
+
+
+def impressao_digital(valor) -> str:
+    """
+    Calcula a impressão digital (SHA-256) de um valor do pipeline
+
+    DataFrames são identificados pelo conteúdo, caminhos de arquivos
+    existentes pelo tamanho e data de modificação, e os demais valores
+    pela serialização com pickle.
+
+    Args:
+        valor: Valor a identificar
+
+    Returns:
+        Hash SHA-256 em hexadecimal
+    """
+    h = hashlib.sha256()
+    if isinstance(valor, pd.DataFrame):
+        h.update(repr(list(zip(valor.columns, valor.dtypes.astype(str)))).encode())
+        h.update(pd.util.hash_pandas_object(valor, index=True).to_numpy().tobytes())
+    elif isinstance(valor, Path) and valor.is_file():
+        info = valor.stat()
+        h.update(repr((str(valor.resolve()), info.st_size, info.st_mtime_ns)).encode())
+    else:
+        try:
+            h.update(pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            h.update(repr(valor).encode())
+    return h.hexdigest()
+
+
+class Pipeline:
+    """Executa etapas respeitando as dependências entre entradas e saídas"""
+
+    def __init__(self, etapas: Sequence[Etapa], cache_dir: Optional[str] = None,
+                 max_threads: Optional[int] = None):
+        """
+        Inicializa o pipeline
+
+        Args:
+            etapas: Etapas do pipeline (em qualquer ordem)
+            cache_dir: Diretório das saídas memorizadas (None desativa a memorização)
+            max_threads: Número máximo de etapas simultâneas (padrão: número de etapas)
+
+        Raises:
+            ValueError: Se duas etapas tiverem o mesmo nome ou produzirem a mesma saída
+        """
+        nomes = [etapa.nome for etapa in etapas]
+        if len(set(nomes)) != len(nomes):
+            raise ValueError("Nomes de etapas repetidos")
+
+        self.produtores = {}
+        for etapa in etapas:
+            for saida in etapa.saidas:
+                if saida in self.produtores:
+                    raise ValueError(
+                        f"Saída '{saida}' produzida por '{self.produtores[saida]}' e '{etapa.nome}'"
+                    )
+                self.produtores[saida] = etapa.nome
+
+        self.etapas = list(etapas)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_threads = max_threads or len(self.etapas) or 1
+        self.tempos = {}
+        self.reaproveitadas = []
+        self._impressoes = {}
+
+    def executar(self, contexto: dict) -> dict:
+        """
+        Executa todas as etapas
+
+        Uma etapa é iniciada assim que todas as suas entradas estão
+        disponíveis no contexto. Exceções de uma etapa interrompem o
+        pipeline (etapas ainda não iniciadas são canceladas) e são repassadas.
+
+        Args:
+            contexto: Valores iniciais (parâmetros) disponíveis às etapas
+
+        Returns:
+            Contexto com os valores iniciais e todas as saídas produzidas
+
+        Raises:
+            ValueError: Se alguma entrada não for fornecida nem produzida por uma etapa
+        """
+        contexto = dict(contexto)
+        for etapa in self.etapas:
+            faltantes = [e for e in etapa.entradas
+                         if e not in contexto and e not in self.produtores]
+            if faltantes:
+                raise ValueError(f"Etapa '{etapa.nome}' sem origem para: {', '.join(faltantes)}")
+
+        pendentes = list(self.etapas)
+        em_execucao = {}
+        pool = ThreadPoolExecutor(max_workers=self.max_threads)
+        try:
+            while pendentes or em_execucao:
+                for etapa in [e for e in pendentes if all(x in contexto for x in e.entradas)]:
+                    pendentes.remove(etapa)
+                    entradas = {nome: contexto[nome] for nome in etapa.entradas}
+                    em_execucao[pool.submit(self._executar_etapa, etapa, entradas)] = etapa
+
+                if not em_execucao:
+                    nomes = ', '.join(e.nome for e in pendentes)
+                    raise ValueError(f"Dependência circular entre as etapas: {nomes}")
+
+                concluidas, _ = wait(em_execucao, return_when=FIRST_COMPLETED)
+                for futuro in concluidas:
+                    em_execucao.pop(futuro)
+                    contexto.update(futuro.result())
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        return contexto
+
+    def _executar_etapa(self, etapa: Etapa, entradas: dict) -> dict:
+        """Executa uma etapa medida pelo profiler ativo, se houver"""
+        with profiler.medir('etapa', etapa.nome):
+            return self._executar_etapa_medida(etapa, entradas)
+
+    def _executar_etapa_medida(self, etapa: Etapa, entradas: dict) -> dict:
+        """Executa uma etapa, consultando e alimentando o cache se memorizada"""
+        inicio = time.perf_counter()
+
+        chave = self._chave(etapa, entradas) if etapa.memorizar and self.cache_dir else None
+        arquivo = self.cache_dir / f"{etapa.nome}-{chave[:16]}.pkl" if chave else None
+
+        if arquivo is not None and arquivo.exists():
+            with open(arquivo, 'rb') as f:
+                saidas = pickle.load(f)
+            print(f"\n♻️  Etapa '{etapa.nome}' reaproveitada do cache (entradas inalteradas)")
+            self.reaproveitadas.append(etapa.nome)
+        else:
+            saidas = etapa.funcao(**entradas)
+            ausentes = set(etapa.saidas) - set(saidas)
+            if ausentes:
+                raise ValueError(f"Etapa '{etapa.nome}' não produziu: {', '.join(sorted(ausentes))}")
+            saidas = {nome: saidas[nome] for nome in etapa.saidas}
+            if arquivo is not None:
+                self._guardar(etapa, arquivo, saidas)
+
+        # Saídas de etapas memorizadas são identificadas pela chave, sem reprocessar o conteúdo
+        if chave:
+            for nome in etapa.saidas:
+                self._impressoes[nome] = hashlib.sha256(f"{chave}:{nome}".encode()).hexdigest()
+
+        self.tempos[etapa.nome] = time.perf_counter() - inicio
+        return saidas
+
+    def _chave(self, etapa: Etapa, entradas: dict) -> str:
+        """Chave de cache da etapa: nome, versão e impressões das entradas"""
+        h = hashlib.sha256(repr((etapa.nome, etapa.versao)).encode())
+        for nome in sorted(entradas):
+            if nome not in self._impressoes:
+                self._impressoes[nome] = impressao_digital(entradas[nome])
+            h.update(f"{nome}={self._impressoes[nome]}".encode())
+        return h.hexdigest()
+
+    def _guardar(self, etapa: Etapa, arquivo: Path, saidas: dict) -> None:
+        """Grava as saídas da etapa, mantendo apenas a versão mais recente no cache"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for antigo in self.cache_dir.glob(f"{etapa.nome}-*.pkl"):
+            antigo.unlink(missing_ok=True)
+
+        temporario = arquivo.with_name(arquivo.name + '.tmp')
+        with open(temporario, 'wb') as f:
+            pickle.dump(saidas, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporario, arquivo)
+
+    def exibir_tempos(self) -> None:
+        """Exibe o tempo de cada etapa, na ordem de declaração"""
+        print("\n⏱️  Tempo por etapa:")
+        for etapa in self.etapas:
+            if etapa.nome in self.tempos:
+                marca = " (cache)" if etapa.nome in self.reaproveitadas else ""
+                print(f"   {etapa.nome:<20} {self.tempos[etapa.nome]:>8.2f} s{marca}")
@@ -0,0 +1,248 @@
+"""
+Instrumentação de Tempo e Memória
+
+Este módulo registra tempo de relógio, tempo de CPU e pico de memória
+residente (RSS) das etapas do pipeline e dos métodos públicos do
+DataAnalyzer e do Visualizer. O pico de RSS é do processo inteiro: com
+etapas em threads simultâneas, ele não separa a memória de cada etapa. A coleta só acontece enquanto um Profiler
+estiver ativo; caso contrário os métodos instrumentados rodam sem custo
+adicional relevante.
+"""
+
+import functools
+import inspect
+import json
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+try:
+    import resource
+except ImportError:
+    # Windows: sem getrusage, o pico de RSS e a CPU dos filhos não são medidos
+    resource = None
+
+
+_ativo = None
+
+
+def _uso_recursos() -> tuple:
+    """Retorna (pico de RSS em MB, CPU dos processos filhos em segundos)"""
+    if resource is None:
+        return None, None
+    proprio = resource.getrusage(resource.RUSAGE_SELF)
+    filhos = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # ru_maxrss é em KB no Linux e em bytes no macOS
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return proprio.ru_maxrss / divisor, filhos.ru_utime + filhos.ru_stime
+
+
+class Profiler:
+    """Coleta medições de tempo e memória de etapas e métodos"""
+
+    def __init__(self):
+        """Inicializa o profiler sem medições"""
+        self.registros = []
+        self.inicio = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def medir(self, categoria: str, nome: str):
+        """
+        Mede o bloco de código
+
+        O tempo de CPU é o da thread que executa o bloco (etapas rodam em
+        threads separadas); `cpu_filhos_s` soma a CPU de processos filhos
+        encerrados durante o bloco, como os pools de gráficos e agregação.
+        O pico de RSS é o do processo (ru_maxrss) lido ao final do bloco, e
+        `aumento_pico_rss_mb` indica quanto esse pico subiu durante o bloco.
+        Como etapas rodam em paralelo, o aumento inclui a memória alocada
+        por outras etapas simultâneas (ver `etapas_simultaneas`) e só pode
+        ser atribuído ao bloco quando ele rodou sozinho.
+
+        Args:
+            categoria: Tipo da medição ('etapa' ou 'metodo')
+            nome: Nome da etapa ou do método
+        """
+        pico_antes, filhos_antes = _uso_recursos()
+        cpu_antes = time.thread_time()
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            duracao = time.perf_counter() - inicio
+            cpu = time.thread_time() - cpu_antes
+            pico_depois, filhos_depois = _uso_recursos()
+            registro = {
+                'categoria': categoria,
+                'nome': nome,
+                'thread': threading.current_thread().name,
+                'inicio_s': round(inicio - self.inicio, 4),
+                'duracao_s': round(duracao, 4),
+                'cpu_s': round(cpu, 4),
+                'cpu_filhos_s': None,
+                'pico_rss_mb': None,
+                'aumento_pico_rss_mb': None,
+            }
+            if resource is not None:
+                registro['cpu_filhos_s'] = round(filhos_depois - filhos_antes, 4)
+                registro['pico_rss_mb'] = round(pico_depois, 1)
+                registro['aumento_pico_rss_mb'] = round(pico_depois - pico_antes, 1)
+            with self._lock:
+                self.registros.append(registro)
+
+    def etapas_simultaneas(self) -> dict:
+        """
+        Lista, para cada etapa, as outras etapas que rodaram ao mesmo tempo
+
+        Returns:
+            Dicionário {etapa: nomes das etapas com intervalo sobreposto}
+        """
+        etapas = [r for r in self.registros if r['categoria'] == 'etapa']
+        return {
+            etapa['nome']: [
+                outra['nome'] for outra in etapas
+                if outra is not etapa
+                and outra['inicio_s'] < etapa['inicio_s'] + etapa['duracao_s']
+                and etapa['inicio_s'] < outra['inicio_s'] + outra['duracao_s']
+            ]
+            for etapa in etapas
+        }
+
+    def resumo_metodos(self) -> list:
+        """
+        Agrega as medições de métodos por nome
+
+        Returns:
+            Lista de dicionários (nome, chamadas, duracao_s, cpu_s, pico_rss_mb),
+            do método mais demorado para o menos demorado
+        """
+        agregados = {}
+        for registro in self.registros:
+            if registro['categoria'] != 'metodo':
+                continue
+            item = agregados.setdefault(registro['nome'], {
+                'nome': registro['nome'], 'chamadas': 0, 'duracao_s': 0.0,
+                'cpu_s': 0.0, 'pico_rss_mb': None,
+            })
+            item['chamadas'] += 1
+            item['duracao_s'] += registro['duracao_s']
+            item['cpu_s'] += registro['cpu_s']
+            if registro['pico_rss_mb'] is not None:
+                item['pico_rss_mb'] = max(item['pico_rss_mb'] or 0.0, registro['pico_rss_mb'])
+        return sorted(agregados.values(), key=lambda item: -item['duracao_s'])
+
+    def salvar(self, arquivo: Path) -> Path:
+        """
+        Grava as medições em JSON
+
+        Args:
+            arquivo: Caminho do arquivo JSON
+
+        Returns:
+            Caminho do arquivo gravado
+        """
+        pico, filhos = _uso_recursos()
+        dados = {
+            'gerado_em': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'duracao_total_s': round(time.perf_counter() - self.inicio, 4),
+            'pico_rss_mb': None if pico is None else round(pico, 1),
+            'cpu_filhos_total_s': None if filhos is None else round(filhos, 4),
+            'registros': self.registros,
+            'etapas_simultaneas': self.etapas_simultaneas(),
+            'metodos': self.resumo_metodos(),
+        }
+        arquivo = Path(arquivo)
+        arquivo.write_text(json.dumps(dados, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"✅ Perfil de execução salvo: {arquivo}")
+        return arquivo
+
+    def exibir(self, max_metodos: int = 15) -> None:
+        """
+        Exibe tabelas de etapas e métodos mais demorados
+
+        Args:
+            max_metodos: Número máximo de métodos listados
+        """
+        def formatar(valor, casas=1):
+            return '-' if valor is None else f"{valor:.{casas}f}"
+
+        print("\n" + "=" * 80)
+        print("  ⏱️  PERFIL DE EXECUÇÃO")
+        print("=" * 80)
+        simultaneas = self.etapas_simultaneas()
+        print(f"\n  {'Etapa':<24} {'Tempo (s)':>10} {'CPU (s)':>9} {'CPU filhos':>11} "
+              f"{'RSS proc. (MB)':>15}")
+        for registro in sorted(self.registros, key=lambda r: r['inicio_s']):
+            if registro['categoria'] == 'etapa':
+                marca = '*' if simultaneas.get(registro['nome']) else ' '
+                print(f"  {registro['nome']:<24} {registro['duracao_s']:>10.2f} "
+                      f"{registro['cpu_s']:>9.2f} {formatar(registro['cpu_filhos_s'], 2):>11} "
+                      f"{formatar(registro['pico_rss_mb']):>14}{marca}")
+        print("\n  RSS proc.: pico de memória do processo inteiro ao fim da etapa, não da etapa")
+        if any(simultaneas.values()):
+            print("  * etapa executada junto com outras: o pico inclui a memória delas")
+
+        metodos = self.resumo_metodos()[:max_metodos]
+        if metodos:
+            print(f"\n  {'Método':<44} {'Chamadas':>8} {'Tempo (s)':>10} {'CPU (s)':>9}")
+            for item in metodos:
+                print(f"  {item['nome']:<44} {item['chamadas']:>8} "
+                      f"{item['duracao_s']:>10.2f} {item['cpu_s']:>9.2f}")
+        print("\n" + "=" * 80)
+
+
+def ativar() -> Profiler:
+    """Cria e ativa um Profiler global, usado pelos métodos instrumentados"""
+    global _ativo
+    _ativo = Profiler()
+    return _ativo
+
+
+def desativar() -> Optional[Profiler]:
+    """Desativa o Profiler global e o retorna"""
+    global _ativo
+    profiler, _ativo = _ativo, None
+    return profiler
+
+
+@contextmanager
+def medir(categoria: str, nome: str):
+    """Mede o bloco no Profiler ativo (sem efeito se nenhum estiver ativo)"""
+    if _ativo is None:
+        yield
+    else:
+        with _ativo.medir(categoria, nome):
+            yield
+
+
+def instrumentar(cls):
+    """
+    Decorador de classe que mede os métodos públicos
+
+    Args:
+        cls: Classe a instrumentar
+
+    Returns:
+        A própria classe, com os métodos públicos envolvidos por `medir`
+    """
+    def envolver(funcao, nome):
+        @functools.wraps(funcao)
+        def medido(*args, **kwargs):
+            if _ativo is None:
+                return funcao(*args, **kwargs)
+            with _ativo.medir('metodo', nome):
+                return funcao(*args, **kwargs)
+        return medido
+
+    for atributo, valor in list(vars(cls).items()):
+        if inspect.isfunction(valor) and not atributo.startswith('_'):
+            setattr(cls, atributo, envolver(valor, f"{cls.__name__}.{atributo}"))
+    return cls
@@ -0,0 +1,244 @@
+"""
+Serviço HTTP de Análises
+
+Este módulo mantém os dados de despesas carregados e cruzados em memória
+e serve as análises agregadas como JSON, evitando que cada consulta pague
+a inicialização do interpretador, a leitura do CSV e a busca do cadastro.
+O CSV é recarregado apenas quando sua impressão digital (tamanho e data
+de modificação) muda.
+
+Uso:
+    python src/servidor.py dados/Ano-2025.csv [--porta 8000]
+
+Endpoints (GET):
+    /saude                 Estado do serviço e dos dados carregados
+    /partidos              Gastos por partido
+    /estados               Gastos por estado
+    /tipos-despesa         Gastos por tipo de despesa
+    /top-deputados         Top deputados (?top_n=20&por=uf|partido)
+    /evolucao              Gastos por mês ou trimestre
+                           (?periodo=mes|trimestre&por=partido|uf|tipo_despesa)
+    /fornecedores          Top fornecedores (?top_n=20&ordenar_por=total_gasto|num_deputados)
+    /concentracao-fornecedores  Concentração dos gastos de cada deputado por fornecedor
+
+Filtros (repetíveis, em todos os endpoints de análise):
+    ?partido=PT&partido=PL&uf=SP&tipo_despesa=...&deputado=...
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from api_client import CamaraAPI
+from data_analyzer import DataAnalyzer
+from data_loader import DataLoader
+from pipeline import impressao_digital
+
+
+class ServicoAnalise:
+    """Mantém os dados cruzados em memória e responde às consultas"""
+
+    # Endpoint → método do DataAnalyzer
+    ENDPOINTS = {
+        '/partidos': 'analisar_por_partido',
+        '/estados': 'analisar_por_estado',
+        '/tipos-despesa': 'analisar_tipos_despesa',
+        '/top-deputados': 'analisar_top_deputados',
+        '/evolucao': 'analisar_evolucao_temporal',
+        '/fornecedores': 'analisar_fornecedores',
+        '/concentracao-fornecedores': 'analisar_concentracao_fornecedores',
+    }
+
+    # Parâmetro da URL → argumento de DataAnalyzer.filtrar
+    FILTROS = {
+        'partido': 'partido',
+        'uf': 'uf',
+        'tipo_despesa': 'tipo_despesa',
+        'deputado': 'nome_deputado',
+    }
+
+    def __init__(self, csv_path: str, limiar_similaridade: Optional[float] = None):
+        """
+        Inicializa o serviço e carrega os dados
+
+        Args:
+            csv_path: Caminho do CSV de despesas
+            limiar_similaridade: Similaridade mínima para resolver nomes
+                sem correspondência exata (ver DataAnalyzer)
+        """
+        self.csv_path = Path(csv_path)
+        self.limiar_similaridade = limiar_similaridade
+        self.df_deputados = None
+        self.analyzer = None
+        self.impressao = None
+        self.carregado_em = None
+        self._lock = threading.Lock()
+        self._recarregar_se_necessario()
+
+    def _recarregar_se_necessario(self) -> None:
+        """Recarrega e recruza o CSV se ele mudou desde a última carga"""
+        impressao = impressao_digital(self.csv_path)
+        if impressao == self.impressao:
+            return
+
+        print(f"\n📂 Carregando dados de {self.csv_path}...")
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            loader = DataLoader(self.csv_path)
+            loader.carregar_csv()
+            df_despesas = loader.limpar_dados()
+            # O cadastro vem da API e é buscado apenas uma vez
+            if self.df_deputados is None:
+                self.df_deputados = CamaraAPI().buscar_deputados()
+            analyzer = DataAnalyzer(df_despesas, self.df_deputados,
+                                    limiar_similaridade=self.limiar_similaridade)
+            analyzer.cruzar_dados()
+
+        self.analyzer = analyzer
+        self.impressao = impressao
+        self.carregado_em = datetime.now().isoformat(timespec='seconds')
+        print(f"✅ {len(analyzer.df_cruzado):,} registros em memória "
+              f"({time.perf_counter() - inicio:.1f} s)")
+
+    def saude(self) -> dict:
+        """Estado do serviço e dos dados carregados"""
+        with self._lock:
+            self._recarregar_se_necessario()
+            cruzamento = self.analyzer.relatorio_cruzamento
+            return {
+                'arquivo': str(self.csv_path),
+                'carregado_em': self.carregado_em,
+                'impressao_digital': self.impressao[:16],
+                'registros': cruzamento.total_registros,
+                'identificados': cruzamento.identificados,
+            }
+
+    def consultar(self, endpoint: str, parametros: dict) -> str:
+        """
+        Executa a análise do endpoint com os filtros e parâmetros da URL
+
+        Args:
+            endpoint: Caminho da URL (ver ENDPOINTS)
+            parametros: Parâmetros da URL (valores em listas, como parse_qs)
+
+        Returns:
+            Resultado da análise em JSON (lista de registros)
+
+        Raises:
+            KeyError: Se o endpoint não existir
+            ValueError: Se algum parâmetro for inválido
+        """
+        metodo = self.ENDPOINTS[endpoint]
+
+        filtros = {}
+        for parametro, argumento in self.FILTROS.items():
+            valores = parametros.get(parametro)
+            if valores and parametro == 'deputado':
+                valores = [DataAnalyzer._padronizar_nome(v) for v in valores]
+            filtros[argumento] = valores
+
+        argumentos = {}
+        if metodo in ('analisar_top_deputados', 'analisar_fornecedores'):
+            argumentos['top_n'] = int(parametros.get('top_n', ['20'])[0])
+            if argumentos['top_n'] < 1:
+                raise ValueError("top_n deve ser positivo")
+        if metodo == 'analisar_top_deputados':
+            argumentos['por'] = parametros.get('por', [None])[0]
+        elif metodo == 'analisar_fornecedores':
+            argumentos['ordenar_por'] = parametros.get('ordenar_por', ['total_gasto'])[0]
+        elif metodo == 'analisar_evolucao_temporal':
+            argumentos['periodo'] = parametros.get('periodo', ['mes'])[0]
+            argumentos['por'] = parametros.get('por', [None])[0]
+
+        with self._lock:
+            self._recarregar_se_necessario()
+            # As análises imprimem o progresso no console: silenciar no serviço
+            with contextlib.redirect_stdout(io.StringIO()):
+                analyzer = self.analyzer
+                if any(filtros.values()):
+                    analyzer = analyzer.filtrar(**filtros)
+                resultado = getattr(analyzer, metodo)(**argumentos)
+
+        return json.dumps(resultado.to_dict(orient='records'), ensure_ascii=False)
+
+
+class ManipuladorAnalise(BaseHTTPRequestHandler):
+    """Atende as requisições HTTP repassando-as ao ServicoAnalise"""
+
+    servico: ServicoAnalise = None
+
+    def do_GET(self):
+        """Responde a uma requisição GET"""
+        url = urlparse(self.path)
+        parametros = parse_qs(url.query)
+        inicio = time.perf_counter()
+
+        try:
+            if url.path == '/saude':
+                corpo = json.dumps(self.servico.saude(), ensure_ascii=False)
+            elif url.path in ServicoAnalise.ENDPOINTS:
+                corpo = self.servico.consultar(url.path, parametros)
+            else:
+                self._responder(404, {'erro': f'Endpoint não encontrado: {url.path}',
+                                      'endpoints': ['/saude', *ServicoAnalise.ENDPOINTS]})
+                return
+        except ValueError as e:
+            self._responder(400, {'erro': str(e)})
+            return
+        except Exception as e:
+            self._responder(500, {'erro': f'Erro inesperado: {e}'})
+            return
+
+        self._enviar(200, corpo, time.perf_counter() - inicio)
+
+    def _responder(self, status: int, dados: dict) -> None:
+        """Envia um objeto como JSON"""
+        self._enviar(status, json.dumps(dados, ensure_ascii=False))
+
+    def _enviar(self, status: int, corpo: str, duracao: Optional[float] = None) -> None:
+        """Envia o corpo JSON com os cabeçalhos da resposta"""
+        dados = corpo.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(dados)))
+        if duracao is not None:
+            self.send_header('Server-Timing', f'analise;dur={duracao * 1000:.1f}')
+        self.end_headers()
+        self.wfile.write(dados)
+
+
+def main():
+    """Inicia o serviço HTTP"""
+    parser = argparse.ArgumentParser(description='Serviço HTTP de análises de gastos')
+    parser.add_argument('csv_path', help='Caminho para o arquivo CSV de despesas')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='Endereço de escuta (padrão: 127.0.0.1)')
+    parser.add_argument('--porta', type=int, default=8000,
+                        help='Porta de escuta (padrão: 8000)')
+    parser.add_argument('--limiar-nomes', type=float, default=0, metavar='L',
+                        help='Similaridade mínima para resolver nomes, ex.: 0.85 '
+                             '(padrão: 0, desativado)')
+    args = parser.parse_args()
+
+    ManipuladorAnalise.servico = ServicoAnalise(args.csv_path, args.limiar_nomes)
+    servidor = ThreadingHTTPServer((args.host, args.porta), ManipuladorAnalise)
+
+    print(f"\n🌐 Servindo em http://{args.host}:{args.porta}/ (Ctrl+C para encerrar)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Serviço encerrado.\n")
+    finally:
+        servidor.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -2,51 +2,159 @@
 Visualização de Dados
 
 Este módulo gera gráficos e visualizações das análises realizadas.
+As bibliotecas gráficas (matplotlib/seaborn) são importadas apenas no
+primeiro uso, para não pesar na inicialização de execuções sem gráficos.
 """
 
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+import shutil
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from typing import Optional, Union
 
+from profiler import instrumentar
 
+
+TEMPLATE_DASHBOARD = Path(__file__).parent / 'templates' / 'dashboard.html'
+
+# Processos dos gráficos criados com spawn: o pipeline roda etapas em
+# threads, e um fork feito com outras threads ativas pode herdar travas
+# presas (ex.: de logging ou da escrita de CSVs) e bloquear o processo filho
+_CONTEXTO_PROCESSOS = multiprocessing.get_context('spawn')
+
+
+def _renderizar_grafico(output_dir: str, perfil: str, metodo: str, args: tuple) -> Path:
+    """
+    Renderiza um gráfico em um processo separado
+    
+    Cada processo usa o backend Agg e configura o próprio estilo,
+    criando um Visualizer independente.
+    
+    Args:
+        output_dir: Diretório de saída dos gráficos
+        perfil: Perfil de renderização (ver Visualizer.PERFIS)
+        metodo: Nome do método plot_* a executar
+        args: Argumentos posicionais do método
+        
+    Returns:
+        Caminho do arquivo gerado
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    
+    visualizer = Visualizer(output_dir=output_dir, perfil=perfil)
+    return getattr(visualizer, metodo)(*args)
+
+
+def _renderizar_lote_grupos(output_dir: str, perfil: str, top_n: int, lote: list) -> list:
+    """
+    Renderiza um lote de gráficos por grupo em um processo separado
+    
+    Args:
+        output_dir: Diretório de saída dos gráficos
+        perfil: Perfil de renderização (ver Visualizer.PERFIS)
+        top_n: Número de barras do modelo
+        lote: Lista de tuplas (titulo, nome do arquivo, DataFrame do grupo)
+        
+    Returns:
+        Caminhos dos arquivos gerados, na ordem do lote
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    
+    visualizer = Visualizer(output_dir=output_dir, perfil=perfil)
+    return visualizer._renderizar_grupos(top_n, lote)
+
+
+@instrumentar
 class Visualizer:
     """Gera visualizações das análises de gastos parlamentares"""
     
-    def __init__(self, output_dir: str = 'resultados'):
+    ESTILO = 'seaborn-v0_8-darkgrid'
+    PALETA = 'husl'
+    
+    # Perfis de renderização: resolução dos formatos raster e formatos gerados.
+    # O perfil vetorial também gera PNG, pois o python-pptx não embute SVG/PDF.
+    PERFIS = {
+        'rascunho': {'dpi': 100, 'formatos': ('png',)},
+        'impressao': {'dpi': 300, 'formatos': ('png',)},
+        'vetorial': {'dpi': 150, 'formatos': ('svg', 'pdf', 'png')},
+    }
+    
+    # Altura por barra e altura máxima (polegadas) de gráficos com muitas barras
+    ALTURA_POR_BARRA = 0.3
+    ALTURA_MAXIMA = 24
+    MAX_ROTULOS = 60
+    
+    # Incrementar ao alterar o desenho dos gráficos, invalidando o cache
+    VERSAO_GRAFICOS = 2
+    
+    def __init__(self, output_dir: str = 'resultados', perfil: str = 'impressao',
+                 usar_cache: bool = True, cache_dir: Optional[str] = None):
         """
         Inicializa o visualizador
         
         Args:
             output_dir: Diretório para salvar os gráficos
+            perfil: Perfil de renderização ('rascunho', 'impressao' ou 'vetorial')
+            usar_cache: Reaproveitar gráficos já renderizados com os mesmos dados
+            cache_dir: Diretório do cache de gráficos
+                (padrão: .cache_graficos ao lado de output_dir)
+                
+        Raises:
+            ValueError: Se o perfil não existir
         """
+        if perfil not in self.PERFIS:
+            raise ValueError(f"Perfil inválido: {perfil!r} (use {', '.join(self.PERFIS)})")
+        
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
+        self.perfil = perfil
+        self.dpi = self.PERFIS[perfil]['dpi']
+        self.formatos = self.PERFIS[perfil]['formatos']
+        
+        self.usar_cache = usar_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else self.output_dir.parent / '.cache_graficos'
+        self.estatisticas_cache = {'acertos': [], 'falhas': []}
+        
         # Configurar estilo dos gráficos
-        plt.style.use('seaborn-v0_8-darkgrid')
-        sns.set_palette('husl')
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        plt.style.use(self.ESTILO)
+        sns.set_palette(self.PALETA)
         
         # Configurar cores
-        self.colors = sns.color_palette('husl', 15)
+        self.colors = sns.color_palette(self.PALETA, 15)
     
-    def plot_gastos_partido(self, df_partido: pd.DataFrame, top_n: int = 15) -> None:
+    def plot_gastos_partido(self, df_partido: pd.DataFrame, top_n: int = 15) -> Path:
         """
         Gera gráfico de gastos por partido
         
         Args:
             df_partido: DataFrame com análise por partido
             top_n: Número de partidos a exibir
+            
+        Returns:
+            Caminho do arquivo gerado
         """
+        import matplotlib.pyplot as plt
+        
         print(f"\n📊 Gerando gráfico: Gastos por Partido (Top {top_n})...")
         
         # Pegar top N partidos
         df = df_partido.head(top_n).copy()
         
         # Criar figura com subplots
-        fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+        altura, fonte, passo = self._dimensionar(len(df), altura_base=6)
+        fig, axes = plt.subplots(1, 2, figsize=(16, altura))
         
         # Gráfico 1: Total gasto por partido
         ax1 = axes[0]
@@ -57,10 +165,7 @@ class Visualizer:
         ax1.invert_yaxis()
         
         # Adicionar valores nas barras
-        for i, (idx, row) in enumerate(df.iterrows()):
-            ax1.text(row['total_gasto'] / 1_000_000 + 0.1, i, 
-                    f'R$ {row["total_gasto"]/1_000_000:.2f}M',
-                    va='center', fontsize=9)
+        self._rotular_barras(ax1, bars1, (df['total_gasto'] / 1_000_000).map('R$ {:.2f}M'.format), fonte, passo)
         
         # Gráfico 2: Média por deputado
         ax2 = axes[1]
@@ -71,35 +176,37 @@ class Visualizer:
         ax2.invert_yaxis()
         
         # Adicionar valores nas barras
-        for i, (idx, row) in enumerate(df.iterrows()):
-            ax2.text(row['media_por_deputado'] / 1_000 + 1, i, 
-                    f'R$ {row["media_por_deputado"]/1_000:.1f}K',
-                    va='center', fontsize=9)
+        self._rotular_barras(ax2, bars2, (df['media_por_deputado'] / 1_000).map('R$ {:.1f}K'.format), fonte, passo)
         
         plt.tight_layout()
         
         # Salvar
         filename = self.output_dir / 'gastos_por_partido.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"✅ Salvo: {filename}")
+        filename = self._salvar_figura(filename)
         
-        plt.close()
+        return filename
     
-    def plot_gastos_estado(self, df_estado: pd.DataFrame, top_n: int = 15) -> None:
+    def plot_gastos_estado(self, df_estado: pd.DataFrame, top_n: int = 15) -> Path:
         """
         Gera gráfico de gastos por estado
         
         Args:
             df_estado: DataFrame com análise por estado
             top_n: Número de estados a exibir
+            
+        Returns:
+            Caminho do arquivo gerado
         """
+        import matplotlib.pyplot as plt
+        
         print(f"\n📊 Gerando gráfico: Gastos por Estado (Top {top_n})...")
         
         # Pegar top N estados
         df = df_estado.head(top_n).copy()
         
         # Criar figura com subplots
-        fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+        altura, fonte, passo = self._dimensionar(len(df), altura_base=6)
+        fig, axes = plt.subplots(1, 2, figsize=(16, altura))
         
         # Gráfico 1: Total gasto por estado
         ax1 = axes[0]
@@ -110,10 +217,7 @@ class Visualizer:
         ax1.invert_yaxis()
         
         # Adicionar valores
-        for i, (idx, row) in enumerate(df.iterrows()):
-            ax1.text(row['total_gasto'] / 1_000_000 + 0.2, i, 
-                    f'R$ {row["total_gasto"]/1_000_000:.2f}M',
-                    va='center', fontsize=9)
+        self._rotular_barras(ax1, bars1, (df['total_gasto'] / 1_000_000).map('R$ {:.2f}M'.format), fonte, passo)
         
         # Gráfico 2: Média por deputado
         ax2 = axes[1]
@@ -124,69 +228,75 @@ class Visualizer:
         ax2.invert_yaxis()
         
         # Adicionar valores
-        for i, (idx, row) in enumerate(df.iterrows()):
-            ax2.text(row['media_por_deputado'] / 1_000 + 1, i, 
-                    f'R$ {row["media_por_deputado"]/1_000:.1f}K',
-                    va='center', fontsize=9)
+        self._rotular_barras(ax2, bars2, (df['media_por_deputado'] / 1_000).map('R$ {:.1f}K'.format), fonte, passo)
         
         plt.tight_layout()
         
         # Salvar
         filename = self.output_dir / 'gastos_por_estado.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"✅ Salvo: {filename}")
+        filename = self._salvar_figura(filename)
         
-        plt.close()
+        return filename
     
-    def plot_tipos_despesa(self, df_despesa: pd.DataFrame, top_n: int = 10) -> None:
+    def plot_tipos_despesa(self, df_despesa: pd.DataFrame, top_n: int = 10) -> Path:
         """
         Gera gráfico de tipos de despesa
         
         Args:
             df_despesa: DataFrame com análise por tipo de despesa
             top_n: Número de tipos a exibir
+            
+        Returns:
+            Caminho do arquivo gerado
         """
+        import matplotlib.pyplot as plt
+        
         print(f"\n📊 Gerando gráfico: Tipos de Despesa (Top {top_n})...")
         
         # Pegar top N tipos
         df = df_despesa.head(top_n).copy()
         
         # Criar figura
-        fig, ax = plt.subplots(figsize=(14, 8))
+        altura, fonte, passo = self._dimensionar(len(df), altura_base=8)
+        fig, ax = plt.subplots(figsize=(14, altura))
         
         # Gráfico de barras
         bars = ax.barh(range(len(df)), df['total_gasto'] / 1_000_000, color=self.colors[:len(df)])
         
         # Configurar eixos
-        ax.set_yticks(range(len(df)))
-        ax.set_yticklabels(df['tipo_despesa'], fontsize=10)
+        self._rotular_eixo_y(ax, df['tipo_despesa'], min(10, fonte + 1), passo)
         ax.set_xlabel('Total Gasto (Milhões R$)', fontsize=12)
         ax.set_title(f'Top {top_n} Tipos de Despesa Mais Comuns', fontsize=14, fontweight='bold')
         ax.invert_yaxis()
         
         # Adicionar valores e percentuais
-        for i, (idx, row) in enumerate(df.iterrows()):
-            ax.text(row['total_gasto'] / 1_000_000 + 0.2, i, 
-                    f'R$ {row["total_gasto"]/1_000_000:.2f}M ({row["percentual"]:.1f}%)',
-                    va='center', fontsize=9)
+        rotulos = (
+            (df['total_gasto'] / 1_000_000).map('R$ {:.2f}M'.format)
+            + df['percentual'].map(' ({:.1f}%)'.format)
+        )
+        self._rotular_barras(ax, bars, rotulos, fonte, passo)
         
         plt.tight_layout()
         
         # Salvar
         filename = self.output_dir / 'tipos_despesa.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"✅ Salvo: {filename}")
+        filename = self._salvar_figura(filename)
         
-        plt.close()
+        return filename
     
-    def plot_top_deputados(self, df_deputados: pd.DataFrame, top_n: int = 15) -> None:
+    def plot_top_deputados(self, df_deputados: pd.DataFrame, top_n: int = 15) -> Path:
         """
         Gera gráfico dos deputados com maiores gastos
         
         Args:
             df_deputados: DataFrame com top deputados
             top_n: Número de deputados a exibir
+            
+        Returns:
+            Caminho do arquivo gerado
         """
+        import matplotlib.pyplot as plt
+        
         print(f"\n📊 Gerando gráfico: Top {top_n} Deputados...")
         
         # Pegar top N
@@ -196,41 +306,89 @@ class Visualizer:
         df['label'] = df['nome_deputado'] + '\n(' + df['partido'] + '-' + df['uf'] + ')'
         
         # Criar figura
-        fig, ax = plt.subplots(figsize=(14, 10))
+        altura, fonte, passo = self._dimensionar(len(df), altura_base=10)
+        fig, ax = plt.subplots(figsize=(14, altura))
         
         # Gráfico de barras
         bars = ax.barh(range(len(df)), df['total_gasto'] / 1_000, color=self.colors[:len(df)])
         
         # Configurar eixos
-        ax.set_yticks(range(len(df)))
-        ax.set_yticklabels(df['label'], fontsize=9)
+        self._rotular_eixo_y(ax, df['label'], fonte, passo)
         ax.set_xlabel('Total Gasto (Mil R$)', fontsize=12)
         ax.set_title(f'Top {top_n} Deputados com Maiores Gastos', fontsize=14, fontweight='bold')
         ax.invert_yaxis()
         
         # Adicionar valores
-        for i, (idx, row) in enumerate(df.iterrows()):
-            ax.text(row['total_gasto'] / 1_000 + 2, i, 
-                    f'R$ {row["total_gasto"]/1_000:.1f}K',
-                    va='center', fontsize=9)
+        self._rotular_barras(ax, bars, (df['total_gasto'] / 1_000).map('R$ {:.1f}K'.format), fonte, passo)
         
         plt.tight_layout()
         
         # Salvar
         filename = self.output_dir / 'top_deputados.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"✅ Salvo: {filename}")
+        filename = self._salvar_figura(filename)
         
-        plt.close()
+        return filename
     
-    def plot_resumo_geral(self, df_partido: pd.DataFrame, df_estado: pd.DataFrame) -> None:
+    def plot_evolucao_mensal(self, df_evolucao: pd.DataFrame) -> Path:
+        """
+        Gera gráfico da evolução mensal dos gastos
+        
+        Args:
+            df_evolucao: DataFrame com a evolução mensal (periodo, total_gasto,
+                num_registros), em ordem cronológica
+            
+        Returns:
+            Caminho do arquivo gerado
+        """
+        import matplotlib.pyplot as plt
+        
+        print(f"\n📊 Gerando gráfico: Evolução Mensal dos Gastos...")
+        
+        fig, ax1 = plt.subplots(figsize=(14, 7))
+        posicoes = range(len(df_evolucao))
+        
+        # Total gasto por mês (barras)
+        bars = ax1.bar(posicoes, df_evolucao['total_gasto'] / 1_000_000,
+                       color=self.colors[0], alpha=0.85)
+        ax1.set_ylabel('Total Gasto (Milhões R$)', fontsize=12)
+        ax1.set_xticks(list(posicoes))
+        ax1.set_xticklabels(df_evolucao['periodo'], rotation=45, ha='right', fontsize=9)
+        ax1.set_title('Evolução Mensal dos Gastos', fontsize=14, fontweight='bold')
+        if len(df_evolucao) <= 24:
+            ax1.bar_label(bars, labels=(df_evolucao['total_gasto'] / 1_000_000).map('{:.1f}M'.format),
+                          fontsize=8, padding=2)
+        
+        # Número de registros (linha, eixo secundário)
+        ax2 = ax1.twinx()
+        ax2.plot(list(posicoes), df_evolucao['num_registros'], color=self.colors[3],
+                 marker='o', linewidth=2)
+        ax2.set_ylabel('Número de Registros', fontsize=12)
+        ax2.grid(False)
+        
+        # Eixo a partir de zero, com a linha na metade inferior (abaixo dos rótulos)
+        ax2.set_ylim(0, max(1, df_evolucao['num_registros'].max()) * 2)
+        
+        plt.tight_layout()
+        
+        # Salvar
+        filename = self.output_dir / 'evolucao_mensal.png'
+        filename = self._salvar_figura(filename)
+        
+        return filename
+    
+    def plot_resumo_geral(self, df_partido: pd.DataFrame, df_estado: pd.DataFrame) -> Path:
         """
         Gera gráfico de resumo geral
         
         Args:
             df_partido: DataFrame com análise por partido
             df_estado: DataFrame com análise por estado
+            
+        Returns:
+            Caminho do arquivo gerado
         """
+        import matplotlib.pyplot as plt
+        
         print("\n📊 Gerando gráfico: Resumo Geral...")
         
         # Criar figura com subplots
@@ -277,31 +435,484 @@ class Visualizer:
         
         # Salvar
         filename = self.output_dir / 'resumo_geral.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"✅ Salvo: {filename}")
+        filename = self._salvar_figura(filename)
+        
+        return filename
+    
+    def modelo_barras(self, num_barras: int, xlabel: str, escala: float = 1_000,
+                      formato: str = 'R$ {:.1f}K', altura_base: float = 8) -> 'ModeloGraficoBarras':
+        """
+        Cria um modelo de gráfico de barras para renderizações repetidas
+        
+        Args:
+            num_barras: Número máximo de barras (ex.: top_n)
+            xlabel: Rótulo do eixo x
+            escala: Divisor aplicado aos valores (ex.: 1_000 para mil R$)
+            formato: Formato do rótulo de valor, aplicado ao valor já escalado
+            altura_base: Altura padrão da figura (polegadas)
+            
+        Returns:
+            ModeloGraficoBarras pronto para `renderizar`
+        """
+        return ModeloGraficoBarras(self, num_barras, xlabel, escala, formato, altura_base)
+    
+    def _dimensionar(self, num_barras: int, altura_base: float) -> tuple:
+        """
+        Calcula altura da figura, fonte e espaçamento dos rótulos
+        
+        Gráficos com poucas barras mantêm a altura base, fonte 9 e todos os
+        rótulos. Com muitas barras a altura cresce até ALTURA_MAXIMA e apenas
+        uma barra a cada `passo` recebe rótulos, de modo que o número de
+        textos (que domina o tempo de renderização) fica limitado a
+        MAX_ROTULOS para qualquer top_n.
+        
+        Args:
+            num_barras: Número de barras do gráfico
+            altura_base: Altura padrão da figura (polegadas)
+            
+        Returns:
+            Tupla (altura em polegadas, tamanho da fonte, passo dos rótulos)
+        """
+        altura = min(max(altura_base, num_barras * self.ALTURA_POR_BARRA), self.ALTURA_MAXIMA)
+        passo = max(1, -(-num_barras // self.MAX_ROTULOS))
+        # Pontos disponíveis por rótulo, com folga para o espaçamento entre barras
+        pontos_por_rotulo = altura * 72 * passo / max(num_barras, 1)
+        fonte = max(3.0, min(9.0, pontos_por_rotulo * 0.6))
+        return altura, fonte, passo
+    
+    @staticmethod
+    def _rotular_eixo_y(ax, rotulos: pd.Series, fonte: float, passo: int) -> None:
+        """Define os rótulos do eixo y, um a cada `passo` barras"""
+        posicoes = range(0, len(rotulos), passo)
+        ax.set_yticks(posicoes)
+        ax.set_yticklabels(list(rotulos.iloc[::passo]), fontsize=fonte)
+    
+    @staticmethod
+    def _rotular_barras(ax, barras, rotulos: pd.Series, fonte: float, passo: int) -> list:
+        """
+        Adiciona os rótulos de valor de todas as barras em uma única chamada
+        
+        Returns:
+            Lista com as anotações criadas (uma a cada `passo` barras)
+        """
+        from matplotlib.container import BarContainer
         
-        plt.close()
+        if passo > 1:
+            barras = BarContainer(barras.patches[::passo], datavalues=barras.datavalues[::passo],
+                                  orientation='horizontal')
+            rotulos = rotulos.iloc[::passo]
+        return ax.bar_label(barras, labels=list(rotulos), padding=3, fontsize=fonte)
     
-    def gerar_todos_graficos(self, relatorio: dict) -> None:
+    def _arquivos_do_perfil(self, filename: Path) -> list:
+        """Caminhos de saída do gráfico em cada formato do perfil"""
+        return [filename.with_suffix(f'.{formato}') for formato in self.formatos]
+    
+    def _salvar_figura(self, filename: Path, fig=None) -> Path:
+        """
+        Salva a figura em todos os formatos do perfil
+        
+        Args:
+            filename: Caminho base do arquivo (a extensão é trocada por formato)
+            fig: Figura a salvar, mantida aberta (padrão: figura atual, que é fechada)
+            
+        Returns:
+            Caminho do arquivo PNG (ou do primeiro formato, se não houver PNG)
+        """
+        import matplotlib.pyplot as plt
+        
+        arquivos = self._arquivos_do_perfil(filename)
+        for arquivo in arquivos:
+            (fig or plt).savefig(arquivo, dpi=self.dpi, bbox_inches='tight')
+            print(f"✅ Salvo: {arquivo}")
+        
+        if fig is None:
+            plt.close()
+        
+        return self._arquivo_principal(arquivos)
+    
+    @staticmethod
+    def _arquivo_principal(arquivos: list) -> Path:
+        """Arquivo usado por etapas seguintes (PNG, se houver)"""
+        return next((a for a in arquivos if a.suffix == '.png'), arquivos[0])
+    
+    def _chave_cache(self, metodo: str, args: tuple) -> str:
+        """
+        Calcula a chave de cache de um gráfico
+        
+        A chave combina o conteúdo dos DataFrames de entrada com os
+        parâmetros do gráfico (incluindo valores padrão como top_n),
+        o estilo, o perfil de renderização e a versão dos gráficos.
+        
+        Args:
+            metodo: Nome do método plot_*
+            args: Argumentos posicionais do método
+            
+        Returns:
+            Hash SHA-256 em hexadecimal
+        """
+        parametros = inspect.signature(getattr(self, metodo)).bind(*args)
+        parametros.apply_defaults()
+        
+        h = hashlib.sha256()
+        h.update(repr((metodo, self.ESTILO, self.PALETA, self.dpi, self.formatos,
+                       self.VERSAO_GRAFICOS)).encode())
+        for nome, valor in parametros.arguments.items():
+            h.update(nome.encode())
+            if isinstance(valor, pd.DataFrame):
+                h.update(repr(list(zip(valor.columns, valor.dtypes.astype(str)))).encode())
+                h.update(pd.util.hash_pandas_object(valor, index=True).to_numpy().tobytes())
+            else:
+                h.update(repr(valor).encode())
+        return h.hexdigest()
+    
+    @staticmethod
+    def _vincular_arquivo(origem: Path, destino: Path) -> None:
+        """Cria hard link de origem em destino, copiando se não for possível"""
+        temporario = destino.with_name(destino.name + '.tmp')
+        temporario.unlink(missing_ok=True)
+        try:
+            os.link(origem, temporario)
+        except OSError:
+            shutil.copy2(origem, temporario)
+        os.replace(temporario, destino)
+    
+    def _restaurar_do_cache(self, chave: str, destino: Path) -> bool:
+        """Copia o gráfico do cache para o destino, em todos os formatos do perfil"""
+        arquivos = self._arquivos_do_perfil(destino)
+        origens = [self.cache_dir / f"{chave}{arquivo.suffix}" for arquivo in arquivos]
+        if not all(origem.exists() for origem in origens):
+            return False
+        for origem, arquivo in zip(origens, arquivos):
+            self._vincular_arquivo(origem, arquivo)
+        return True
+    
+    def _guardar_no_cache(self, chave: str, arquivo: Path) -> None:
+        """Guarda o gráfico renderizado no cache, em todos os formatos do perfil"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for renderizado in self._arquivos_do_perfil(arquivo):
+            self._vincular_arquivo(renderizado, self.cache_dir / f"{chave}{renderizado.suffix}")
+    
+    def gerar_todos_graficos(self, relatorio: dict, paralelo: bool = True,
+                             num_processos: Optional[int] = None) -> list:
         """
         Gera todos os gráficos do relatório
         
+        Com `paralelo`, cada gráfico é renderizado em um processo próprio,
+        de modo que a etapa leva aproximadamente o tempo do gráfico mais lento.
+        Gráficos cujas entradas e parâmetros não mudaram desde uma execução
+        anterior são reaproveitados do cache em vez de renderizados.
+        
         Args:
             relatorio: Dicionário com todos os DataFrames de análise
+            paralelo: Renderizar os gráficos em um pool de processos
+            num_processos: Número máximo de processos (padrão: número de CPUs)
+            
+        Returns:
+            Lista com os caminhos dos arquivos gerados, na ordem dos gráficos
         """
         print("\n" + "=" * 70)
         print("📊 GERANDO VISUALIZAÇÕES")
         print("=" * 70)
         
-        self.plot_gastos_partido(relatorio['por_partido'])
-        self.plot_gastos_estado(relatorio['por_estado'])
-        self.plot_tipos_despesa(relatorio['por_tipo_despesa'])
-        self.plot_top_deputados(relatorio['top_deputados'])
-        self.plot_resumo_geral(relatorio['por_partido'], relatorio['por_estado'])
+        graficos = [
+            ('gastos_por_partido.png', 'plot_gastos_partido', (relatorio['por_partido'],)),
+            ('gastos_por_estado.png', 'plot_gastos_estado', (relatorio['por_estado'],)),
+            ('tipos_despesa.png', 'plot_tipos_despesa', (relatorio['por_tipo_despesa'],)),
+            ('top_deputados.png', 'plot_top_deputados', (relatorio['top_deputados'],)),
+            ('resumo_geral.png', 'plot_resumo_geral',
+             (relatorio['por_partido'], relatorio['por_estado'])),
+        ]
+        if 'evolucao_mensal' in relatorio:
+            graficos.append(('evolucao_mensal.png', 'plot_evolucao_mensal',
+                             (relatorio['evolucao_mensal'],)))
+        
+        # Consultar o cache antes de renderizar
+        arquivos = {}
+        pendentes = []
+        for nome, metodo, args in graficos:
+            chave = self._chave_cache(metodo, args) if self.usar_cache else None
+            destino = self.output_dir / nome
+            if chave and self._restaurar_do_cache(chave, destino):
+                print(f"\n♻️  Cache: {nome} reaproveitado")
+                self.estatisticas_cache['acertos'].append(nome)
+                arquivos[nome] = self._arquivo_principal(self._arquivos_do_perfil(destino))
+            else:
+                if chave:
+                    print(f"\n🔄 Cache: {nome} não encontrado, será renderizado")
+                pendentes.append((nome, metodo, args, chave))
+        
+        if paralelo and len(pendentes) > 1:
+            max_workers = min(len(pendentes), num_processos or os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=_CONTEXTO_PROCESSOS) as pool:
+                futuros = [
+                    pool.submit(_renderizar_grafico, str(self.output_dir), self.perfil,
+                                metodo, args)
+                    for _, metodo, args, _ in pendentes
+                ]
+                renderizados = [futuro.result() for futuro in futuros]
+        else:
+            renderizados = [getattr(self, metodo)(*args) for _, metodo, args, _ in pendentes]
+        
+        for (nome, _, _, chave), arquivo in zip(pendentes, renderizados):
+            if chave:
+                self._guardar_no_cache(chave, arquivo)
+                self.estatisticas_cache['falhas'].append(nome)
+            arquivos[nome] = arquivo
         
         print("\n" + "=" * 70)
         print(f"✅ TODAS AS VISUALIZAÇÕES SALVAS EM: {self.output_dir}/")
+        if self.usar_cache:
+            print(f"   Cache: {len(self.estatisticas_cache['acertos'])} reaproveitados, "
+                  f"{len(self.estatisticas_cache['falhas'])} renderizados")
         print("=" * 70)
+        
+        return [arquivos[nome] for nome, _, _ in graficos]
+    
+    def gerar_graficos_por_grupo(self, df_top_grupo: pd.DataFrame, por: str, top_n: int = 15,
+                                 paralelo: bool = True,
+                                 num_processos: Optional[int] = None) -> Path:
+        """
+        Gera um gráfico de top deputados para cada partido ou estado
+        
+        Recebe o resultado de `DataAnalyzer.analisar_top_deputados(por=...)`,
+        calculado numa única passada sobre os dados cruzados, e o divide por
+        grupo sem refiltrar a tabela completa. Os grupos são distribuídos em
+        lotes entre processos; cada processo reaproveita um único
+        ModeloGraficoBarras. Os gráficos ficam em `por_<grupo>/`, junto com
+        um `indice.csv` que relaciona grupo, arquivo e totais.
+        
+        Args:
+            df_top_grupo: Top deputados por grupo (colunas nome_deputado,
+                partido, uf, total_gasto)
+            por: Coluna de agrupamento ('partido' ou 'uf')
+            top_n: Número máximo de deputados por gráfico
+            paralelo: Renderizar os lotes em um pool de processos
+            num_processos: Número máximo de processos (padrão: número de CPUs)
+            
+        Returns:
+            Caminho do arquivo de índice (indice.csv)
+            
+        Raises:
+            ValueError: Se `por` não for 'partido' nem 'uf'
+        """
+        if por not in ('partido', 'uf'):
+            raise ValueError(f"Agrupamento inválido: {por!r} (use 'partido' ou 'uf')")
+        
+        rotulo_grupo = {'partido': 'Partido', 'uf': 'Estado'}[por]
+        print(f"\n📊 Gerando gráficos por {rotulo_grupo.lower()}...")
+        
+        pasta = self.output_dir / f'por_{por}'
+        pasta.mkdir(exist_ok=True)
+        
+        itens = []
+        indice = []
+        for grupo, df in df_top_grupo.groupby(por, sort=True, observed=True):
+            df = df.nlargest(top_n, 'total_gasto')
+            nome = f'por_{por}/top_deputados_{grupo}.png'
+            titulo = f'Top {len(df)} Deputados com Maiores Gastos - {rotulo_grupo} {grupo}'
+            itens.append((titulo, nome, df))
+            indice.append({
+                por: grupo,
+                'num_deputados': len(df),
+                'total_gasto_top': round(df['total_gasto'].sum(), 2),
+            })
+        
+        num_lotes = 1
+        if paralelo and len(itens) > 1:
+            num_lotes = min(len(itens), num_processos or os.cpu_count() or 1)
+        lotes = [itens[i::num_lotes] for i in range(num_lotes)]
+        
+        if num_lotes > 1:
+            with ProcessPoolExecutor(max_workers=num_lotes, mp_context=_CONTEXTO_PROCESSOS) as pool:
+                futuros = [
+                    pool.submit(_renderizar_lote_grupos, str(self.output_dir), self.perfil,
+                                top_n, lote)
+                    for lote in lotes
+                ]
+                resultados = [futuro.result() for futuro in futuros]
+        else:
+            resultados = [self._renderizar_grupos(top_n, lotes[0])]
+        
+        # Desfazer a distribuição em lotes: o item i está no lote i % num_lotes
+        for i, linha in enumerate(indice):
+            arquivo = resultados[i % num_lotes][i // num_lotes]
+            linha['arquivo'] = arquivo.relative_to(self.output_dir).as_posix()
+        
+        arquivo_indice = pasta / 'indice.csv'
+        pd.DataFrame(indice).to_csv(arquivo_indice, index=False, encoding='utf-8-sig')
+        
+        print(f"✅ {len(indice)} gráficos por {rotulo_grupo.lower()} salvos em: {pasta}/")
+        print(f"✅ Índice: {arquivo_indice}")
+        
+        return arquivo_indice
+    
+    def _renderizar_grupos(self, top_n: int, lote: list) -> list:
+        """
+        Renderiza gráficos de top deputados reaproveitando um único modelo
+        
+        Args:
+            top_n: Número de barras do modelo
+            lote: Lista de tuplas (titulo, nome do arquivo, DataFrame do grupo)
+            
+        Returns:
+            Caminhos dos arquivos gerados, na ordem do lote
+        """
+        modelo = self.modelo_barras(top_n, 'Total Gasto (Mil R$)', altura_base=10)
+        arquivos = []
+        for titulo, nome, df in lote:
+            print(f"\n📊 Gerando gráfico: {titulo}...")
+            rotulos = df['nome_deputado'] + '\n(' + df['partido'] + '-' + df['uf'] + ')'
+            arquivos.append(modelo.renderizar(rotulos, df['total_gasto'], titulo, nome))
+        modelo.fechar()
+        return arquivos
+    
+    def gerar_dashboard_html(self, relatorio: dict, nome_arquivo: str = 'dashboard.html',
+                             incluir_plotlyjs: Union[bool, str] = True) -> Path:
+        """
+        Gera um dashboard HTML interativo a partir das tabelas agregadas
+        
+        Apenas as colunas usadas das tabelas agregadas (partido, estado,
+        tipo de despesa e gastos por deputado) são embutidas no arquivo,
+        nunca os registros individuais. Todos os deputados são embutidos
+        (algumas centenas de linhas), não só o top geral, para que os
+        filtros de partido e UF e o top N mostrem o ranking correto. A
+        filtragem (métrica, top N, partido, UF e busca por texto) é feita
+        no navegador.
+        
+        Args:
+            relatorio: Dicionário com todos os DataFrames de análise
+            nome_arquivo: Nome do arquivo HTML gerado
+            incluir_plotlyjs: True embute o plotly.js (arquivo autocontido);
+                'cdn' referencia o plotly.js pela internet
+                
+        Returns:
+            Caminho do arquivo gerado
+        """
+        print("\n📊 Gerando dashboard interativo (HTML)...")
+        
+        colunas = {
+            'por_partido': ['partido', 'total_gasto', 'media_por_deputado', 'num_deputados'],
+            'por_estado': ['uf', 'total_gasto', 'media_por_deputado', 'num_deputados'],
+            'por_tipo_despesa': ['tipo_despesa', 'total_gasto', 'percentual'],
+            'gastos_por_deputado': ['nome_deputado', 'partido', 'uf', 'total_gasto'],
+        }
+        dados = {
+            chave: relatorio[chave][cols].to_dict(orient='records')
+            for chave, cols in colunas.items()
+        }
+        dados['gerado_em'] = datetime.now().strftime('%d/%m/%Y %H:%M')
+        
+        # Evitar que "</" nos dados encerre a tag <script>
+        dados_json = json.dumps(dados, ensure_ascii=False, default=float).replace('</', '<\\/')
+        
+        if incluir_plotlyjs == 'cdn':
+            import plotly
+            script_plotly = (
+                f'<script src="https://cdn.plot.ly/plotly-{plotly.__version__}.min.js"></script>'
+            )
+        else:
+            from plotly.offline import get_plotlyjs
+            script_plotly = f'<script type="text/javascript">{get_plotlyjs()}</script>'
+        
+        html = TEMPLATE_DASHBOARD.read_text(encoding='utf-8')
+        html = html.replace('__PLOTLYJS__', script_plotly).replace('__DADOS__', dados_json)
+        
+        filename = self.output_dir / nome_arquivo
+        filename.write_text(html, encoding='utf-8')
+        
+        print(f"✅ Salvo: {filename}")
+        print(f"   Dados embutidos: {len(dados_json.encode('utf-8')) / 1024:.1f} KB | "
+              f"Arquivo: {filename.stat().st_size / 1024 / 1024:.2f} MB")
+        
+        return filename
+
+
+class ModeloGraficoBarras:
+    """
+    Modelo reutilizável de gráfico de barras horizontais
+    
+    A figura estilizada (eixos, barras, ticks e rótulos de valor) é criada
+    uma única vez; cada chamada de `renderizar` apenas atualiza a largura
+    das barras e os textos dos artistas existentes antes de salvar. Útil
+    para gerar o mesmo gráfico várias vezes (por UF, partido ou ano).
+    """
+    
+    def __init__(self, visualizer: Visualizer, num_barras: int, xlabel: str,
+                 escala: float = 1_000, formato: str = 'R$ {:.1f}K', altura_base: float = 8):
+        """
+        Cria a figura e os artistas do modelo
+        
+        Args:
+            visualizer: Visualizer que define estilo, cores e perfil de saída
+            num_barras: Número máximo de barras por renderização
+            xlabel: Rótulo do eixo x
+            escala: Divisor aplicado aos valores
+            formato: Formato do rótulo de valor, aplicado ao valor já escalado
+            altura_base: Altura padrão da figura (polegadas)
+        """
+        import matplotlib.pyplot as plt
+        
+        self.visualizer = visualizer
+        self.num_barras = num_barras
+        self.escala = escala
+        self.formato = formato
+        
+        altura, self.fonte, self.passo = visualizer._dimensionar(num_barras, altura_base)
+        self.fig, self.ax = plt.subplots(figsize=(14, altura))
+        
+        vazios = pd.Series([''] * num_barras)
+        self.barras = self.ax.barh(range(num_barras), [0] * num_barras, color=visualizer.colors)
+        visualizer._rotular_eixo_y(self.ax, vazios, self.fonte, self.passo)
+        self.ax.set_xlabel(xlabel, fontsize=12)
+        self.ax.invert_yaxis()
+        self.anotacoes = visualizer._rotular_barras(self.ax, self.barras, vazios,
+                                                    self.fonte, self.passo)
+        self.titulo = self.ax.set_title('', fontsize=14, fontweight='bold')
+    
+    def renderizar(self, rotulos: pd.Series, valores: pd.Series, titulo: str,
+                   filename: Union[str, Path]) -> Path:
+        """
+        Atualiza as barras com novos dados e salva o gráfico
+        
+        Com menos valores que `num_barras`, as barras restantes ficam vazias.
+        
+        Args:
+            rotulos: Rótulos do eixo y, na ordem das barras
+            valores: Valores das barras (sem escala), na mesma ordem
+            titulo: Título do gráfico
+            filename: Caminho base do arquivo (relativo ao output_dir do Visualizer)
+            
+        Returns:
+            Caminho do arquivo PNG (ou do primeiro formato, se não houver PNG)
+            
+        Raises:
+            ValueError: Se houver mais valores que barras no modelo
+        """
+        if len(valores) > self.num_barras:
+            raise ValueError(f"O modelo comporta {self.num_barras} barras, "
+                             f"recebeu {len(valores)}")
+        
+        faltantes = self.num_barras - len(valores)
+        larguras = list(pd.Series(valores).to_numpy() / self.escala) + [0.0] * faltantes
+        textos = [self.formato.format(v) for v in larguras[:len(valores)]] + [''] * faltantes
+        nomes = list(rotulos) + [''] * faltantes
+        
+        for barra, largura in zip(self.barras.patches, larguras):
+            barra.set_width(largura)
+        for anotacao, indice in zip(self.anotacoes, range(0, self.num_barras, self.passo)):
+            anotacao.xy = (larguras[indice], anotacao.xy[1])
+            anotacao.set_text(textos[indice])
+        self.ax.set_yticklabels(nomes[::self.passo], fontsize=self.fonte)
+        self.ax.set_xlim(0, max(max(larguras), 1e-9) * 1.15)
+        self.titulo.set_text(titulo)
+        
+        return self.visualizer._salvar_figura(self.visualizer.output_dir / filename, fig=self.fig)
+    
+    def fechar(self) -> None:
+        """Fecha a figura do modelo"""
+        import matplotlib.pyplot as plt
+        
+        plt.close(self.fig)
 
 
 if __name__ == '__main__':
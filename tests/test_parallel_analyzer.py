@@ -0,0 +1,121 @@
+"""
+Backend de processos x backend serial do DataAnalyzer
+
+As análises agregadas devem ter o mesmo resultado nos dois backends,
+inclusive em subconjuntos filtrados e com chaves ausentes.
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from data_analyzer import DataAnalyzer
+from parallel_analyzer import ExecutorParalelo, _k_esimo
+
+# (método, argumentos, colunas que identificam uma linha)
+ANALISES = [
+    ('analisar_por_partido', {}, ['partido']),
+    ('analisar_por_estado', {}, ['uf']),
+    ('analisar_tipos_despesa', {}, ['tipo_despesa']),
+    ('analisar_top_deputados', {'top_n': None}, ['nome_deputado']),
+    ('analisar_top_deputados', {'top_n': 3, 'por': 'uf'}, ['nome_deputado']),
+]
+
+
+def gerar_despesas(semente: int = 0, n: int = 5_000) -> tuple:
+    """Despesas e cadastro pequenos, com nomes sem cadastro e tipos ausentes"""
+    rng = np.random.default_rng(semente)
+    nomes = [f'DEPUTADO {i:02d}' for i in range(40)]
+    cadastro = pd.DataFrame({
+        'nome': nomes[:35],
+        'siglaPartido': rng.choice(['PT', 'PL', 'MDB', 'PSD'], 35),
+        'siglaUf': rng.choice(['SP', 'RJ', 'MG'], 35),
+    })
+    cadastro.loc[3, 'siglaPartido'] = None
+    tipos = np.array(['PASSAGEM', 'TELEFONIA', 'COMBUSTÍVEIS', None], dtype=object)
+    despesas = pd.DataFrame({
+        'nome_deputado': rng.choice(nomes, n),
+        'tipo_despesa': tipos[rng.choice(4, n, p=[0.4, 0.3, 0.29, 0.01])],
+        # Centavos inteiros: valores repetidos e grupos com número par de registros
+        'valor': rng.integers(1, 500_00, n) / 100,
+    })
+    return despesas, cadastro
+
+
+@pytest.fixture(scope='module')
+def executor():
+    executor = ExecutorParalelo(num_processos=3)
+    yield executor
+    executor.encerrar()
+
+
+def analisadores(executor, **filtros) -> tuple:
+    """Analisador serial e analisador de processos sobre os mesmos dados"""
+    despesas, cadastro = gerar_despesas()
+    with contextlib.redirect_stdout(io.StringIO()):
+        serial = DataAnalyzer(despesas, cadastro)
+        paralelo = DataAnalyzer(despesas, cadastro, backend='processos')
+        paralelo._executor = executor
+        paralelo._dono_executor = False
+        if filtros:
+            serial = serial.filtrar(**filtros)
+            paralelo = paralelo.filtrar(**filtros)
+    return serial, paralelo
+
+
+def comparar(serial: pd.DataFrame, paralelo: pd.DataFrame, chaves: list):
+    """Mesmas linhas e valores, independentemente da ordem dos grupos"""
+    assert list(serial.columns) == list(paralelo.columns)
+    pdt.assert_frame_equal(
+        serial.sort_values(chaves, ignore_index=True),
+        paralelo.sort_values(chaves, ignore_index=True),
+        check_dtype=False,
+    )
+
+
+@pytest.mark.parametrize('metodo, argumentos, chaves', ANALISES)
+def test_backends_equivalentes(executor, metodo, argumentos, chaves):
+    serial, paralelo = analisadores(executor)
+    with contextlib.redirect_stdout(io.StringIO()):
+        comparar(getattr(serial, metodo)(**argumentos),
+                 getattr(paralelo, metodo)(**argumentos), chaves)
+
+
+@pytest.mark.parametrize('metodo, argumentos, chaves', ANALISES)
+def test_backends_equivalentes_filtrados(executor, metodo, argumentos, chaves):
+    serial, paralelo = analisadores(executor, uf=['SP', 'RJ'], tipo_despesa=['TELEFONIA'])
+    with contextlib.redirect_stdout(io.StringIO()):
+        comparar(getattr(serial, metodo)(**argumentos),
+                 getattr(paralelo, metodo)(**argumentos), chaves)
+
+
+def test_agregar_chave_textual_e_mediana_par(executor):
+    df = pd.DataFrame({
+        'grupo': ['b', 'a', 'b', 'a', 'b', None, 'b'],
+        'nome_deputado': ['x', 'y', 'x', 'x', 'z', 'x', 'y'],
+        'valor': [4.0, 1.0, 2.0, 3.0, 8.0, 100.0, 6.0],
+    })
+    resultado = executor.agregar(df, ['grupo'], media=True, mediana=True, deputados=True)
+    esperado = pd.DataFrame({
+        'total_gasto': [4.0, 20.0],
+        'gasto_medio': [2.0, 5.0],
+        'gasto_mediano': [2.0, 5.0],
+        'num_registros': [2, 4],
+        'num_deputados': [2, 3],
+    }, index=pd.Index(['a', 'b'], name='grupo'))
+    pdt.assert_frame_equal(resultado, esperado, check_dtype=False)
+
+
+def test_k_esimo_uniao_de_sequencias():
+    rng = np.random.default_rng(1)
+    sequencias = [np.sort(rng.integers(0, 20, tamanho).astype(float)) for tamanho in (0, 7, 12, 1)]
+    uniao = np.sort(np.concatenate(sequencias))
+    assert [_k_esimo(sequencias, k) for k in range(len(uniao))] == uniao.tolist()